@@ -0,0 +1,36 @@
+"""Admin stats snapshot table
+
+Revision ID: 0002_admin_stats_snapshot
+Revises: 0001_initial
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0002_admin_stats_snapshot'
+down_revision: Union[str, Sequence[str], None] = '0001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'admin_stats_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('total_users', sa.Integer(), nullable=False),
+        sa.Column('total_doctors', sa.Integer(), nullable=False),
+        sa.Column('total_bookings', sa.Integer(), nullable=False),
+        sa.Column('today_bookings', sa.Integer(), nullable=False),
+        sa.Column('pending_bookings', sa.Integer(), nullable=False),
+        sa.Column('completed_bookings', sa.Integer(), nullable=False),
+        sa.Column('total_emrs', sa.Integer(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('admin_stats_snapshots')
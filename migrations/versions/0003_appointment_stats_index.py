@@ -0,0 +1,28 @@
+"""Covering index for doctor appointment stats
+
+Revision ID: 0003_appointment_stats_index
+Revises: 0002_admin_stats_snapshot
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '0003_appointment_stats_index'
+down_revision: Union[str, Sequence[str], None] = '0002_admin_stats_snapshot'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_appointments_doctor_datetime_status',
+        'appointments',
+        ['doctor_id', 'date_time', 'status'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_appointments_doctor_datetime_status', table_name='appointments')
@@ -0,0 +1,100 @@
+"""Appointment time ranges with a no-overlap exclusion constraint
+
+Revision ID: 0004_appointment_no_overlap
+Revises: 0003_appointment_stats_index
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '0004_appointment_no_overlap'
+down_revision: Union[str, Sequence[str], None] = '0003_appointment_stats_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_STATUSES = "('scheduled', 'confirmed', 'in_progress')"
+
+# Pairs of active appointments of one doctor whose time ranges overlap; the
+# old check-then-insert booking and the start-time-only unique index let these in.
+OVERLAPPING_PAIRS = f"""
+    SELECT a.doctor_id, a.id AS first_id, b.id AS second_id
+    FROM appointments a
+    JOIN appointments b
+      ON b.doctor_id = a.doctor_id
+     AND b.id > a.id
+     AND b.time_range && a.time_range
+    WHERE a.status IN {ACTIVE_STATUSES} AND b.status IN {ACTIVE_STATUSES}
+    ORDER BY a.doctor_id, a.id, b.id
+    LIMIT 50
+"""
+
+
+def _fail_on_overlapping_appointments() -> None:
+    """Abort with the offending ids instead of a bare constraint violation."""
+    pairs = op.get_bind().execute(sa.text(OVERLAPPING_PAIRS)).all()
+    if not pairs:
+        return
+    listed = ", ".join(f"doctor {row.doctor_id}: {row.first_id} & {row.second_id}" for row in pairs)
+    raise RuntimeError(
+        "Cannot add ex_appointments_doctor_no_overlap: active appointments overlap "
+        f"({listed}{', ...' if len(pairs) == 50 else ''}). Cancel or reschedule one "
+        "appointment of each pair, then re-run the migration."
+    )
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column('appointments', sa.Column('time_range', postgresql.TSTZRANGE(), nullable=True))
+
+    # timestamptz + interval is only STABLE, so the range cannot be a generated
+    # column; a trigger keeps it in sync with date_time/duration_minutes instead.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION appointments_set_time_range() RETURNS trigger AS $$
+        BEGIN
+            NEW.time_range := tstzrange(
+                NEW.date_time,
+                NEW.date_time + make_interval(mins => NEW.duration_minutes),
+                '[)'
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_appointments_time_range
+        BEFORE INSERT OR UPDATE OF date_time, duration_minutes ON appointments
+        FOR EACH ROW EXECUTE FUNCTION appointments_set_time_range()
+    """)
+    op.execute("""
+        UPDATE appointments
+        SET time_range = tstzrange(
+            date_time, date_time + make_interval(mins => duration_minutes), '[)'
+        )
+    """)
+    op.alter_column('appointments', 'time_range', nullable=False)
+
+    _fail_on_overlapping_appointments()
+    op.drop_index('ix_appointments_doctor_datetime_active', table_name='appointments')
+    op.execute(f"""
+        ALTER TABLE appointments
+        ADD CONSTRAINT ex_appointments_doctor_no_overlap
+        EXCLUDE USING gist (doctor_id WITH =, time_range WITH &&)
+        WHERE (status IN {ACTIVE_STATUSES})
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE appointments DROP CONSTRAINT ex_appointments_doctor_no_overlap")
+    op.execute("""
+        CREATE UNIQUE INDEX ix_appointments_doctor_datetime_active
+        ON appointments (doctor_id, date_time)
+        WHERE status IN ('scheduled', 'confirmed')
+    """)
+    op.execute("DROP TRIGGER trg_appointments_time_range ON appointments")
+    op.execute("DROP FUNCTION appointments_set_time_range()")
+    op.drop_column('appointments', 'time_range')
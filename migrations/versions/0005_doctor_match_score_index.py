@@ -0,0 +1,35 @@
+"""Index for SQL-side triage doctor ranking
+
+Revision ID: 0005_doctor_match_score_index
+Revises: 0004_appointment_no_overlap
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = '0005_doctor_match_score_index'
+down_revision: Union[str, Sequence[str], None] = '0004_appointment_no_overlap'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Must stay identical to DOCTOR_MATCH_SCORE in the Doctor model
+    op.create_index(
+        'ix_doctors_specialization_match_score',
+        'doctors',
+        [
+            'specialization_id',
+            'status',
+            sa.text('(rating * 10 + least(experience_years * 2, 20)) DESC'),
+            'id',
+        ],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_doctors_specialization_match_score', table_name='doctors')
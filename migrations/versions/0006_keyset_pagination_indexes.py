@@ -0,0 +1,35 @@
+"""Indexes for keyset pagination of patient appointments and doctor records
+
+Revision ID: 0006_keyset_pagination_indexes
+Revises: 0005_doctor_match_score_index
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '0006_keyset_pagination_indexes'
+down_revision: Union[str, Sequence[str], None] = '0005_doctor_match_score_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_appointments_patient_datetime',
+        'appointments',
+        ['patient_id', 'date_time', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_medical_records_doctor_created',
+        'medical_records',
+        ['doctor_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_medical_records_doctor_created', table_name='medical_records')
+    op.drop_index('ix_appointments_patient_datetime', table_name='appointments')
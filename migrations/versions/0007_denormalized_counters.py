@@ -0,0 +1,174 @@
+"""Denormalized counters for specializations, doctors and chat sessions
+
+Revision ID: 0007_denormalized_counters
+Revises: 0006_keyset_pagination_indexes
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0007_denormalized_counters'
+down_revision: Union[str, Sequence[str], None] = '0006_keyset_pagination_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = {
+    'specializations': ['doctors_count', 'approved_doctors_count'],
+    'doctors': ['appointments_count', 'patients_count'],
+    'chat_sessions': ['message_count', 'token_input_total', 'token_output_total'],
+}
+
+
+def upgrade() -> None:
+    for table, columns in COUNTER_COLUMNS.items():
+        for column in columns:
+            op.add_column(table, sa.Column(column, sa.Integer(), nullable=False, server_default='0'))
+
+    # Counters are kept in sync by row triggers in the writing transaction, so
+    # cascaded deletes and every status-changing code path are covered too.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION doctors_update_specialization_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE specializations
+                SET doctors_count = doctors_count - 1,
+                    approved_doctors_count = approved_doctors_count
+                        - (OLD.status = 'approved')::int
+                WHERE id = OLD.specialization_id;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                UPDATE specializations
+                SET doctors_count = doctors_count + 1,
+                    approved_doctors_count = approved_doctors_count
+                        + (NEW.status = 'approved')::int
+                WHERE id = NEW.specialization_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_doctors_specialization_counts
+        AFTER INSERT OR DELETE OR UPDATE OF status, specialization_id ON doctors
+        FOR EACH ROW EXECUTE FUNCTION doctors_update_specialization_counts()
+    """)
+
+    # The doctor row is updated (and locked) before the patient check, so two
+    # concurrent first bookings of the same patient cannot both count them.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION appointments_update_doctor_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND OLD.doctor_id = NEW.doctor_id
+                    AND OLD.patient_id = NEW.patient_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE doctors SET appointments_count = appointments_count - 1
+                WHERE id = OLD.doctor_id;
+                IF NOT EXISTS (
+                    SELECT 1 FROM appointments
+                    WHERE doctor_id = OLD.doctor_id AND patient_id = OLD.patient_id
+                ) THEN
+                    UPDATE doctors SET patients_count = patients_count - 1
+                    WHERE id = OLD.doctor_id;
+                END IF;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                UPDATE doctors SET appointments_count = appointments_count + 1
+                WHERE id = NEW.doctor_id;
+                IF NOT EXISTS (
+                    SELECT 1 FROM appointments
+                    WHERE doctor_id = NEW.doctor_id AND patient_id = NEW.patient_id
+                      AND id <> NEW.id
+                ) THEN
+                    UPDATE doctors SET patients_count = patients_count + 1
+                    WHERE id = NEW.doctor_id;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_appointments_doctor_counts
+        AFTER INSERT OR DELETE OR UPDATE OF doctor_id, patient_id ON appointments
+        FOR EACH ROW EXECUTE FUNCTION appointments_update_doctor_counts()
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION chat_messages_update_session_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE chat_sessions
+                SET message_count = message_count - 1,
+                    token_input_total = token_input_total - coalesce(OLD.token_input, 0),
+                    token_output_total = token_output_total - coalesce(OLD.token_output, 0)
+                WHERE id = OLD.session_id;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                UPDATE chat_sessions
+                SET message_count = message_count + 1,
+                    token_input_total = token_input_total + coalesce(NEW.token_input, 0),
+                    token_output_total = token_output_total + coalesce(NEW.token_output, 0)
+                WHERE id = NEW.session_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_chat_messages_session_counts
+        AFTER INSERT OR DELETE OR UPDATE OF session_id, token_input, token_output ON chat_messages
+        FOR EACH ROW EXECUTE FUNCTION chat_messages_update_session_counts()
+    """)
+
+    op.execute("""
+        UPDATE specializations s
+        SET doctors_count = c.total, approved_doctors_count = c.approved
+        FROM (
+            SELECT specialization_id,
+                   count(*) AS total,
+                   count(*) FILTER (WHERE status = 'approved') AS approved
+            FROM doctors GROUP BY specialization_id
+        ) c
+        WHERE s.id = c.specialization_id
+    """)
+    op.execute("""
+        UPDATE doctors d
+        SET appointments_count = c.total, patients_count = c.patients
+        FROM (
+            SELECT doctor_id, count(*) AS total, count(DISTINCT patient_id) AS patients
+            FROM appointments GROUP BY doctor_id
+        ) c
+        WHERE d.id = c.doctor_id
+    """)
+    op.execute("""
+        UPDATE chat_sessions s
+        SET message_count = c.total,
+            token_input_total = c.token_input,
+            token_output_total = c.token_output
+        FROM (
+            SELECT session_id,
+                   count(*) AS total,
+                   coalesce(sum(token_input), 0) AS token_input,
+                   coalesce(sum(token_output), 0) AS token_output
+            FROM chat_messages GROUP BY session_id
+        ) c
+        WHERE s.id = c.session_id
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER trg_chat_messages_session_counts ON chat_messages")
+    op.execute("DROP FUNCTION chat_messages_update_session_counts()")
+    op.execute("DROP TRIGGER trg_appointments_doctor_counts ON appointments")
+    op.execute("DROP FUNCTION appointments_update_doctor_counts()")
+    op.execute("DROP TRIGGER trg_doctors_specialization_counts ON doctors")
+    op.execute("DROP FUNCTION doctors_update_specialization_counts()")
+
+    for table, columns in COUNTER_COLUMNS.items():
+        for column in reversed(columns):
+            op.drop_column(table, column)
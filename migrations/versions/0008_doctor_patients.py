@@ -0,0 +1,109 @@
+"""Doctor-patient summary read model
+
+Revision ID: 0008_doctor_patients
+Revises: 0007_denormalized_counters
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0008_doctor_patients'
+down_revision: Union[str, Sequence[str], None] = '0007_denormalized_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PAIR_SUMMARY = """
+    SELECT doctor_id,
+           patient_id,
+           count(*) AS total_appointments,
+           max(date_time) AS last_appointment_date,
+           count(*) FILTER (
+               WHERE date_time >= now() AND status IN ('scheduled', 'confirmed')
+           ) AS upcoming_appointments
+    FROM appointments
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'doctor_patients',
+        sa.Column('doctor_id', sa.Integer(), nullable=False),
+        sa.Column('patient_id', sa.Integer(), nullable=False),
+        sa.Column('total_appointments', sa.Integer(), nullable=False),
+        sa.Column('last_appointment_date', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('upcoming_appointments', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['patient_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('doctor_id', 'patient_id')
+    )
+    op.create_index(
+        'ix_doctor_patients_doctor_last_date',
+        'doctor_patients',
+        ['doctor_id', sa.text('last_appointment_date DESC'), sa.text('patient_id DESC')],
+        unique=False,
+    )
+
+    # A pair's row is recomputed from that pair's appointments (a handful of
+    # rows via ix_appointments_doctor_datetime_status) and dropped when none remain.
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION doctor_patients_refresh(p_doctor_id int, p_patient_id int)
+        RETURNS void AS $$
+        BEGIN
+            INSERT INTO doctor_patients (
+                doctor_id, patient_id, total_appointments,
+                last_appointment_date, upcoming_appointments
+            )
+            {PAIR_SUMMARY}
+            WHERE doctor_id = p_doctor_id AND patient_id = p_patient_id
+            GROUP BY doctor_id, patient_id
+            ON CONFLICT (doctor_id, patient_id) DO UPDATE
+            SET total_appointments = EXCLUDED.total_appointments,
+                last_appointment_date = EXCLUDED.last_appointment_date,
+                upcoming_appointments = EXCLUDED.upcoming_appointments;
+
+            IF NOT FOUND THEN
+                DELETE FROM doctor_patients
+                WHERE doctor_id = p_doctor_id AND patient_id = p_patient_id;
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION appointments_refresh_doctor_patients() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND (
+                    OLD.doctor_id <> NEW.doctor_id OR OLD.patient_id <> NEW.patient_id)) THEN
+                PERFORM doctor_patients_refresh(OLD.doctor_id, OLD.patient_id);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM doctor_patients_refresh(NEW.doctor_id, NEW.patient_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_appointments_doctor_patients
+        AFTER INSERT OR DELETE OR UPDATE OF doctor_id, patient_id, date_time, status ON appointments
+        FOR EACH ROW EXECUTE FUNCTION appointments_refresh_doctor_patients()
+    """)
+
+    op.execute(f"""
+        INSERT INTO doctor_patients (
+            doctor_id, patient_id, total_appointments,
+            last_appointment_date, upcoming_appointments
+        )
+        {PAIR_SUMMARY}
+        GROUP BY doctor_id, patient_id
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER trg_appointments_doctor_patients ON appointments")
+    op.execute("DROP FUNCTION appointments_refresh_doctor_patients()")
+    op.execute("DROP FUNCTION doctor_patients_refresh(int, int)")
+    op.drop_index('ix_doctor_patients_doctor_last_date', table_name='doctor_patients')
+    op.drop_table('doctor_patients')
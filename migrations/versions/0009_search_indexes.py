@@ -0,0 +1,64 @@
+"""Trigram and full-text search indexes
+
+Revision ID: 0009_search_indexes
+Revises: 0008_doctor_patients
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '0009_search_indexes'
+down_revision: Union[str, Sequence[str], None] = '0008_doctor_patients'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_COLUMNS = ['full_name', 'email', 'phone']
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(diagnosis, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(prescription, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # GIN trigram indexes serve both ILIKE '%term%' and the % similarity operator
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'ix_users_{column}_trgm',
+            'users',
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+    op.add_column(
+        'medical_records',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_medical_records_search_vector',
+        'medical_records',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_medical_records_search_vector', table_name='medical_records')
+    op.drop_column('medical_records', 'search_vector')
+    for column in reversed(TRIGRAM_COLUMNS):
+        op.drop_index(f'ix_users_{column}_trgm', table_name='users')
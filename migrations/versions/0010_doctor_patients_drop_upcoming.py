@@ -0,0 +1,104 @@
+"""Compute upcoming appointments at read time instead of storing them
+
+Revision ID: 0010_doctor_patients_drop_upcoming
+Revises: 0009_search_indexes
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0010_doctor_patients_drop_upcoming'
+down_revision: Union[str, Sequence[str], None] = '0009_search_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPCOMING_COUNT = """
+    count(*) FILTER (
+        WHERE date_time >= now() AND status IN ('scheduled', 'confirmed')
+    )
+"""
+
+
+def upgrade() -> None:
+    # upcoming_appointments went stale as time passed; it is now counted per page
+    # row when "My patients" is read, so status changes no longer fire the trigger.
+    op.execute("DROP TRIGGER trg_appointments_doctor_patients ON appointments")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION doctor_patients_refresh(p_doctor_id int, p_patient_id int)
+        RETURNS void AS $$
+        BEGIN
+            INSERT INTO doctor_patients (
+                doctor_id, patient_id, total_appointments, last_appointment_date
+            )
+            SELECT doctor_id, patient_id, count(*), max(date_time)
+            FROM appointments
+            WHERE doctor_id = p_doctor_id AND patient_id = p_patient_id
+            GROUP BY doctor_id, patient_id
+            ON CONFLICT (doctor_id, patient_id) DO UPDATE
+            SET total_appointments = EXCLUDED.total_appointments,
+                last_appointment_date = EXCLUDED.last_appointment_date;
+
+            IF NOT FOUND THEN
+                DELETE FROM doctor_patients
+                WHERE doctor_id = p_doctor_id AND patient_id = p_patient_id;
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.drop_column('doctor_patients', 'upcoming_appointments')
+    op.execute("""
+        CREATE TRIGGER trg_appointments_doctor_patients
+        AFTER INSERT OR DELETE OR UPDATE OF doctor_id, patient_id, date_time ON appointments
+        FOR EACH ROW EXECUTE FUNCTION appointments_refresh_doctor_patients()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER trg_appointments_doctor_patients ON appointments")
+    op.add_column(
+        'doctor_patients',
+        sa.Column('upcoming_appointments', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.alter_column('doctor_patients', 'upcoming_appointments', server_default=None)
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION doctor_patients_refresh(p_doctor_id int, p_patient_id int)
+        RETURNS void AS $$
+        BEGIN
+            INSERT INTO doctor_patients (
+                doctor_id, patient_id, total_appointments,
+                last_appointment_date, upcoming_appointments
+            )
+            SELECT doctor_id, patient_id, count(*), max(date_time), {UPCOMING_COUNT}
+            FROM appointments
+            WHERE doctor_id = p_doctor_id AND patient_id = p_patient_id
+            GROUP BY doctor_id, patient_id
+            ON CONFLICT (doctor_id, patient_id) DO UPDATE
+            SET total_appointments = EXCLUDED.total_appointments,
+                last_appointment_date = EXCLUDED.last_appointment_date,
+                upcoming_appointments = EXCLUDED.upcoming_appointments;
+
+            IF NOT FOUND THEN
+                DELETE FROM doctor_patients
+                WHERE doctor_id = p_doctor_id AND patient_id = p_patient_id;
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+        UPDATE doctor_patients dp
+        SET upcoming_appointments = c.upcoming
+        FROM (
+            SELECT doctor_id, patient_id, {UPCOMING_COUNT} AS upcoming
+            FROM appointments
+            GROUP BY doctor_id, patient_id
+        ) c
+        WHERE dp.doctor_id = c.doctor_id AND dp.patient_id = c.patient_id
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_appointments_doctor_patients
+        AFTER INSERT OR DELETE OR UPDATE OF doctor_id, patient_id, date_time, status ON appointments
+        FOR EACH ROW EXECUTE FUNCTION appointments_refresh_doctor_patients()
+    """)
@@ -0,0 +1,36 @@
+"""Separate cached content token counts from LLM API usage on chat messages
+
+Revision ID: 0011_chat_message_content_tokens
+Revises: 0010_doctor_patients_drop_upcoming
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0011_chat_message_content_tokens'
+down_revision: Union[str, Sequence[str], None] = '0010_doctor_patients_drop_upcoming'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('chat_messages', sa.Column('content_tokens', sa.Integer(), nullable=True))
+
+    # Replies saved from an API call always carry latency_ms, so token counts on
+    # rows without it were cached by the context builder. Move them over; the
+    # session counter trigger subtracts them from the usage totals.
+    op.execute("""
+        UPDATE chat_messages
+        SET content_tokens = coalesce(token_output, token_input),
+            token_input = NULL,
+            token_output = NULL
+        WHERE latency_ms IS NULL
+          AND (token_input IS NOT NULL OR token_output IS NOT NULL)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('chat_messages', 'content_tokens')
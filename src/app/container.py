@@ -1,10 +1,18 @@
 from dependency_injector import containers, providers
 
 from src.app.settings import Settings
+from src.infrastructure.cache.connection import create_redis_connection
+from src.infrastructure.cache.doctor_roster import DoctorRosterCache
+from src.infrastructure.cache.identity import IdentityCache
+from src.infrastructure.holds.stores import create_slot_hold_store
 from src.infrastructure.database.core import create_engine, create_session_factory
+from src.infrastructure.jobs.queue import create_job_queue
 from src.infrastructure.services.jwt_service import JWTService
 from src.infrastructure.services.openai_service import OpenAIService
+from src.infrastructure.services.stub_llm_service import StubLLMService
 from src.infrastructure.services.password_service import PasswordService
+from src.infrastructure.services.token_counter import TokenCounter
+from src.use_cases.triage.scoring import DoctorScoringEngine
 
 
 class AppContainer(containers.DeclarativeContainer):
@@ -19,7 +27,13 @@ class AppContainer(containers.DeclarativeContainer):
     engine = providers.Singleton(
         create_engine,
         db_url=settings.provided.db_url,
-        echo=False
+        echo=False,
+        use_pool=settings.provided.DB_USE_POOL,
+        pool_size=settings.provided.DB_POOL_SIZE,
+        max_overflow=settings.provided.DB_MAX_OVERFLOW,
+        pool_timeout=settings.provided.DB_POOL_TIMEOUT,
+        pool_recycle=settings.provided.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.provided.DB_POOL_PRE_PING,
     )
 
     session_factory = providers.Singleton(
@@ -27,15 +41,76 @@ class AppContainer(containers.DeclarativeContainer):
         engine=engine
     )
 
+    redis = providers.Singleton(
+        create_redis_connection,
+        url=settings.provided.REDIS_URL,
+    )
+
+    doctor_roster_cache = providers.Singleton(
+        DoctorRosterCache,
+        redis=redis,
+        ttl_seconds=settings.provided.DOCTOR_ROSTER_CACHE_TTL_SECONDS,
+    )
+
+    identity_cache = providers.Singleton(
+        IdentityCache,
+        redis=redis,
+        ttl_seconds=settings.provided.IDENTITY_CACHE_TTL_SECONDS,
+        max_local_entries=settings.provided.IDENTITY_CACHE_MAX_ENTRIES,
+    )
+
+    slot_hold_store = providers.Singleton(
+        create_slot_hold_store,
+        redis=redis,
+    )
+
+    job_queue = providers.Singleton(
+        create_job_queue,
+        broker=settings.provided.JOB_BROKER,
+        redis=redis,
+        rabbitmq_url=settings.provided.rabbitmq_url,
+        queue_name=settings.provided.JOB_QUEUE_NAME,
+        visibility_timeout_seconds=settings.provided.JOB_VISIBILITY_TIMEOUT_SECONDS,
+    )
+
     jwt_service = providers.Singleton(
         JWTService,
         jwt_access_secret_key=settings.provided.JWT_ACCESS_TOKEN_SECRET_KEY,
         jwt_refresh_secret_key=settings.provided.JWT_REFRESH_TOKEN_SECRET_KEY,
     )
 
-    password_service = providers.Singleton(PasswordService)
+    password_service = providers.Singleton(
+        PasswordService,
+        rounds=settings.provided.PASSWORD_HASH_ROUNDS,
+        max_workers=settings.provided.PASSWORD_HASH_MAX_WORKERS,
+    )
+
+    token_counter = providers.Singleton(TokenCounter)
+
+    doctor_scoring_engine = providers.Singleton(
+        DoctorScoringEngine,
+        max_age_seconds=settings.provided.TRIAGE_SCORING_MAX_AGE_SECONDS,
+        horizon_days=settings.provided.TRIAGE_SCORING_HORIZON_DAYS,
+    )
 
-    openai_service = providers.Factory(
-        OpenAIService,
-        api_key=settings.provided.OPENAI_API_KEY
+    llm_provider = providers.Selector(
+        settings.provided.LLM_PROVIDER,
+        openai=providers.Singleton(
+            OpenAIService,
+            api_key=settings.provided.OPENAI_API_KEY,
+            model=settings.provided.OPENAI_MODEL,
+            base_url=settings.provided.OPENAI_BASE_URL,
+            max_connections=settings.provided.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.provided.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.provided.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+            connect_timeout=settings.provided.OPENAI_CONNECT_TIMEOUT_SECONDS,
+            read_timeout=settings.provided.OPENAI_READ_TIMEOUT_SECONDS,
+            max_retries=settings.provided.OPENAI_MAX_RETRIES,
+        ),
+        stub=providers.Singleton(
+            StubLLMService,
+            first_token_latency_ms=settings.provided.STUB_LLM_LATENCY_MS,
+            tokens_per_second=settings.provided.STUB_LLM_TOKENS_PER_SECOND,
+            recommendation=settings.provided.stub_llm_recommendation,
+        ),
     )
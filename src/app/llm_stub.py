@@ -0,0 +1,124 @@
+"""
+OpenAI-compatible stand-in server backed by StubLLMService.
+
+    python -m src.app.llm_stub --port 8090 --latency-ms 300 --tokens-per-second 50
+
+Point the API at it with LLM_PROVIDER=openai and OPENAI_BASE_URL=http://localhost:8090/v1
+to measure the full HTTP path (client pool, SSE parsing) without a paid model.
+"""
+import argparse
+import json
+import time
+import uuid
+from typing import AsyncGenerator
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from src.infrastructure.services.stub_llm_service import StubLLMService
+
+
+def create_stub_app(stub: StubLLMService) -> FastAPI:
+    app = FastAPI(title="LLM stub")
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": stub.model, "object": "model", "owned_by": "stub"}]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        messages = body.get("messages", [])
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+
+        if (body.get("response_format") or {}).get("type") == "json_object":
+            last_user = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+            content = json.dumps(stub.analysis_for(last_user))
+        else:
+            content = stub.reply_for(messages)
+
+        prompt_tokens = stub.count_prompt_tokens(messages)
+
+        if body.get("stream"):
+            include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+            return StreamingResponse(
+                _stream_chunks(stub, content, completion_id, created, prompt_tokens, include_usage),
+                media_type="text/event-stream",
+            )
+
+        tokens = [token async for token in stub.paced_tokens(content)]
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": stub.model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "".join(tokens)},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(tokens),
+                "total_tokens": prompt_tokens + len(tokens),
+            },
+        }
+
+    return app
+
+
+async def _stream_chunks(
+        stub: StubLLMService,
+        content: str,
+        completion_id: str,
+        created: int,
+        prompt_tokens: int,
+        include_usage: bool,
+) -> AsyncGenerator[str, None]:
+    def chunk(choices: list, **extra) -> str:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": stub.model,
+            "choices": choices,
+            **extra,
+        }
+        return f"data: {json.dumps(payload)}\n\n"
+
+    completion_tokens = 0
+    async for token in stub.paced_tokens(content):
+        completion_tokens += 1
+        yield chunk([{"index": 0, "delta": {"content": token}, "finish_reason": None}])
+    yield chunk([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+
+    if include_usage:
+        yield chunk([], usage={
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        })
+    yield "data: [DONE]\n\n"
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI-compatible LLM stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=int, default=300, help="Time to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--recommendation-json", default=None, help="Canned recommendation block")
+    args = parser.parse_args()
+
+    stub = StubLLMService(
+        first_token_latency_ms=args.latency_ms,
+        tokens_per_second=args.tokens_per_second,
+        recommendation=json.loads(args.recommendation_json) if args.recommendation_json else None,
+    )
+    uvicorn.run(create_stub_app(stub), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    _main()
@@ -1,3 +1,6 @@
+import asyncio
+import inspect
+
 from authlib.integrations.starlette_client import OAuth
 from fastapi import FastAPI, APIRouter, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -7,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.middleware.sessions import SessionMiddleware
 
 from src.app.container import AppContainer
+from src.app.worker import run_scoring_refresher, run_worker
 from src.domain.errors import BaseError
 from src.presentation.api.admin.doctors import router as admin_doctors_router
 from src.presentation.api.admin.stats import router as admin_stats_router
@@ -16,10 +20,15 @@ from src.presentation.api.routers.chat import router as chat_router
 from src.presentation.api.routers.doctors import router as doctors_router
 from src.presentation.api.routers.medical_records import router as medical_records_router
 from src.presentation.api.routers.schedules import router as schedules_router
+from src.presentation.api.routers.search import router as search_router
 from src.presentation.api.routers.specializations import router as specializations_router
 from src.presentation.api.routers.users import router as users_router
 
 _engine: AsyncEngine | None = None
+_worker_task: asyncio.Task | None = None
+_worker_stop = asyncio.Event()
+_scoring_task: asyncio.Task | None = None
+_scoring_stop = asyncio.Event()
 
 
 def create_app() -> FastAPI:
@@ -41,8 +50,8 @@ def create_app() -> FastAPI:
         allow_origins=allowed_origins,
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-        allow_headers=["Authorization", "Content-Type", "Accept", "X-Requested-With"],
-        expose_headers=["Content-Length", "X-Request-Id"],
+        allow_headers=["Authorization", "Content-Type", "Accept", "X-Requested-With", "If-None-Match"],
+        expose_headers=["Content-Length", "X-Request-Id", "X-Next-Cursor", "ETag"],
     )
 
     app.add_middleware(
@@ -87,17 +96,49 @@ def create_app() -> FastAPI:
                     """),
                     {
                         "email": admin_settings.SUPER_ADMIN_LOGIN,
-                        "password_hash": password_service.encrypt(admin_settings.SUPER_ADMIN_PASSWORD),
+                        "password_hash": await password_service.encrypt_async(admin_settings.SUPER_ADMIN_PASSWORD),
                         "full_name": "Admin",
                     }
                 )
         except Exception as e:
             print(f"Warning: Could not create admin user: {e}")
 
+        # The scoring snapshot lives in this process, so it is refreshed here whatever the broker
+        global _scoring_task
+        _scoring_stop.clear()
+        _scoring_task = asyncio.create_task(run_scoring_refresher(container, _scoring_stop))
+
+        if settings.JOB_BROKER == "memory":
+            global _worker_task
+            _worker_stop.clear()
+            _worker_task = asyncio.create_task(
+                run_worker(container, _worker_stop, concurrency=settings.JOB_WORKER_CONCURRENCY)
+            )
+
     @app.on_event("shutdown")
     async def shutdown():
-        await container.shutdown_resources()
+        global _worker_task
+        if _worker_task is not None:
+            _worker_stop.set()
+            await _worker_task
+            _worker_task = None
+        global _scoring_task
+        if _scoring_task is not None:
+            _scoring_stop.set()
+            await _scoring_task
+            _scoring_task = None
+        await container.job_queue().close()
+        container.password_service().shutdown()
+        await container.llm_provider().close()
+        shutdown_resources = container.shutdown_resources()
+        if inspect.isawaitable(shutdown_resources):
+            await shutdown_resources
+        redis = container.redis()
+        if redis is not None:
+            await redis.disconnect()
         global _engine
+        if _engine is not None:
+            await _engine.dispose()
         _engine = None
 
     v1_router = APIRouter(prefix="/api/v1")
@@ -108,6 +149,7 @@ def create_app() -> FastAPI:
     v1_router.include_router(medical_records_router)
     v1_router.include_router(appointments_router)
     v1_router.include_router(chat_router)
+    v1_router.include_router(search_router)
     v1_router.include_router(admin_doctors_router)
     v1_router.include_router(admin_users_router)
     v1_router.include_router(admin_stats_router)
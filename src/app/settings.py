@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from typing import Optional
 
@@ -14,15 +15,48 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str
     POSTGRES_PASSWORD: str
 
+    # Database connection pool (DB_USE_POOL=false falls back to NullPool, e.g. behind pgbouncer)
+    DB_USE_POOL: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
     # JWT
     JWT_ACCESS_TOKEN_SECRET_KEY: str
     JWT_REFRESH_TOKEN_SECRET_KEY: str
+    # Embed the user's identity in access tokens so requests authenticate without a DB lookup
+    AUTH_CLAIMS_ONLY: bool = False
+
+    # Password hashing (bcrypt cost factor; hashes with another cost are upgraded on login)
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_MAX_WORKERS: int = 4
 
     # Session
     SESSION_SECRET_KEY: str = "change-me-in-production"
 
     # OpenAI
     OPENAI_API_KEY: str
+    OPENAI_MODEL: str = "gpt-4-turbo-preview"
+    # Point at an OpenAI-compatible server, e.g. `python -m src.app.llm_stub`
+    OPENAI_BASE_URL: Optional[str] = None
+    # One keep-alive connection pool is shared by all completions in a process
+    OPENAI_MAX_CONNECTIONS: int = 20
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    OPENAI_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    OPENAI_READ_TIMEOUT_SECONDS: float = 60.0
+    OPENAI_MAX_RETRIES: int = 2
+
+    # LLM provider: "openai" or "stub" (deterministic in-process replies for load tests)
+    LLM_PROVIDER: str = "openai"
+    STUB_LLM_LATENCY_MS: int = 300
+    STUB_LLM_TOKENS_PER_SECOND: float = 50.0
+    STUB_LLM_RECOMMENDATION_JSON: Optional[str] = None
+    # Token budget for conversation history sent with each completion; older turns are summarized
+    CHAT_CONTEXT_TOKEN_BUDGET: int = 3000
+    CHAT_CONTEXT_MAX_MESSAGES: int = 200
 
     # Admin
     SUPER_ADMIN_LOGIN: str
@@ -37,6 +71,36 @@ class Settings(BaseSettings):
     FRONTEND_URL: str = "http://localhost:3000"
     MOBILE_REDIRECT_SCHEME: str = "myapp"
 
+    # Admin dashboard: read counters from the admin_stats_snapshots table, refreshed when older than max age
+    ADMIN_STATS_USE_SNAPSHOT: bool = False
+    ADMIN_STATS_SNAPSHOT_MAX_AGE_SECONDS: int = 300
+
+    # Redis (optional, requires the "redis" extra)
+    REDIS_URL: Optional[str] = None
+
+    # Caching
+    DOCTOR_ROSTER_CACHE_TTL_SECONDS: int = 300
+    IDENTITY_CACHE_TTL_SECONDS: int = 30
+    IDENTITY_CACHE_MAX_ENTRIES: int = 10000
+
+    # Triage doctor scoring snapshot (in-process), refreshed incrementally in the background every max age seconds
+    TRIAGE_SCORING_MAX_AGE_SECONDS: int = 60
+    TRIAGE_SCORING_HORIZON_DAYS: int = 14
+
+    # Booking slot holds (shared via REDIS_URL when set, in-process otherwise)
+    SLOT_HOLD_TTL_SECONDS: int = 120
+    SLOT_HOLD_MAX_PER_PATIENT: int = 3
+
+    # Background jobs: "memory" runs the worker inside the API process,
+    # "redis"/"rabbitmq" expect `python -m src.app.worker` (job status is shared via REDIS_URL)
+    JOB_BROKER: str = "memory"
+    JOB_QUEUE_NAME: str = "jobs"
+    JOB_WORKER_CONCURRENCY: int = 4
+    # Redis broker: reserved jobs not acknowledged within the timeout are requeued
+    # by a reaper that runs at worker start-up and then every interval
+    JOB_VISIBILITY_TIMEOUT_SECONDS: int = 300
+    JOB_REAP_INTERVAL_SECONDS: int = 60
+
     # RabbitMQ (optional)
     RABBITMQ_DEFAULT_USER: Optional[str] = None
     RABBITMQ_DEFAULT_PASS: Optional[str] = None
@@ -63,6 +127,12 @@ class Settings(BaseSettings):
             self.POSTGRES_DB
         )
 
+    @property
+    def stub_llm_recommendation(self) -> Optional[dict]:
+        if not self.STUB_LLM_RECOMMENDATION_JSON:
+            return None
+        return json.loads(self.STUB_LLM_RECOMMENDATION_JSON)
+
     @property
     def rabbitmq_url(self) -> Optional[str]:
         if not all([self.RABBITMQ_DEFAULT_USER, self.RABBITMQ_DEFAULT_PASS,
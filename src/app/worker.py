@@ -0,0 +1,193 @@
+"""
+Background job worker.
+
+Run as a separate process with ``python -m src.app.worker`` when JOB_BROKER is
+"redis" or "rabbitmq". With the default "memory" broker the API process runs
+the same consumer loop in-process on startup.
+"""
+import asyncio
+import logging
+import signal
+from typing import Awaitable, Callable
+
+from src.app.container import AppContainer
+from src.domain.entities.jobs import JobEntity
+from src.infrastructure.database.uow import UoW
+from src.infrastructure.repositories.appointments import AppointmentRepository
+from src.infrastructure.repositories.chat_messages import ChatMessageRepository
+from src.infrastructure.repositories.chat_sessions import ChatSessionRepository
+from src.infrastructure.repositories.doctors import DoctorRepository
+from src.infrastructure.repositories.schedules import ScheduleRepository
+from src.infrastructure.repositories.specializations import SpecializationRepository
+from src.infrastructure.repositories.stats import StatsRepository
+from src.infrastructure.repositories.triage_candidates import TriageCandidateRepository
+from src.infrastructure.repositories.triage_runs import TriageRunRepository
+from src.infrastructure.repositories.users import UserRepository
+from src.use_cases.assistant.use_case import ASSISTANT_REPLY_JOB, AssistantReplyUseCase
+from src.use_cases.chat.use_case import ChatUseCase
+from src.use_cases.doctors.use_case import DoctorUseCase
+from src.use_cases.schedules.availability import AvailabilityEngine
+from src.use_cases.stats.use_case import REPAIR_COUNTERS_JOB, StatsUseCase
+from src.use_cases.triage.use_case import TriageUseCase
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[AppContainer, JobEntity], Awaitable[dict]]
+
+
+async def handle_assistant_reply(container: AppContainer, job: JobEntity) -> dict:
+    settings = container.settings()
+    session_factory = container.session_factory()
+    async with session_factory() as session:
+        use_case = AssistantReplyUseCase(
+            chat_use_case=ChatUseCase(
+                uow=UoW(session),
+                chat_session_repository=ChatSessionRepository(session),
+                chat_message_repository=ChatMessageRepository(session),
+            ),
+            doctor_use_case=DoctorUseCase(
+                uow=UoW(session),
+                doctor_repository=DoctorRepository(session),
+                user_repository=UserRepository(session),
+                specialization_repository=SpecializationRepository(session),
+                appointment_repository=AppointmentRepository(session),
+                roster_cache=container.doctor_roster_cache(),
+                identity_cache=container.identity_cache(),
+            ),
+            llm_provider=container.llm_provider(),
+            token_counter=container.token_counter(),
+            context_token_budget=settings.CHAT_CONTEXT_TOKEN_BUDGET,
+            max_context_messages=settings.CHAT_CONTEXT_MAX_MESSAGES,
+            triage_use_case=TriageUseCase(
+                uow=UoW(session),
+                triage_run_repository=TriageRunRepository(session),
+                triage_candidate_repository=TriageCandidateRepository(session),
+                chat_session_repository=ChatSessionRepository(session),
+                doctor_repository=DoctorRepository(session),
+                specialization_repository=SpecializationRepository(session),
+            ),
+        )
+        reply = await use_case.generate_reply(job.payload["session_id"])
+
+    return {
+        "message_id": reply.message.id,
+        "session_id": reply.message.session_id,
+        "triage_run_id": reply.triage_run.id if reply.triage_run else None,
+    }
+
+
+async def handle_repair_counters(container: AppContainer, job: JobEntity) -> dict:
+    session_factory = container.session_factory()
+    async with session_factory() as session:
+        use_case = StatsUseCase(uow=UoW(session), stats_repository=StatsRepository(session))
+        fixed = await use_case.repair_counters()
+
+    return {"fixed_rows": fixed}
+
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    ASSISTANT_REPLY_JOB: handle_assistant_reply,
+    REPAIR_COUNTERS_JOB: handle_repair_counters,
+}
+
+
+async def run_worker(
+        container: AppContainer,
+        stop_event: asyncio.Event,
+        concurrency: int = 1,
+        reap_interval_seconds: float = 60,
+) -> None:
+    job_queue = container.job_queue()
+
+    async def reap() -> None:
+        # Jobs left reserved by a crashed worker are requeued once their lease runs out
+        while not stop_event.is_set():
+            try:
+                requeued = await job_queue.requeue_stale()
+                if requeued:
+                    logger.warning(f"Requeued {len(requeued)} stale job(s): {[job.id for job in requeued]}")
+            except Exception as e:
+                logger.error(f"Failed to requeue stale jobs: {e}")
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=reap_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def consume() -> None:
+        while not stop_event.is_set():
+            job = await job_queue.reserve(timeout=1.0)
+            if job is None:
+                continue
+
+            handler = JOB_HANDLERS.get(job.kind)
+            try:
+                if handler is None:
+                    raise ValueError(f"No handler for job kind '{job.kind}'")
+                result = await handler(container, job)
+            except Exception as e:
+                logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+                await job_queue.fail(job, str(e))
+            else:
+                await job_queue.complete(job, result)
+
+    await asyncio.gather(reap(), *(consume() for _ in range(concurrency)))
+
+
+async def run_scoring_refresher(container: AppContainer, stop_event: asyncio.Event) -> None:
+    """Keep the in-process doctor scoring snapshot fresh so requests never refresh it themselves."""
+    scoring_engine = container.doctor_scoring_engine()
+    session_factory = container.session_factory()
+    while not stop_event.is_set():
+        try:
+            async with session_factory() as session:
+                use_case = TriageUseCase(
+                    uow=UoW(session),
+                    triage_run_repository=TriageRunRepository(session),
+                    triage_candidate_repository=TriageCandidateRepository(session),
+                    chat_session_repository=ChatSessionRepository(session),
+                    doctor_repository=DoctorRepository(session),
+                    specialization_repository=SpecializationRepository(session),
+                    scoring_engine=scoring_engine,
+                    availability_engine=AvailabilityEngine(
+                        ScheduleRepository(session),
+                        AppointmentRepository(session),
+                    ),
+                )
+                await use_case.refresh_scoring_snapshot()
+        except Exception as e:
+            logger.error(f"Failed to refresh doctor scoring snapshot: {e}")
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=scoring_engine.max_age_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _main() -> None:
+    container = AppContainer()
+    settings = container.settings()
+    stop_event = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    logger.info(f"Starting job worker (broker={settings.JOB_BROKER}, concurrency={settings.JOB_WORKER_CONCURRENCY})")
+    try:
+        await run_worker(
+            container,
+            stop_event,
+            concurrency=settings.JOB_WORKER_CONCURRENCY,
+            reap_interval_seconds=settings.JOB_REAP_INTERVAL_SECONDS,
+        )
+    finally:
+        await container.job_queue().close()
+        await container.llm_provider().close()
+        await container.engine().dispose()
+        redis = container.redis()
+        if redis is not None:
+            await redis.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
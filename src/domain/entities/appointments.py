@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from src.domain.constants import AppointmentStatus, VisitType
@@ -41,3 +41,18 @@ class AppointmentWithDetailsEntity:
     patient_phone: Optional[str]
     doctor_name: str
     specialization_name: str
+
+
+@dataclass(frozen=True)
+class AppointmentStatusCountEntity:
+    status: AppointmentStatus
+    count: int
+    day: Optional[date] = None
+
+
+@dataclass(frozen=True)
+class SlotHoldEntity:
+    doctor_id: int
+    date_time: datetime
+    patient_id: int
+    expires_at: datetime
@@ -15,6 +15,7 @@ class ChatMessageEntity:
     prompt_version: Optional[str]
     token_input: Optional[int]
     token_output: Optional[int]
+    content_tokens: Optional[int]
     latency_ms: Optional[int]
     session_id: int
     created_at: datetime
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from src.domain.constants import ChatSessionStatus, ChatSource
+from src.domain.constants import ChatSessionStatus, ChatSource, MessageRole, UrgencyLevel
 
 if TYPE_CHECKING:
     from src.domain.entities.chat_messages import ChatMessageEntity
@@ -33,3 +33,20 @@ class ChatSessionWithMessagesEntity:
     created_at: datetime
     updated_at: datetime
     messages: list
+    has_earlier: bool = False
+
+
+@dataclass(frozen=True)
+class ChatSessionInboxEntity:
+    id: int
+    status: ChatSessionStatus
+    source: ChatSource
+    locale: Optional[str]
+    last_message_at: Optional[datetime]
+    user_id: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+    message_count: int
+    last_message_preview: Optional[str]
+    last_message_role: Optional[MessageRole]
+    latest_urgency: Optional[UrgencyLevel]
@@ -37,3 +37,17 @@ class DoctorWithDetailsEntity:
     email: str
     phone: Optional[str]
     specialization_name: str
+
+
+@dataclass(frozen=True)
+class DoctorRosterEntity:
+    doctors: list[DoctorWithDetailsEntity]
+    prompt_section: str
+    version: int
+
+
+@dataclass(frozen=True)
+class DoctorMatchEntity:
+    doctor: DoctorWithDetailsEntity
+    score: float
+    has_availability: bool
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.domain.constants import JobStatus
+
+
+@dataclass(frozen=True)
+class JobEntity:
+    id: str
+    kind: str
+    payload: dict
+    status: JobStatus
+    result: Optional[dict]
+    error: Optional[str]
+    created_at: datetime
+    updated_at: datetime
@@ -16,4 +16,5 @@ class SpecializationWithCountEntity:
     title: str
     slug: str
     description: Optional[str]
-    doctors_count: int
\ No newline at end of file
+    doctors_count: int
+    approved_doctors_count: int = 0
\ No newline at end of file
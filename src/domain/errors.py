@@ -34,3 +34,8 @@ class BadRequestException(BaseError):
 class InsufficientFundsError(BaseError):
     message = "Insufficient Funds"
     status_code = 403
+
+
+class ConflictException(BaseError):
+    message = "Conflict"
+    status_code = 409
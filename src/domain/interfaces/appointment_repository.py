@@ -3,7 +3,11 @@ from datetime import datetime, date
 from typing import Optional
 
 from src.domain.constants import AppointmentStatus
-from src.domain.entities.appointments import AppointmentEntity, AppointmentWithDetailsEntity
+from src.domain.entities.appointments import (
+    AppointmentEntity,
+    AppointmentWithDetailsEntity,
+    AppointmentStatusCountEntity,
+)
 from src.use_cases.appointments.dto import CreateAppointmentDTO, UpdateAppointmentDTO
 
 
@@ -12,6 +16,12 @@ class IAppointmentRepository(ABC):
     async def create_appointment(self, appointment: CreateAppointmentDTO) -> AppointmentEntity:
         pass
 
+    @abstractmethod
+    async def book_appointment(
+        self, appointment: CreateAppointmentDTO
+    ) -> Optional[AppointmentEntity]:
+        pass
+
     @abstractmethod
     async def update_appointment(
         self, appointment_id: int, appointment: UpdateAppointmentDTO
@@ -35,6 +45,7 @@ class IAppointmentRepository(ABC):
         status: Optional[AppointmentStatus] = None,
         skip: int = 0,
         limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> list[AppointmentWithDetailsEntity]:
         pass
 
@@ -47,18 +58,39 @@ class IAppointmentRepository(ABC):
         date_to: Optional[date] = None,
         skip: int = 0,
         limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> list[AppointmentWithDetailsEntity]:
         pass
 
+    @abstractmethod
+    async def count_doctor_appointments_by_status(
+        self,
+        doctor_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        by_day: bool = False,
+    ) -> list[AppointmentStatusCountEntity]:
+        pass
+
     @abstractmethod
     async def get_doctor_appointments_for_date(
         self, doctor_id: int, target_date: date
     ) -> list[AppointmentEntity]:
         pass
 
+    @abstractmethod
+    async def get_booked_appointments_in_range(
+        self, doctor_ids: list[int], start: datetime, end: datetime
+    ) -> list[AppointmentEntity]:
+        pass
+
     @abstractmethod
     async def check_slot_availability(
-        self, doctor_id: int, date_time: datetime, duration_minutes: int = 30
+        self,
+        doctor_id: int,
+        date_time: datetime,
+        duration_minutes: int = 30,
+        exclude_appointment_id: Optional[int] = None,
     ) -> bool:
         pass
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 from src.domain.entities.chat_messages import ChatMessageEntity
@@ -20,9 +21,32 @@ class IChatMessageRepository(ABC):
         session_id: int,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> list[ChatMessageEntity]:
         pass
 
+    @abstractmethod
+    async def get_messages_after(
+        self,
+        session_id: int,
+        after_id: int,
+        limit: int = 100,
+    ) -> list[ChatMessageEntity]:
+        pass
+
+    @abstractmethod
+    async def get_recent_messages(
+        self,
+        session_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 200,
+    ) -> list[ChatMessageEntity]:
+        pass
+
+    @abstractmethod
+    async def update_content_tokens(self, counts: dict[int, int]) -> None:
+        pass
+
     @abstractmethod
     async def count_messages_by_session_id(self, session_id: int) -> int:
         pass
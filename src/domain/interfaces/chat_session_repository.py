@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 from src.domain.constants import ChatSessionStatus
 from src.domain.entities.chat_sessions import (
     ChatSessionEntity,
+    ChatSessionInboxEntity,
     ChatSessionWithMessagesEntity,
 )
 from src.use_cases.chat.dto import CreateChatSessionDTO, UpdateChatSessionDTO
@@ -26,7 +28,10 @@ class IChatSessionRepository(ABC):
 
     @abstractmethod
     async def get_session_with_messages(
-        self, session_id: int
+        self,
+        session_id: int,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
     ) -> Optional[ChatSessionWithMessagesEntity]:
         pass
 
@@ -37,9 +42,22 @@ class IChatSessionRepository(ABC):
         status: Optional[ChatSessionStatus] = None,
         skip: int = 0,
         limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> list[ChatSessionEntity]:
         pass
 
+    @abstractmethod
+    async def get_session_inbox_by_user_id(
+        self,
+        user_id: int,
+        status: Optional[ChatSessionStatus] = None,
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
+        preview_length: int = 120,
+    ) -> list[ChatSessionInboxEntity]:
+        pass
+
     @abstractmethod
     async def close_session(self, session_id: int) -> ChatSessionEntity:
         pass
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 from src.domain.constants import DoctorStatus
-from src.domain.entities.doctors import DoctorEntity, DoctorWithDetailsEntity
-from src.use_cases.doctors.dto import CreateDoctorDTO, UpdateDoctorDTO
+from src.domain.entities.doctors import DoctorEntity, DoctorMatchEntity, DoctorWithDetailsEntity
+from src.use_cases.doctors.dto import CreateDoctorDTO, DoctorMatchWeightsDTO, UpdateDoctorDTO
 
 
 class IDoctorRepository(ABC):
@@ -31,6 +32,10 @@ class IDoctorRepository(ABC):
     async def get_doctor_with_details(self, doctor_id: int) -> Optional[DoctorWithDetailsEntity]:
         pass
 
+    @abstractmethod
+    async def get_doctors_by_ids(self, doctor_ids: list[int]) -> list[DoctorWithDetailsEntity]:
+        pass
+
     @abstractmethod
     async def get_all_doctors(
             self,
@@ -38,9 +43,31 @@ class IDoctorRepository(ABC):
             status: Optional[DoctorStatus] = None,
             skip: int = 0,
             limit: int = 10,
+            after_id: Optional[int] = None,
     ) -> list[DoctorWithDetailsEntity]:
         pass
 
+    @abstractmethod
+    async def get_ranked_doctors(
+            self,
+            specialization_id: int,
+            weights: DoctorMatchWeightsDTO,
+            skip: int = 0,
+            limit: int = 10,
+    ) -> list[DoctorMatchEntity]:
+        pass
+
+    @abstractmethod
+    async def get_doctors_for_scoring(
+            self,
+            updated_since: Optional[datetime] = None,
+    ) -> list[DoctorEntity]:
+        pass
+
+    @abstractmethod
+    async def get_approved_doctor_ids(self) -> set[int]:
+        pass
+
     @abstractmethod
     async def delete_doctor(self, doctor_id: int) -> bool:
         pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.entities.jobs import JobEntity
+
+
+class IJobBroker(ABC):
+    @abstractmethod
+    async def publish(self, job: JobEntity) -> None:
+        pass
+
+    @abstractmethod
+    async def reserve(self, timeout: float = 1.0) -> Optional[JobEntity]:
+        pass
+
+    @abstractmethod
+    async def ack(self, job: JobEntity) -> None:
+        pass
+
+    @abstractmethod
+    async def requeue_stale(self) -> list[JobEntity]:
+        """Put back jobs reserved by workers that never acknowledged them; returns those jobs."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+
+class IJobStore(ABC):
+    @abstractmethod
+    async def save(self, job: JobEntity) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[JobEntity]:
+        pass
@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from typing import AsyncGenerator, Optional
+
+from src.domain.entities.doctors import DoctorWithDetailsEntity
+
+
+class ILLMProvider(ABC):
+    @property
+    @abstractmethod
+    def model(self) -> str:
+        pass
+
+    @abstractmethod
+    def format_doctors_for_prompt(self, doctors: list[DoctorWithDetailsEntity]) -> str:
+        pass
+
+    @abstractmethod
+    def chat_stream(
+            self,
+            messages: list[dict],
+            doctors: Optional[list[DoctorWithDetailsEntity]] = None,
+            temperature: float = 0.7,
+            usage: Optional[dict] = None,
+            doctors_section: Optional[str] = None,
+    ) -> AsyncGenerator[str, None]:
+        pass
+
+    @abstractmethod
+    async def chat(
+            self,
+            messages: list[dict],
+            doctors: Optional[list[DoctorWithDetailsEntity]] = None,
+            temperature: float = 0.7,
+            doctors_section: Optional[str] = None,
+            usage: Optional[dict] = None,
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def analyze_symptoms(self, symptoms: str, conversation_history: list[dict]) -> dict:
+        pass
+
+    @abstractmethod
+    async def summarize_conversation(
+            self,
+            messages: list[dict],
+            previous_summary: Optional[str] = None,
+            max_tokens: int = 300,
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
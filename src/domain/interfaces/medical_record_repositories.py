@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 from src.domain.entities.medical_records import MedicalRecordEntity, MedicalRecordWithDetailsEntity
@@ -28,13 +29,23 @@ class IMedicalRecordRepository(ABC):
 
     @abstractmethod
     async def get_medical_records_by_patient_id(
-        self, patient_id: int, skip: int = 0, limit: int = 20
+        self,
+        patient_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
+        doctor_id: Optional[int] = None,
     ) -> list[MedicalRecordWithDetailsEntity]:
         pass
 
     @abstractmethod
     async def get_medical_records_by_doctor_id(
-        self, doctor_id: int, skip: int = 0, limit: int = 20
+        self,
+        doctor_id: int,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> list[MedicalRecordWithDetailsEntity]:
         pass
 
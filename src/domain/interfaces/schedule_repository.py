@@ -36,6 +36,12 @@ class IScheduleRepository(ABC):
     async def get_active_schedules_by_doctor_id(self, doctor_id: int) -> list[ScheduleEntity]:
         pass
 
+    @abstractmethod
+    async def get_active_schedules_by_doctor_ids(
+            self, doctor_ids: list[int]
+    ) -> list[ScheduleEntity]:
+        pass
+
     @abstractmethod
     async def delete_schedule(self, schedule_id: int) -> bool:
         pass
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from src.domain.entities.appointments import SlotHoldEntity
+
+
+class ISlotHoldStore(ABC):
+    @abstractmethod
+    async def acquire(
+            self,
+            doctor_id: int,
+            date_time: datetime,
+            patient_id: int,
+            ttl_seconds: int,
+            max_per_patient: Optional[int] = None,
+    ) -> Optional[SlotHoldEntity]:
+        """
+        Take or refresh the patient's hold on a slot. Returns None when another
+        patient holds it and raises ConflictException when taking a new slot
+        would exceed ``max_per_patient`` live holds.
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, doctor_id: int, date_time: datetime, patient_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_holders(self, doctor_id: int, starts: list[datetime]) -> dict[datetime, int]:
+        pass
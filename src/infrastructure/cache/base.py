@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.redis import RedisConnection
+
+logger = logging.getLogger(__name__)
+
+
+class RedisBackedCache:
+    """Base for caches that use Redis when configured and degrade to in-process state otherwise."""
+
+    def __init__(self, redis: Optional[RedisConnection] = None):
+        self._redis = redis
+
+    async def _redis_call(self, method: str, *args, **kwargs):
+        if self._redis is None:
+            return None
+        try:
+            client = await self._redis.connect()
+            return await getattr(client, method)(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"{type(self).__name__}: Redis unavailable, using local cache: {e}")
+            return None
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.redis import RedisConnection
+
+
+def create_redis_connection(url: Optional[str]) -> Optional[RedisConnection]:
+    """Build a Redis connection when REDIS_URL is configured; redis is an optional extra."""
+    if not url:
+        return None
+
+    from src.infrastructure.database.redis import RedisConnection
+
+    return RedisConnection(url=url)
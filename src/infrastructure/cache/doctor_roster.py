@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from src.domain.constants import DoctorStatus
+from src.domain.entities.doctors import DoctorRosterEntity, DoctorWithDetailsEntity
+from src.infrastructure.cache.base import RedisBackedCache
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.redis import RedisConnection
+
+
+class DoctorRosterCache(RedisBackedCache):
+    """
+    Versioned cache of the approved-doctor roster used for prompt construction.
+
+    Entries are keyed by roster version, so invalidation is a single version bump
+    and stale entries simply age out. Redis is shared between workers; the
+    in-process LRU serves hits locally and takes over when Redis is unavailable.
+    Local entries expire after the same TTL as the Redis ones, so a worker that
+    missed another worker's invalidation serves a stale roster for at most that long.
+    """
+
+    VERSION_KEY = "doctor_roster:version"
+    ENTRY_KEY = "doctor_roster:{version}:{limit}"
+
+    def __init__(
+            self,
+            redis: Optional[RedisConnection] = None,
+            ttl_seconds: int = 300,
+            max_local_entries: int = 16,
+    ):
+        super().__init__(redis)
+        self._ttl_seconds = ttl_seconds
+        self._max_local_entries = max_local_entries
+        self._local: OrderedDict[tuple[int, int], tuple[float, DoctorRosterEntity]] = OrderedDict()
+        self._local_version = 0
+
+    async def get(self, limit: int) -> Optional[DoctorRosterEntity]:
+        version = await self._current_version()
+        key = (version, limit)
+
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, roster = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                return roster
+            del self._local[key]
+
+        raw = await self._redis_call("get", self.ENTRY_KEY.format(version=version, limit=limit))
+        if raw is None:
+            return None
+
+        roster = self._deserialize(raw, version)
+        self._store_local(key, roster)
+        return roster
+
+    async def set(
+            self, limit: int, doctors: list[DoctorWithDetailsEntity], prompt_section: str
+    ) -> DoctorRosterEntity:
+        version = await self._current_version()
+        roster = DoctorRosterEntity(doctors=doctors, prompt_section=prompt_section, version=version)
+        self._store_local((version, limit), roster)
+        await self._redis_call(
+            "set",
+            self.ENTRY_KEY.format(version=version, limit=limit),
+            self._serialize(roster),
+            ex=self._ttl_seconds,
+        )
+        return roster
+
+    async def invalidate(self) -> None:
+        self._local_version += 1
+        self._local.clear()
+        await self._redis_call("incr", self.VERSION_KEY)
+
+    async def _current_version(self) -> int:
+        version = await self._redis_call("get", self.VERSION_KEY)
+        if version is None:
+            return self._local_version
+        return int(version)
+
+    def _store_local(self, key: tuple[int, int], roster: DoctorRosterEntity) -> None:
+        self._local[key] = (time.monotonic() + self._ttl_seconds, roster)
+        self._local.move_to_end(key)
+        while len(self._local) > self._max_local_entries:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    def _serialize(roster: DoctorRosterEntity) -> str:
+        return json.dumps({
+            "prompt_section": roster.prompt_section,
+            "doctors": [asdict(doctor) for doctor in roster.doctors],
+        }, default=lambda v: v.isoformat())
+
+    @staticmethod
+    def _deserialize(raw: str, version: int) -> DoctorRosterEntity:
+        data = json.loads(raw)
+        doctors = [
+            DoctorWithDetailsEntity(**{
+                **doctor,
+                "status": DoctorStatus(doctor["status"]),
+                "created_at": datetime.fromisoformat(doctor["created_at"]),
+                "updated_at": datetime.fromisoformat(doctor["updated_at"]),
+            })
+            for doctor in data["doctors"]
+        ]
+        return DoctorRosterEntity(doctors=doctors, prompt_section=data["prompt_section"], version=version)
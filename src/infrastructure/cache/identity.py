@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import TYPE_CHECKING, Optional
+
+from src.domain.entities.users import UserEntityWithDetails
+from src.infrastructure.cache.base import RedisBackedCache
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.redis import RedisConnection
+
+
+class IdentityCache(RedisBackedCache):
+    """
+    Short-TTL cache of the authenticated user, keyed by user id and token ``iat``.
+
+    Redis keeps one hash per user (field = iat), so invalidating a user is a
+    single DEL. The bounded in-process map fronts Redis, so another worker's
+    invalidation can take up to the TTL to be seen here. Password hashes are
+    never cached.
+    """
+
+    KEY = "identity:{user_id}"
+
+    def __init__(
+            self,
+            redis: Optional[RedisConnection] = None,
+            ttl_seconds: int = 30,
+            max_local_entries: int = 10_000,
+    ):
+        super().__init__(redis)
+        self._ttl_seconds = ttl_seconds
+        self._max_local_entries = max_local_entries
+        self._local: OrderedDict[tuple[int, int], tuple[float, UserEntityWithDetails]] = OrderedDict()
+        self._local_by_user: dict[int, set[int]] = {}
+
+    async def get(self, user_id: int, iat: int) -> Optional[UserEntityWithDetails]:
+        key = (user_id, iat)
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                return user
+            self._drop_local(key)
+
+        raw = await self._redis_call("hget", self.KEY.format(user_id=user_id), str(iat))
+        if raw is None:
+            return None
+
+        user = UserEntityWithDetails(**json.loads(raw))
+        self._store_local(key, user)
+        return user
+
+    async def set(self, iat: int, user: UserEntityWithDetails) -> None:
+        user = replace(user, password_hash="")
+        self._store_local((user.id, iat), user)
+
+        redis_key = self.KEY.format(user_id=user.id)
+        if await self._redis_call("hset", redis_key, str(iat), json.dumps(asdict(user))) is not None:
+            await self._redis_call("expire", redis_key, self._ttl_seconds)
+
+    async def invalidate(self, user_id: int) -> None:
+        for iat in list(self._local_by_user.get(user_id, ())):
+            self._drop_local((user_id, iat))
+        await self._redis_call("delete", self.KEY.format(user_id=user_id))
+
+    def _store_local(self, key: tuple[int, int], user: UserEntityWithDetails) -> None:
+        self._local[key] = (time.monotonic() + self._ttl_seconds, user)
+        self._local.move_to_end(key)
+        self._local_by_user.setdefault(key[0], set()).add(key[1])
+        while len(self._local) > self._max_local_entries:
+            self._drop_local(next(iter(self._local)))
+
+    def _drop_local(self, key: tuple[int, int]) -> None:
+        self._local.pop(key, None)
+        iats = self._local_by_user.get(key[0])
+        if iats is not None:
+            iats.discard(key[1])
+            if not iats:
+                del self._local_by_user[key[0]]
@@ -3,8 +3,49 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 
-def create_engine(db_url: str, echo: bool) -> AsyncEngine:
-    return create_async_engine(url=db_url, echo=echo, poolclass=NullPool)
+def create_engine(
+        db_url: str,
+        echo: bool,
+        use_pool: bool = True,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+) -> AsyncEngine:
+    if not use_pool:
+        return create_async_engine(url=db_url, echo=echo, poolclass=NullPool)
+
+    return create_async_engine(
+        url=db_url,
+        echo=echo,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
+
+
+def get_pool_stats(engine: AsyncEngine, max_overflow: int) -> dict:
+    """
+    Snapshot of the connection pool owned by this worker process. The pool has
+    no public accessor for its overflow limit, so the configured value is passed in.
+    """
+    pool = engine.pool
+    if isinstance(pool, NullPool):
+        return {"pool_class": type(pool).__name__, "pooled": False}
+
+    return {
+        "pool_class": type(pool).__name__,
+        "pooled": True,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": max_overflow,
+        "timeout": pool.timeout(),
+    }
 
 
 def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
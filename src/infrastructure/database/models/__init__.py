@@ -1,7 +1,9 @@
 from src.infrastructure.utilities.model_mixins import IdMixin, TimeStampMixin
+from .admin_stats_snapshots import AdminStatsSnapshot
 from .appointments import Appointment
 from .chat_messages import ChatMessage
 from .chat_sessions import ChatSession
+from .doctor_patients import DoctorPatient
 from .doctors import Doctor
 from .medical_records import MedicalRecord
 from .schedules import Schedule
@@ -23,4 +25,6 @@ __all__ = [
     "ChatMessage",
     "TriageRun",
     "TriageCandidate",
+    "AdminStatsSnapshot",
+    "DoctorPatient",
 ]
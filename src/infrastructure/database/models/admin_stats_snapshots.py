@@ -0,0 +1,25 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+import sqlalchemy.orm as orm
+
+from . import IdMixin
+from ..core import Base
+
+
+class AdminStatsSnapshot(Base, IdMixin):
+    """Single-row (id=1) materialized copy of the admin dashboard counters."""
+
+    __tablename__ = "admin_stats_snapshots"
+
+    total_users: orm.Mapped[int] = orm.mapped_column(sa.Integer, nullable=False)
+    total_doctors: orm.Mapped[int] = orm.mapped_column(sa.Integer, nullable=False)
+    total_bookings: orm.Mapped[int] = orm.mapped_column(sa.Integer, nullable=False)
+    today_bookings: orm.Mapped[int] = orm.mapped_column(sa.Integer, nullable=False)
+    pending_bookings: orm.Mapped[int] = orm.mapped_column(sa.Integer, nullable=False)
+    completed_bookings: orm.Mapped[int] = orm.mapped_column(sa.Integer, nullable=False)
+    total_emrs: orm.Mapped[int] = orm.mapped_column(sa.Integer, nullable=False)
+    refreshed_at: orm.Mapped[datetime] = orm.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False
+    )
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
 import sqlalchemy.orm as orm
+from sqlalchemy.dialects.postgresql import ExcludeConstraint, Range, TSTZRANGE
 
 from src.domain.constants import AppointmentStatus, VisitType
 from . import IdMixin, TimeStampMixin
@@ -52,6 +53,11 @@ class Appointment(Base, IdMixin, TimeStampMixin):
         sa.Text,
         nullable=True
     )
+    # Maintained by the trg_appointments_time_range trigger from date_time and duration_minutes.
+    time_range: orm.Mapped[Range[datetime]] = orm.mapped_column(
+        TSTZRANGE,
+        server_default=sa.FetchedValue()
+    )
 
     patient_id: orm.Mapped[int] = orm.mapped_column(
         sa.ForeignKey("users.id", ondelete="CASCADE")
@@ -94,12 +100,23 @@ class Appointment(Base, IdMixin, TimeStampMixin):
     )
 
     __table_args__ = (
+        ExcludeConstraint(
+            ("doctor_id", "="),
+            ("time_range", "&&"),
+            name="ex_appointments_doctor_no_overlap",
+            using="gist",
+            where=sa.text("status IN ('scheduled', 'confirmed', 'in_progress')"),
+        ),
         sa.Index(
-            "ix_appointments_doctor_datetime_active",
+            "ix_appointments_doctor_datetime_status",
             "doctor_id",
             "date_time",
-            postgresql_where=sa.text(
-                "status IN ('scheduled', 'confirmed')"
-            )
+            "status",
+        ),
+        sa.Index(
+            "ix_appointments_patient_datetime",
+            "patient_id",
+            "date_time",
+            "id",
         ),
     )
@@ -53,6 +53,12 @@ class ChatMessage(Base, IdMixin):
         sa.Integer,
         nullable=True
     )
+    # Token count of the content itself, cached for context windowing;
+    # token_input/token_output hold LLM API usage only.
+    content_tokens: orm.Mapped[Optional[int]] = orm.mapped_column(
+        sa.Integer,
+        nullable=True
+    )
     latency_ms: orm.Mapped[Optional[int]] = orm.mapped_column(
         sa.Integer,
         nullable=True
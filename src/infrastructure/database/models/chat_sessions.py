@@ -50,6 +50,25 @@ class ChatSession(Base, IdMixin, TimeStampMixin):
         JSONB,
         nullable=True
     )
+    # Maintained by the trg_chat_messages_session_counts trigger. The token
+    # totals are LLM API usage (prompt/completion tokens of the session's
+    # replies); cached content sizes live in chat_messages.content_tokens and
+    # are not counted, so caching them does not fire the trigger.
+    message_count: orm.Mapped[int] = orm.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default="0"
+    )
+    token_input_total: orm.Mapped[int] = orm.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default="0"
+    )
+    token_output_total: orm.Mapped[int] = orm.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default="0"
+    )
 
     user_id: orm.Mapped[Optional[int]] = orm.mapped_column(
         sa.ForeignKey("users.id", ondelete="SET NULL"),
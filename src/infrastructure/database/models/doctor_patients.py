@@ -0,0 +1,40 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+import sqlalchemy.orm as orm
+
+from ..core import Base
+
+
+class DoctorPatient(Base):
+    """
+    Per doctor/patient appointment summary behind the "My patients" view.
+    Rows are rebuilt by the trg_appointments_doctor_patients trigger on every
+    appointment write. Only time-independent facts are stored; upcoming counts
+    are computed when the page is read.
+    """
+
+    __tablename__ = "doctor_patients"
+
+    doctor_id: orm.Mapped[int] = orm.mapped_column(
+        sa.ForeignKey("doctors.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    patient_id: orm.Mapped[int] = orm.mapped_column(
+        sa.ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    total_appointments: orm.Mapped[int] = orm.mapped_column(sa.Integer, nullable=False)
+    last_appointment_date: orm.Mapped[datetime] = orm.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False
+    )
+
+    __table_args__ = (
+        sa.Index(
+            "ix_doctor_patients_doctor_last_date",
+            "doctor_id",
+            sa.text("last_appointment_date DESC"),
+            sa.text("patient_id DESC"),
+        ),
+    )
@@ -42,6 +42,17 @@ class Doctor(Base, IdMixin, TimeStampMixin):
     specialization_id: orm.Mapped[int] = orm.mapped_column(
         sa.ForeignKey("specializations.id", ondelete="CASCADE")
     )
+    # Maintained by the trg_appointments_doctor_counts trigger.
+    appointments_count: orm.Mapped[int] = orm.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default="0"
+    )
+    patients_count: orm.Mapped[int] = orm.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default="0"
+    )
 
     user: orm.Mapped["User"] = orm.relationship(
         "User",
@@ -64,3 +75,19 @@ class Doctor(Base, IdMixin, TimeStampMixin):
         "TriageCandidate",
         back_populates="doctor"
     )
+
+
+# Default triage match score: rating * 10 plus 2 points per year of experience, capped at 20.
+# Constants are inlined (not bound) so queries ordering by it can use the index below.
+DOCTOR_MATCH_SCORE = (
+    Doctor.rating * sa.literal_column("10")
+    + sa.func.least(Doctor.experience_years * sa.literal_column("2"), sa.literal_column("20"))
+)
+
+sa.Index(
+    "ix_doctors_specialization_match_score",
+    Doctor.specialization_id,
+    Doctor.status,
+    DOCTOR_MATCH_SCORE.self_group().desc(),
+    Doctor.id,
+)
@@ -2,17 +2,33 @@ from typing import Optional
 
 import sqlalchemy as sa
 import sqlalchemy.orm as orm
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 from . import IdMixin, TimeStampMixin
 from ..core import Base
 
 
+# Text search configuration for records; "simple" (no stemming) since records mix languages.
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(diagnosis, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(prescription, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')"
+)
+
+
 class MedicalRecord(Base, IdMixin, TimeStampMixin):
     __tablename__ = "medical_records"
 
     diagnosis: orm.Mapped[str] = orm.mapped_column(sa.Text)
     prescription: orm.Mapped[Optional[str]] = orm.mapped_column(sa.Text, nullable=True)
     notes: orm.Mapped[Optional[str]] = orm.mapped_column(sa.Text, nullable=True)
+    search_vector: orm.Mapped[Optional[str]] = orm.mapped_column(
+        TSVECTOR,
+        sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True,
+        deferred=True
+    )
     patient_id: orm.Mapped[int] = orm.mapped_column(
         sa.ForeignKey("users.id", ondelete="CASCADE")
     )
@@ -30,3 +46,17 @@ class MedicalRecord(Base, IdMixin, TimeStampMixin):
         "Appointment",
         back_populates="medical_record"
     )
+
+    __table_args__ = (
+        sa.Index(
+            "ix_medical_records_doctor_created",
+            "doctor_id",
+            "created_at",
+            "id",
+        ),
+        sa.Index(
+            "ix_medical_records_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
@@ -40,6 +40,17 @@ class Specialization(Base, IdMixin, TimeStampMixin):
         nullable=False,
         server_default="0"
     )
+    # Maintained by the trg_doctors_specialization_counts trigger.
+    doctors_count: orm.Mapped[int] = orm.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default="0"
+    )
+    approved_doctors_count: orm.Mapped[int] = orm.mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default="0"
+    )
 
     doctors: orm.Mapped[list["Doctor"]] = orm.relationship(
         "Doctor",
@@ -40,6 +40,27 @@ class User(Base, IdMixin, TimeStampMixin):
         back_populates="user"
     )
 
+    __table_args__ = (
+        sa.Index(
+            "ix_users_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        sa.Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        sa.Index(
+            "ix_users_phone_trgm",
+            "phone",
+            postgresql_using="gin",
+            postgresql_ops={"phone": "gin_trgm_ops"},
+        ),
+    )
+
     @property
     def is_doctor(self) -> bool:
         from src.domain.constants import DoctorStatus
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional
+
+from src.domain.entities.appointments import SlotHoldEntity
+from src.domain.errors import ConflictException
+from src.domain.interfaces.slot_holds import ISlotHoldStore
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.redis import RedisConnection
+
+
+TOO_MANY_HOLDS_MESSAGE = "Too many slots held; book or release one first"
+
+
+def _slot_start(date_time: datetime) -> datetime:
+    """Normalize to the naive local minute used by availability slots."""
+    if date_time.tzinfo is not None:
+        date_time = date_time.astimezone().replace(tzinfo=None)
+    return date_time.replace(second=0, microsecond=0)
+
+
+class InMemorySlotHoldStore(ISlotHoldStore):
+    """Process-local holds for single-node deployments and tests."""
+
+    def __init__(self):
+        self._holds: dict[tuple[int, datetime], tuple[int, float]] = {}
+
+    async def acquire(
+            self,
+            doctor_id: int,
+            date_time: datetime,
+            patient_id: int,
+            ttl_seconds: int,
+            max_per_patient: Optional[int] = None,
+    ) -> Optional[SlotHoldEntity]:
+        key = (doctor_id, _slot_start(date_time))
+        holder = self._get_live(key)
+        if holder is not None and holder != patient_id:
+            return None
+
+        self._prune()
+        if holder is None and max_per_patient:
+            held = sum(1 for other, _ in self._holds.values() if other == patient_id)
+            if held >= max_per_patient:
+                raise ConflictException(TOO_MANY_HOLDS_MESSAGE)
+        self._holds[key] = (patient_id, time.monotonic() + ttl_seconds)
+        return SlotHoldEntity(
+            doctor_id=doctor_id,
+            date_time=key[1],
+            patient_id=patient_id,
+            expires_at=datetime.now() + timedelta(seconds=ttl_seconds),
+        )
+
+    async def release(self, doctor_id: int, date_time: datetime, patient_id: int) -> bool:
+        key = (doctor_id, _slot_start(date_time))
+        if self._get_live(key) != patient_id:
+            return False
+        del self._holds[key]
+        return True
+
+    async def get_holders(self, doctor_id: int, starts: list[datetime]) -> dict[datetime, int]:
+        holders = {}
+        for start in starts:
+            holder = self._get_live((doctor_id, _slot_start(start)))
+            if holder is not None:
+                holders[start] = holder
+        return holders
+
+    def _get_live(self, key: tuple[int, datetime]) -> Optional[int]:
+        entry = self._holds.get(key)
+        if entry is None:
+            return None
+        holder, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._holds[key]
+            return None
+        return holder
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (_, expires_at) in self._holds.items() if expires_at <= now]:
+            del self._holds[key]
+
+
+class RedisSlotHoldStore(ISlotHoldStore):
+    """
+    Holds shared across workers: one key per slot holding the patient id, and
+    a per-patient sorted set of held slot keys scored by expiry (ms) for the
+    hold cap. Both are only changed inside Lua scripts, so check-and-set is atomic.
+    """
+
+    KEY = "slot_hold:{doctor_id}:{start}"
+    PATIENT_KEY = "slot_hold_patient:{patient_id}"
+
+    # Returns 1 when taken or refreshed, 0 when held by someone else, -1 at the cap.
+    _ACQUIRE_SCRIPT = """
+        local now = redis.call('TIME')
+        local now_ms = now[1] * 1000 + math.floor(now[2] / 1000)
+        local ttl_ms = tonumber(ARGV[2])
+        local max_holds = tonumber(ARGV[3])
+        redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now_ms)
+        local holder = redis.call('GET', KEYS[1])
+        if holder and holder ~= ARGV[1] then
+            return 0
+        end
+        if not holder and max_holds > 0 and redis.call('ZCARD', KEYS[2]) >= max_holds then
+            return -1
+        end
+        redis.call('SET', KEYS[1], ARGV[1], 'PX', ttl_ms)
+        redis.call('ZADD', KEYS[2], now_ms + ttl_ms, KEYS[1])
+        redis.call('PEXPIRE', KEYS[2], ttl_ms)
+        return 1
+    """
+
+    # Delete only if the hold still belongs to the caller.
+    _RELEASE_SCRIPT = """
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            redis.call('ZREM', KEYS[2], KEYS[1])
+            return redis.call('DEL', KEYS[1])
+        end
+        return 0
+    """
+
+    def __init__(self, redis: RedisConnection):
+        self._redis = redis
+
+    async def acquire(
+            self,
+            doctor_id: int,
+            date_time: datetime,
+            patient_id: int,
+            ttl_seconds: int,
+            max_per_patient: Optional[int] = None,
+    ) -> Optional[SlotHoldEntity]:
+        client = await self._redis.connect()
+        result = await client.eval(
+            self._ACQUIRE_SCRIPT,
+            2,
+            self._key(doctor_id, date_time),
+            self.PATIENT_KEY.format(patient_id=patient_id),
+            str(patient_id),
+            str(ttl_seconds * 1000),
+            str(max_per_patient or 0),
+        )
+        if int(result) == 0:
+            return None
+        if int(result) < 0:
+            raise ConflictException(TOO_MANY_HOLDS_MESSAGE)
+
+        return SlotHoldEntity(
+            doctor_id=doctor_id,
+            date_time=_slot_start(date_time),
+            patient_id=patient_id,
+            expires_at=datetime.now() + timedelta(seconds=ttl_seconds),
+        )
+
+    async def release(self, doctor_id: int, date_time: datetime, patient_id: int) -> bool:
+        client = await self._redis.connect()
+        deleted = await client.eval(
+            self._RELEASE_SCRIPT,
+            2,
+            self._key(doctor_id, date_time),
+            self.PATIENT_KEY.format(patient_id=patient_id),
+            str(patient_id),
+        )
+        return bool(deleted)
+
+    async def get_holders(self, doctor_id: int, starts: list[datetime]) -> dict[datetime, int]:
+        if not starts:
+            return {}
+        client = await self._redis.connect()
+        values = await client.mget([self._key(doctor_id, start) for start in starts])
+        return {
+            start: int(value)
+            for start, value in zip(starts, values)
+            if value is not None
+        }
+
+    def _key(self, doctor_id: int, date_time: datetime) -> str:
+        return self.KEY.format(
+            doctor_id=doctor_id,
+            start=_slot_start(date_time).isoformat(timespec="minutes"),
+        )
+
+
+def create_slot_hold_store(redis: Optional[RedisConnection] = None) -> ISlotHoldStore:
+    if redis is not None:
+        return RedisSlotHoldStore(redis)
+    return InMemorySlotHoldStore()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Optional
+
+from src.domain.entities.jobs import JobEntity
+from src.domain.interfaces.job_queue import IJobBroker
+from src.infrastructure.jobs.codec import decode_job, encode_job
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.redis import RedisConnection
+
+
+class InMemoryJobBroker(IJobBroker):
+    """Single-process broker; jobs are consumed by the worker running inside the API process."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue[JobEntity] = asyncio.Queue()
+
+    async def publish(self, job: JobEntity) -> None:
+        await self._queue.put(job)
+
+    async def reserve(self, timeout: float = 1.0) -> Optional[JobEntity]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def ack(self, job: JobEntity) -> None:
+        self._queue.task_done()
+
+    async def requeue_stale(self) -> list[JobEntity]:
+        # Reserved jobs only live in this process, so none can outlive their worker
+        return []
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisJobBroker(IJobBroker):
+    """
+    Redis list queue; reserved jobs sit in a processing list until acknowledged.
+
+    Each reservation takes a lease (a sorted set scored by deadline). Jobs whose
+    lease ran out, because their worker died or hung, are moved back to the
+    queue by ``requeue_stale``, so the visibility timeout must exceed the
+    longest job or it may run twice.
+    """
+
+    # Entries reserved moments ago may not have their lease yet; those get one
+    # now instead of being requeued under the worker that just took them.
+    _REQUEUE_SCRIPT = """
+        local requeued = {}
+        for _, raw in ipairs(redis.call('LRANGE', KEYS[1], 0, -1)) do
+            local deadline = redis.call('ZSCORE', KEYS[3], raw)
+            if not deadline then
+                redis.call('ZADD', KEYS[3], ARGV[2], raw)
+            elseif tonumber(deadline) <= tonumber(ARGV[1]) then
+                redis.call('LREM', KEYS[1], 1, raw)
+                redis.call('ZREM', KEYS[3], raw)
+                redis.call('RPUSH', KEYS[2], raw)
+                table.insert(requeued, raw)
+            end
+        end
+        return requeued
+    """
+
+    def __init__(
+            self,
+            redis: RedisConnection,
+            queue_name: str = "jobs",
+            visibility_timeout_seconds: int = 300,
+    ):
+        self._redis = redis
+        self._queue_key = f"{queue_name}:queue"
+        self._processing_key = f"{queue_name}:processing"
+        self._leases_key = f"{queue_name}:leases"
+        self._visibility_timeout_seconds = visibility_timeout_seconds
+        self._reserved: dict[str, str] = {}
+
+    async def publish(self, job: JobEntity) -> None:
+        client = await self._redis.connect()
+        await client.lpush(self._queue_key, encode_job(job))
+
+    async def reserve(self, timeout: float = 1.0) -> Optional[JobEntity]:
+        client = await self._redis.connect()
+        raw = await client.blmove(self._queue_key, self._processing_key, timeout, "RIGHT", "LEFT")
+        if raw is None:
+            return None
+
+        await client.zadd(self._leases_key, {raw: time.time() + self._visibility_timeout_seconds})
+        job = decode_job(raw)
+        self._reserved[job.id] = raw
+        return job
+
+    async def ack(self, job: JobEntity) -> None:
+        raw = self._reserved.pop(job.id, None)
+        if raw is None:
+            return
+        client = await self._redis.connect()
+        await client.lrem(self._processing_key, 1, raw)
+        await client.zrem(self._leases_key, raw)
+
+    async def requeue_stale(self) -> list[JobEntity]:
+        client = await self._redis.connect()
+        now = time.time()
+        requeued = await client.eval(
+            self._REQUEUE_SCRIPT,
+            3,
+            self._processing_key,
+            self._queue_key,
+            self._leases_key,
+            str(now),
+            str(now + self._visibility_timeout_seconds),
+        )
+        return [decode_job(raw) for raw in requeued]
+
+    async def close(self) -> None:
+        # The Redis connection is shared and closed by the application on shutdown.
+        pass
+
+
+class RabbitMQJobBroker(IJobBroker):
+    """Durable RabbitMQ queue; requires the "rabbitmq" extra (aio-pika)."""
+
+    def __init__(self, url: str, queue_name: str = "jobs", prefetch_count: int = 4):
+        self._url = url
+        self._queue_name = queue_name
+        self._prefetch_count = prefetch_count
+        self._connection = None
+        self._channel = None
+        self._queue = None
+        self._reserved: dict[str, object] = {}
+
+    async def _connect(self):
+        if self._queue is None:
+            import aio_pika
+
+            self._connection = await aio_pika.connect_robust(self._url)
+            self._channel = await self._connection.channel()
+            await self._channel.set_qos(prefetch_count=self._prefetch_count)
+            self._queue = await self._channel.declare_queue(self._queue_name, durable=True)
+        return self._queue
+
+    async def publish(self, job: JobEntity) -> None:
+        import aio_pika
+
+        await self._connect()
+        await self._channel.default_exchange.publish(
+            aio_pika.Message(
+                body=encode_job(job).encode(),
+                content_type="application/json",
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=self._queue_name,
+        )
+
+    async def reserve(self, timeout: float = 1.0) -> Optional[JobEntity]:
+        queue = await self._connect()
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            message = await queue.get(no_ack=False, fail=False)
+            if message is not None:
+                job = decode_job(message.body)
+                self._reserved[job.id] = message
+                return job
+            if asyncio.get_running_loop().time() >= deadline:
+                return None
+            await asyncio.sleep(0.1)
+
+    async def ack(self, job: JobEntity) -> None:
+        message = self._reserved.pop(job.id, None)
+        if message is not None:
+            await message.ack()
+
+    async def requeue_stale(self) -> list[JobEntity]:
+        # RabbitMQ redelivers unacknowledged messages itself when a consumer's channel closes
+        return []
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+        self._connection = self._channel = self._queue = None
@@ -0,0 +1,32 @@
+import json
+from datetime import datetime
+
+from src.domain.constants import JobStatus
+from src.domain.entities.jobs import JobEntity
+
+
+def encode_job(job: JobEntity) -> str:
+    return json.dumps({
+        "id": job.id,
+        "kind": job.kind,
+        "payload": job.payload,
+        "status": job.status.value,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+    }, default=str)
+
+
+def decode_job(raw: str | bytes) -> JobEntity:
+    data = json.loads(raw)
+    return JobEntity(
+        id=data["id"],
+        kind=data["kind"],
+        payload=data["payload"],
+        status=JobStatus(data["status"]),
+        result=data.get("result"),
+        error=data.get("error"),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+    )
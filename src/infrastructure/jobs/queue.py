@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
+
+from src.domain.constants import JobStatus
+from src.domain.entities.jobs import JobEntity
+from src.domain.interfaces.job_queue import IJobBroker, IJobStore
+from src.infrastructure.jobs.brokers import InMemoryJobBroker, RabbitMQJobBroker, RedisJobBroker
+from src.infrastructure.jobs.stores import InMemoryJobStore, RedisJobStore
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.redis import RedisConnection
+
+
+class JobQueue:
+    """Publishes jobs to the broker and tracks their status in the job store."""
+
+    def __init__(self, broker: IJobBroker, store: IJobStore):
+        self._broker = broker
+        self._store = store
+
+    async def enqueue(self, kind: str, payload: dict) -> JobEntity:
+        now = datetime.now(timezone.utc)
+        job = JobEntity(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            payload=payload,
+            status=JobStatus.QUEUED,
+            result=None,
+            error=None,
+            created_at=now,
+            updated_at=now,
+        )
+        await self._store.save(job)
+        await self._broker.publish(job)
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[JobEntity]:
+        return await self._store.get(job_id)
+
+    async def reserve(self, timeout: float = 1.0) -> Optional[JobEntity]:
+        job = await self._broker.reserve(timeout=timeout)
+        if job is None:
+            return None
+        return await self._update(job, status=JobStatus.RUNNING)
+
+    async def complete(self, job: JobEntity, result: Optional[dict] = None) -> JobEntity:
+        job = await self._update(job, status=JobStatus.SUCCEEDED, result=result)
+        await self._broker.ack(job)
+        return job
+
+    async def fail(self, job: JobEntity, error: str) -> JobEntity:
+        job = await self._update(job, status=JobStatus.FAILED, error=error)
+        await self._broker.ack(job)
+        return job
+
+    async def requeue_stale(self) -> list[JobEntity]:
+        """Return abandoned reservations to the queue and mark those jobs queued again."""
+        jobs = await self._broker.requeue_stale()
+        return [await self._update(job, status=JobStatus.QUEUED) for job in jobs]
+
+    async def close(self) -> None:
+        await self._broker.close()
+
+    async def _update(self, job: JobEntity, **changes) -> JobEntity:
+        job = replace(job, updated_at=datetime.now(timezone.utc), **changes)
+        await self._store.save(job)
+        return job
+
+
+def create_job_queue(
+        broker: str,
+        redis: Optional[RedisConnection] = None,
+        rabbitmq_url: Optional[str] = None,
+        queue_name: str = "jobs",
+        visibility_timeout_seconds: int = 300,
+) -> JobQueue:
+    if broker == "rabbitmq":
+        if not rabbitmq_url:
+            raise ValueError("JOB_BROKER=rabbitmq requires the RABBITMQ_* settings")
+        job_broker = RabbitMQJobBroker(rabbitmq_url, queue_name=queue_name)
+    elif broker == "redis":
+        if redis is None:
+            raise ValueError("JOB_BROKER=redis requires REDIS_URL")
+        job_broker = RedisJobBroker(
+            redis,
+            queue_name=queue_name,
+            visibility_timeout_seconds=visibility_timeout_seconds,
+        )
+    elif broker == "memory":
+        job_broker = InMemoryJobBroker()
+    else:
+        raise ValueError(f"Unknown job broker: {broker}")
+
+    store = RedisJobStore(redis) if redis is not None else InMemoryJobStore()
+    return JobQueue(broker=job_broker, store=store)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from src.domain.entities.jobs import JobEntity
+from src.domain.interfaces.job_queue import IJobStore
+from src.infrastructure.jobs.codec import decode_job, encode_job
+
+if TYPE_CHECKING:
+    from src.infrastructure.database.redis import RedisConnection
+
+
+class InMemoryJobStore(IJobStore):
+    def __init__(self, max_entries: int = 10_000):
+        self._jobs: dict[str, JobEntity] = {}
+        self._max_entries = max_entries
+
+    async def save(self, job: JobEntity) -> None:
+        self._jobs.pop(job.id, None)
+        self._jobs[job.id] = job
+        while len(self._jobs) > self._max_entries:
+            self._jobs.pop(next(iter(self._jobs)))
+
+    async def get(self, job_id: str) -> Optional[JobEntity]:
+        return self._jobs.get(job_id)
+
+
+class RedisJobStore(IJobStore):
+    KEY = "jobs:status:{job_id}"
+
+    def __init__(self, redis: RedisConnection, ttl_seconds: int = 86400):
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+
+    async def save(self, job: JobEntity) -> None:
+        client = await self._redis.connect()
+        await client.set(self.KEY.format(job_id=job.id), encode_job(job), ex=self._ttl_seconds)
+
+    async def get(self, job_id: str) -> Optional[JobEntity]:
+        client = await self._redis.connect()
+        raw = await client.get(self.KEY.format(job_id=job_id))
+        return decode_job(raw) if raw is not None else None
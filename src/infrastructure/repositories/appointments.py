@@ -1,23 +1,36 @@
 from datetime import datetime, date, timedelta
 from typing import List, Optional
 
-from sqlalchemy import insert, select, update, delete, and_, or_, func
+from sqlalchemy import insert, select, update, delete, and_, or_, func, exists, literal, cast, tuple_, true
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
 from src.domain.constants import AppointmentStatus
 from src.domain.entities.appointments import (
     AppointmentEntity,
     AppointmentWithDetailsEntity,
+    AppointmentStatusCountEntity,
 )
 from src.domain.entities.users import DoctorPatientEntity
+from src.domain.errors import ConflictException
 from src.infrastructure.database.models.users import User
 from src.domain.interfaces.appointment_repository import IAppointmentRepository
 from src.infrastructure.database.models.appointments import Appointment
+from src.infrastructure.database.models.doctor_patients import DoctorPatient
 from src.infrastructure.database.models.doctors import Doctor
+from src.infrastructure.database.models.schedules import Schedule
 from src.use_cases.appointments.dto import CreateAppointmentDTO, UpdateAppointmentDTO
 
 
+BLOCKING_STATUSES = (
+    AppointmentStatus.SCHEDULED,
+    AppointmentStatus.CONFIRMED,
+    AppointmentStatus.IN_PROGRESS,
+)
+EXCLUSION_VIOLATION = "23P01"
+
+
 class AppointmentRepository(IAppointmentRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -34,6 +47,63 @@ class AppointmentRepository(IAppointmentRepository):
         obj = result.scalar_one()
         return self._from_orm(obj)
 
+    async def book_appointment(
+        self, appointment: CreateAppointmentDTO
+    ) -> Optional[AppointmentEntity]:
+        """Insert the appointment only if it fits the doctor's schedule and is free.
+
+        Schedule validation, the overlap check and the insert run as one
+        INSERT ... SELECT, so nothing can book the slot in between. Returns
+        None when the schedule or overlap condition rejects the slot.
+        """
+        payload = appointment.to_payload(exclude_none=True)
+        columns = Appointment.__table__.c
+        slot_start = appointment.date_time
+        slot_end = slot_start + timedelta(minutes=appointment.duration_minutes)
+        slot_time = literal(slot_start.time(), Schedule.start_time.type)
+        requested = func.tstzrange(
+            literal(slot_start, columns.date_time.type),
+            literal(slot_end, columns.date_time.type),
+            "[)",
+        )
+
+        overlapping = select(Appointment.id).where(
+            and_(
+                Appointment.doctor_id == appointment.doctor_id,
+                Appointment.status.in_(BLOCKING_STATUSES),
+                Appointment.time_range.op("&&")(requested),
+            )
+        )
+        source = (
+            select(*[cast(value, columns[key].type) for key, value in payload.items()])
+            .select_from(Schedule)
+            .where(
+                and_(
+                    Schedule.doctor_id == appointment.doctor_id,
+                    Schedule.day_of_week == slot_start.weekday(),
+                    Schedule.is_active == True,
+                    Schedule.start_time <= slot_time,
+                    Schedule.end_time > slot_time,
+                    ~exists(overlapping),
+                )
+            )
+        )
+        stmt = (
+            insert(Appointment)
+            .from_select(list(payload), source)
+            .returning(Appointment)
+        )
+
+        try:
+            result = await self._session.execute(stmt)
+        except IntegrityError as e:
+            self._raise_if_overlap(e)
+            raise
+        obj = result.scalar_one_or_none()
+        if obj is None:
+            return None
+        return self._from_orm(obj)
+
     async def update_appointment(
         self, appointment_id: int, appointment: UpdateAppointmentDTO
     ) -> AppointmentEntity:
@@ -43,7 +113,11 @@ class AppointmentRepository(IAppointmentRepository):
             .values(**appointment.to_payload(exclude_none=True))
             .returning(Appointment)
         )
-        result = await self._session.execute(stmt)
+        try:
+            result = await self._session.execute(stmt)
+        except IntegrityError as e:
+            self._raise_if_overlap(e)
+            raise
         obj = result.scalar_one()
         return self._from_orm(obj)
 
@@ -81,6 +155,7 @@ class AppointmentRepository(IAppointmentRepository):
         status: Optional[AppointmentStatus] = None,
         skip: int = 0,
         limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> List[AppointmentWithDetailsEntity]:
         stmt = (
             select(Appointment)
@@ -95,7 +170,14 @@ class AppointmentRepository(IAppointmentRepository):
         if status:
             stmt = stmt.where(Appointment.status == status)
 
-        stmt = stmt.order_by(Appointment.date_time.desc()).offset(skip).limit(limit)
+        if after:
+            stmt = stmt.where(tuple_(Appointment.date_time, Appointment.id) < after)
+
+        stmt = (
+            stmt.order_by(Appointment.date_time.desc(), Appointment.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
 
         result = await self._session.execute(stmt)
         objects = result.scalars().unique().all()
@@ -109,6 +191,7 @@ class AppointmentRepository(IAppointmentRepository):
         date_to: Optional[date] = None,
         skip: int = 0,
         limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> List[AppointmentWithDetailsEntity]:
         stmt = (
             select(Appointment)
@@ -133,12 +216,63 @@ class AppointmentRepository(IAppointmentRepository):
                 Appointment.date_time <= datetime.combine(date_to, datetime.max.time())
             )
 
-        stmt = stmt.order_by(Appointment.date_time.desc()).offset(skip).limit(limit)
+        if after:
+            stmt = stmt.where(tuple_(Appointment.date_time, Appointment.id) < after)
+
+        stmt = (
+            stmt.order_by(Appointment.date_time.desc(), Appointment.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
 
         result = await self._session.execute(stmt)
         objects = result.scalars().unique().all()
         return [self._from_orm_with_details(obj) for obj in objects]
 
+    async def count_doctor_appointments_by_status(
+        self,
+        doctor_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        by_day: bool = False,
+    ) -> List[AppointmentStatusCountEntity]:
+        """Count a doctor's appointments per status in a single grouped query.
+
+        With ``by_day`` the counts are additionally bucketed by appointment date.
+        """
+        day = func.date(Appointment.date_time).label("day")
+        columns = [Appointment.status, func.count(Appointment.id).label("count")]
+        group_by = [Appointment.status]
+        if by_day:
+            columns.insert(0, day)
+            group_by.insert(0, day)
+
+        stmt = select(*columns).where(Appointment.doctor_id == doctor_id)
+
+        if date_from:
+            stmt = stmt.where(
+                Appointment.date_time >= datetime.combine(date_from, datetime.min.time())
+            )
+
+        if date_to:
+            stmt = stmt.where(
+                Appointment.date_time <= datetime.combine(date_to, datetime.max.time())
+            )
+
+        stmt = stmt.group_by(*group_by)
+        if by_day:
+            stmt = stmt.order_by(day)
+
+        result = await self._session.execute(stmt)
+        return [
+            AppointmentStatusCountEntity(
+                status=row.status,
+                count=row.count,
+                day=row.day if by_day else None,
+            )
+            for row in result.all()
+        ]
+
     async def get_doctor_appointments_for_date(
         self, doctor_id: int, target_date: date
     ) -> List[AppointmentEntity]:
@@ -166,40 +300,60 @@ class AppointmentRepository(IAppointmentRepository):
         objects = result.scalars().all()
         return [self._from_orm(obj) for obj in objects]
 
-    async def check_slot_availability(
-        self, doctor_id: int, date_time: datetime, duration_minutes: int = 30
-    ) -> bool:
-        slot_end = date_time + timedelta(minutes=duration_minutes)
+    async def get_booked_appointments_in_range(
+        self, doctor_ids: List[int], start: datetime, end: datetime
+    ) -> List[AppointmentEntity]:
+        """Fetch appointments that block time in [start, end) for several doctors."""
+        if not doctor_ids:
+            return []
 
         stmt = (
-            select(func.count())
-            .select_from(Appointment)
+            select(Appointment)
             .where(
                 and_(
-                    Appointment.doctor_id == doctor_id,
-                    Appointment.status.in_([
-                        AppointmentStatus.SCHEDULED,
-                        AppointmentStatus.CONFIRMED,
-                    ]),
-                    or_(
-                        and_(
-                            Appointment.date_time <= date_time,
-                            Appointment.date_time
-                            + func.make_interval(0, 0, 0, 0, 0, Appointment.duration_minutes)
-                            > date_time,
-                        ),
-                        and_(
-                            Appointment.date_time < slot_end,
-                            Appointment.date_time >= date_time,
-                        ),
+                    Appointment.doctor_id.in_(doctor_ids),
+                    Appointment.status.in_(BLOCKING_STATUSES),
+                    Appointment.time_range.op("&&")(
+                        func.tstzrange(
+                            literal(start, Appointment.date_time.type),
+                            literal(end, Appointment.date_time.type),
+                            "[)",
+                        )
                     ),
                 )
             )
+            .order_by(Appointment.doctor_id, Appointment.date_time)
         )
 
         result = await self._session.execute(stmt)
-        count = result.scalar_one()
-        return count == 0
+        objects = result.scalars().all()
+        return [self._from_orm(obj) for obj in objects]
+
+    async def check_slot_availability(
+        self,
+        doctor_id: int,
+        date_time: datetime,
+        duration_minutes: int = 30,
+        exclude_appointment_id: Optional[int] = None,
+    ) -> bool:
+        slot_end = date_time + timedelta(minutes=duration_minutes)
+        requested = func.tstzrange(
+            literal(date_time, Appointment.date_time.type),
+            literal(slot_end, Appointment.date_time.type),
+            "[)",
+        )
+
+        conditions = [
+            Appointment.doctor_id == doctor_id,
+            Appointment.status.in_(BLOCKING_STATUSES),
+            Appointment.time_range.op("&&")(requested),
+        ]
+        if exclude_appointment_id is not None:
+            conditions.append(Appointment.id != exclude_appointment_id)
+
+        stmt = select(~exists().where(and_(*conditions)))
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
 
     async def delete_appointment(self, appointment_id: int) -> bool:
         stmt = delete(Appointment).where(Appointment.id == appointment_id)
@@ -244,57 +398,24 @@ class AppointmentRepository(IAppointmentRepository):
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> List[DoctorPatientEntity]:
-        """Get all patients who have appointments with this doctor."""
-        now = datetime.now()
-
-        # Subquery for total appointments per patient with this doctor
-        total_appts_subq = (
-            select(
-                Appointment.patient_id,
-                func.count(Appointment.id).label("total_appointments"),
-                func.max(Appointment.date_time).label("last_appointment_date"),
-            )
-            .where(Appointment.doctor_id == doctor_id)
-            .group_by(Appointment.patient_id)
-            .subquery()
-        )
-
-        # Subquery for upcoming appointments count
-        upcoming_appts_subq = (
-            select(
-                Appointment.patient_id,
-                func.count(Appointment.id).label("upcoming_appointments"),
-            )
-            .where(
-                and_(
-                    Appointment.doctor_id == doctor_id,
-                    Appointment.date_time >= now,
-                    Appointment.status.in_([
-                        AppointmentStatus.SCHEDULED,
-                        AppointmentStatus.CONFIRMED,
-                    ]),
-                )
-            )
-            .group_by(Appointment.patient_id)
-            .subquery()
-        )
-
-        # Main query
-        stmt = (
-            select(
-                User,
-                total_appts_subq.c.total_appointments,
-                total_appts_subq.c.last_appointment_date,
-                func.coalesce(upcoming_appts_subq.c.upcoming_appointments, 0).label("upcoming_appointments"),
-            )
-            .join(total_appts_subq, User.id == total_appts_subq.c.patient_id)
-            .outerjoin(upcoming_appts_subq, User.id == upcoming_appts_subq.c.patient_id)
+        """Get all patients who have appointments with this doctor, most recent first.
+
+        Pages the trigger-maintained doctor_patients summary on
+        ix_doctor_patients_doctor_last_date instead of aggregating appointments.
+        Upcoming counts depend on now(), so they are counted per page row with a
+        LATERAL subquery on ix_appointments_doctor_datetime_status.
+        """
+        page = (
+            select(DoctorPatient)
+            .join(User, DoctorPatient.patient_id == User.id)
+            .where(DoctorPatient.doctor_id == doctor_id)
         )
 
         if search:
             search_pattern = f"%{search}%"
-            stmt = stmt.where(
+            page = page.where(
                 or_(
                     User.full_name.ilike(search_pattern),
                     User.email.ilike(search_pattern),
@@ -302,49 +423,90 @@ class AppointmentRepository(IAppointmentRepository):
                 )
             )
 
-        stmt = stmt.order_by(total_appts_subq.c.last_appointment_date.desc()).offset(skip).limit(limit)
+        if after:
+            page = page.where(
+                tuple_(DoctorPatient.last_appointment_date, DoctorPatient.patient_id) < after
+            )
+
+        page = (
+            page.order_by(
+                DoctorPatient.last_appointment_date.desc(),
+                DoctorPatient.patient_id.desc(),
+            )
+            .offset(skip)
+            .limit(limit)
+            .subquery("page")
+        )
+        doctor_patient = aliased(DoctorPatient, page)
+
+        upcoming = (
+            select(func.count().label("upcoming_appointments"))
+            .where(
+                Appointment.doctor_id == doctor_patient.doctor_id,
+                Appointment.patient_id == doctor_patient.patient_id,
+                Appointment.date_time >= func.now(),
+                Appointment.status.in_([AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]),
+            )
+            .lateral("upcoming")
+        )
+
+        stmt = (
+            select(User, doctor_patient, upcoming.c.upcoming_appointments)
+            .select_from(doctor_patient)
+            .join(User, doctor_patient.patient_id == User.id)
+            .join(upcoming, true())
+            .order_by(
+                doctor_patient.last_appointment_date.desc(),
+                doctor_patient.patient_id.desc(),
+            )
+        )
 
         result = await self._session.execute(stmt)
-        rows = result.all()
 
         return [
             DoctorPatientEntity(
-                id=row.User.id,
-                email=row.User.email,
-                full_name=row.User.full_name,
-                phone=row.User.phone,
-                total_appointments=row.total_appointments,
-                last_appointment_date=row.last_appointment_date,
-                upcoming_appointments=row.upcoming_appointments,
+                id=user.id,
+                email=user.email,
+                full_name=user.full_name,
+                phone=user.phone,
+                total_appointments=summary.total_appointments,
+                last_appointment_date=summary.last_appointment_date,
+                upcoming_appointments=upcoming_appointments,
             )
-            for row in rows
+            for user, summary, upcoming_appointments in result.all()
         ]
 
     async def count_doctor_patients(self, doctor_id: int) -> int:
-        """Count distinct patients for a doctor."""
-        stmt = (
-            select(func.count(func.distinct(Appointment.patient_id)))
-            .where(Appointment.doctor_id == doctor_id)
-        )
+        """Count distinct patients for a doctor (denormalized doctors.patients_count)."""
+        stmt = select(Doctor.patients_count).where(Doctor.id == doctor_id)
         result = await self._session.execute(stmt)
-        return result.scalar_one()
+        return result.scalar_one_or_none() or 0
 
     async def count_doctor_appointments(
         self,
         doctor_id: int,
         status: Optional[AppointmentStatus] = None,
     ) -> int:
-        """Count appointments for a doctor."""
+        """Count appointments for a doctor; the unfiltered total is read from doctors.appointments_count."""
+        if status is None:
+            result = await self._session.execute(
+                select(Doctor.appointments_count).where(Doctor.id == doctor_id)
+            )
+            return result.scalar_one_or_none() or 0
+
         stmt = (
             select(func.count())
             .select_from(Appointment)
-            .where(Appointment.doctor_id == doctor_id)
+            .where(Appointment.doctor_id == doctor_id, Appointment.status == status)
         )
-        if status:
-            stmt = stmt.where(Appointment.status == status)
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    @staticmethod
+    def _raise_if_overlap(error: IntegrityError) -> None:
+        if getattr(error.orig, "sqlstate", None) == EXCLUSION_VIOLATION:
+            raise ConflictException("This time slot is already booked") from error
+
     @staticmethod
     def _from_orm(obj: Appointment) -> AppointmentEntity:
         return AppointmentEntity(
@@ -1,11 +1,13 @@
+from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import insert, select, func
+from sqlalchemy import insert, select, update, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.chat_messages import ChatMessageEntity
 from src.domain.interfaces.chat_message_repository import IChatMessageRepository
 from src.infrastructure.database.models.chat_messages import ChatMessage
+from src.infrastructure.database.models.chat_sessions import ChatSession
 from src.use_cases.chat.dto import CreateChatMessageDTO
 
 
@@ -36,11 +38,13 @@ class ChatMessageRepository(IChatMessageRepository):
         session_id: int,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> List[ChatMessageEntity]:
+        stmt = select(ChatMessage).where(ChatMessage.session_id == session_id)
+        if after:
+            stmt = stmt.where(tuple_(ChatMessage.created_at, ChatMessage.id) > after)
         stmt = (
-            select(ChatMessage)
-            .where(ChatMessage.session_id == session_id)
-            .order_by(ChatMessage.created_at)
+            stmt.order_by(ChatMessage.created_at, ChatMessage.id)
             .offset(skip)
             .limit(limit)
         )
@@ -48,14 +52,48 @@ class ChatMessageRepository(IChatMessageRepository):
         objects = result.scalars().all()
         return [self._from_orm(obj) for obj in objects]
 
-    async def count_messages_by_session_id(self, session_id: int) -> int:
+    async def get_messages_after(
+        self,
+        session_id: int,
+        after_id: int,
+        limit: int = 100,
+    ) -> List[ChatMessageEntity]:
+        """Oldest-first messages with id greater than ``after_id`` (ix_chat_messages_session_created)."""
         stmt = (
-            select(func.count())
-            .select_from(ChatMessage)
-            .where(ChatMessage.session_id == session_id)
+            select(ChatMessage)
+            .where(ChatMessage.session_id == session_id, ChatMessage.id > after_id)
+            .order_by(ChatMessage.created_at, ChatMessage.id)
+            .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return result.scalar_one()
+        objects = result.scalars().all()
+        return [self._from_orm(obj) for obj in objects]
+
+    async def get_recent_messages(
+        self,
+        session_id: int,
+        after_id: Optional[int] = None,
+        limit: int = 200,
+    ) -> List[ChatMessageEntity]:
+        stmt = select(ChatMessage).where(ChatMessage.session_id == session_id)
+        if after_id is not None:
+            stmt = stmt.where(ChatMessage.id > after_id)
+        stmt = stmt.order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc()).limit(limit)
+        result = await self._session.execute(stmt)
+        objects = result.scalars().all()
+        return [self._from_orm(obj) for obj in reversed(objects)]
+
+    async def update_content_tokens(self, counts: dict[int, int]) -> None:
+        if counts:
+            await self._session.execute(
+                update(ChatMessage),
+                [{"id": message_id, "content_tokens": count} for message_id, count in counts.items()],
+            )
+
+    async def count_messages_by_session_id(self, session_id: int) -> int:
+        stmt = select(ChatSession.message_count).where(ChatSession.id == session_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() or 0
 
     @staticmethod
     def _from_orm(obj: ChatMessage) -> ChatMessageEntity:
@@ -68,6 +106,7 @@ class ChatMessageRepository(IChatMessageRepository):
             prompt_version=obj.prompt_version,
             token_input=obj.token_input,
             token_output=obj.token_output,
+            content_tokens=obj.content_tokens,
             latency_ms=obj.latency_ms,
             session_id=obj.session_id,
             created_at=obj.created_at,
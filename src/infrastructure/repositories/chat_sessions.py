@@ -1,19 +1,21 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from sqlalchemy import insert, select, update, delete, func
+from sqlalchemy import insert, select, update, delete, func, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased
 
 from src.domain.constants import ChatSessionStatus
 from src.domain.entities.chat_messages import ChatMessageEntity
 from src.domain.entities.chat_sessions import (
     ChatSessionEntity,
+    ChatSessionInboxEntity,
     ChatSessionWithMessagesEntity,
 )
 from src.domain.interfaces.chat_session_repository import IChatSessionRepository
 from src.infrastructure.database.models.chat_sessions import ChatSession
 from src.infrastructure.database.models.chat_messages import ChatMessage
+from src.infrastructure.database.models.triage_runs import TriageRun
 from src.use_cases.chat.dto import CreateChatSessionDTO, UpdateChatSessionDTO
 
 
@@ -53,19 +55,39 @@ class ChatSessionRepository(IChatSessionRepository):
         return self._from_orm(obj)
 
     async def get_session_with_messages(
-        self, session_id: int
+        self,
+        session_id: int,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
     ) -> Optional[ChatSessionWithMessagesEntity]:
-        stmt = (
-            select(ChatSession)
-            .options(joinedload(ChatSession.messages))
-            .where(ChatSession.id == session_id)
-        )
+        """
+        Session row plus its transcript, loaded by a second query on
+        ix_chat_messages_session_created instead of a joinedload that repeats the
+        session columns per message. With ``limit`` only the last N messages
+        (older than ``before_id`` when given) are returned, oldest first.
+        """
+        stmt = select(ChatSession).where(ChatSession.id == session_id)
         result = await self._session.execute(stmt)
-        # Need .unique() when using joinedload with collections
-        obj = result.unique().scalar_one_or_none()
+        obj = result.scalar_one_or_none()
         if obj is None:
             return None
-        return self._from_orm_with_messages(obj)
+
+        stmt = select(ChatMessage).where(ChatMessage.session_id == session_id)
+        if before_id is not None:
+            stmt = stmt.where(ChatMessage.id < before_id)
+
+        if limit is None:
+            stmt = stmt.order_by(ChatMessage.created_at, ChatMessage.id)
+            result = await self._session.execute(stmt)
+            return self._from_orm_with_messages(obj, result.scalars().all())
+
+        # One extra row tells whether there is anything left to page back into
+        stmt = stmt.order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc()).limit(limit + 1)
+        result = await self._session.execute(stmt)
+        rows = result.scalars().all()
+        return self._from_orm_with_messages(
+            obj, list(reversed(rows[:limit])), has_earlier=len(rows) > limit
+        )
 
     async def get_sessions_by_user_id(
         self,
@@ -73,17 +95,79 @@ class ChatSessionRepository(IChatSessionRepository):
         status: Optional[ChatSessionStatus] = None,
         skip: int = 0,
         limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
     ) -> List[ChatSessionEntity]:
-        stmt = select(ChatSession).where(ChatSession.user_id == user_id)
+        stmt = self._user_sessions_stmt(user_id, status, skip, limit, after)
+        result = await self._session.execute(stmt)
+        objects = result.scalars().all()
+        return [self._from_orm(obj) for obj in objects]
 
-        if status:
-            stmt = stmt.where(ChatSession.status == status)
+    async def get_session_inbox_by_user_id(
+        self,
+        user_id: int,
+        status: Optional[ChatSessionStatus] = None,
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[tuple[datetime, int]] = None,
+        preview_length: int = 120,
+    ) -> List[ChatSessionInboxEntity]:
+        """
+        One page of sessions with their last message snippet, message count and
+        latest triage urgency. The page is cut first, then LATERAL subqueries on
+        ix_chat_messages_session_created / ix_triage_runs_session_created run once
+        per session on it; the count comes from the denormalized message_count.
+        """
+        page = self._user_sessions_stmt(user_id, status, skip, limit, after).subquery("page")
+        chat_session = aliased(ChatSession, page)
 
-        stmt = stmt.order_by(ChatSession.created_at.desc()).offset(skip).limit(limit)
+        last_message = (
+            select(
+                func.left(ChatMessage.content, preview_length).label("preview"),
+                ChatMessage.role.label("role"),
+            )
+            .where(ChatMessage.session_id == chat_session.id)
+            .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+            .limit(1)
+            .lateral("last_message")
+        )
+        latest_triage = (
+            select(TriageRun.urgency.label("urgency"))
+            .where(TriageRun.session_id == chat_session.id)
+            .order_by(TriageRun.created_at.desc(), TriageRun.id.desc())
+            .limit(1)
+            .lateral("latest_triage")
+        )
 
+        stmt = (
+            select(
+                chat_session,
+                last_message.c.preview,
+                last_message.c.role,
+                latest_triage.c.urgency,
+            )
+            .select_from(chat_session)
+            .outerjoin(last_message, true())
+            .outerjoin(latest_triage, true())
+            .order_by(chat_session.created_at.desc(), chat_session.id.desc())
+        )
         result = await self._session.execute(stmt)
-        objects = result.scalars().all()
-        return [self._from_orm(obj) for obj in objects]
+        return [
+            ChatSessionInboxEntity(
+                id=obj.id,
+                status=obj.status,
+                source=obj.source,
+                locale=obj.locale,
+                last_message_at=obj.last_message_at,
+                user_id=obj.user_id,
+                created_at=obj.created_at,
+                updated_at=obj.updated_at,
+                message_count=obj.message_count,
+                last_message_preview=preview,
+                last_message_role=role,
+                latest_urgency=urgency,
+            )
+            for obj, preview, role, urgency in result.all()
+        ]
 
     async def close_session(self, session_id: int) -> ChatSessionEntity:
         stmt = (
@@ -110,6 +194,28 @@ class ChatSessionRepository(IChatSessionRepository):
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    @staticmethod
+    def _user_sessions_stmt(
+        user_id: int,
+        status: Optional[ChatSessionStatus],
+        skip: int,
+        limit: int,
+        after: Optional[tuple[datetime, int]],
+    ):
+        stmt = select(ChatSession).where(ChatSession.user_id == user_id)
+
+        if status:
+            stmt = stmt.where(ChatSession.status == status)
+
+        if after:
+            stmt = stmt.where(tuple_(ChatSession.created_at, ChatSession.id) < after)
+
+        return (
+            stmt.order_by(ChatSession.created_at.desc(), ChatSession.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
     @staticmethod
     def _from_orm(obj: ChatSession) -> ChatSessionEntity:
         return ChatSessionEntity(
@@ -135,17 +241,18 @@ class ChatSessionRepository(IChatSessionRepository):
             prompt_version=obj.prompt_version,
             token_input=obj.token_input,
             token_output=obj.token_output,
+            content_tokens=obj.content_tokens,
             latency_ms=obj.latency_ms,
             session_id=obj.session_id,
             created_at=obj.created_at,
         )
 
     @staticmethod
-    def _from_orm_with_messages(obj: ChatSession) -> ChatSessionWithMessagesEntity:
-        messages = [
-            ChatSessionRepository._from_orm_message(msg)
-            for msg in obj.messages
-        ]
+    def _from_orm_with_messages(
+        obj: ChatSession,
+        messages: Sequence[ChatMessage],
+        has_earlier: bool = False,
+    ) -> ChatSessionWithMessagesEntity:
         return ChatSessionWithMessagesEntity(
             id=obj.id,
             status=obj.status,
@@ -156,5 +263,6 @@ class ChatSessionRepository(IChatSessionRepository):
             user_id=obj.user_id,
             created_at=obj.created_at,
             updated_at=obj.updated_at,
-            messages=messages,
+            messages=[ChatSessionRepository._from_orm_message(msg) for msg in messages],
+            has_earlier=has_earlier,
         )
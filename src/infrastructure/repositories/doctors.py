@@ -1,15 +1,17 @@
 from abc import ABC
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import insert, select, update, delete, func
+from sqlalchemy import insert, select, update, delete, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from src.domain.constants import DoctorStatus
-from src.domain.entities.doctors import DoctorEntity, DoctorWithDetailsEntity
+from src.domain.entities.doctors import DoctorEntity, DoctorMatchEntity, DoctorWithDetailsEntity
 from src.domain.interfaces.doctor_repository import IDoctorRepository
-from src.infrastructure.database.models.doctors import Doctor
-from src.use_cases.doctors.dto import CreateDoctorDTO, UpdateDoctorDTO
+from src.infrastructure.database.models.doctors import DOCTOR_MATCH_SCORE, Doctor
+from src.infrastructure.database.models.schedules import Schedule
+from src.use_cases.doctors.dto import CreateDoctorDTO, DoctorMatchWeightsDTO, UpdateDoctorDTO
 
 
 class DoctorRepository(IDoctorRepository, ABC):
@@ -73,12 +75,26 @@ class DoctorRepository(IDoctorRepository, ABC):
             return None
         return self._from_orm_with_details(obj)
 
+    async def get_doctors_by_ids(self, doctor_ids: list[int]) -> list[DoctorWithDetailsEntity]:
+        if not doctor_ids:
+            return []
+
+        stmt = (
+            select(Doctor)
+            .options(joinedload(Doctor.user), joinedload(Doctor.specialization))
+            .where(Doctor.id.in_(set(doctor_ids)))
+        )
+        result = await self._session.execute(stmt)
+        doctors = result.scalars().unique().all()
+        return [self._from_orm_with_details(d) for d in doctors]
+
     async def get_all_doctors(
             self,
             status: Optional[DoctorStatus] = None,
             specialization_id: Optional[int] = None,
             skip: int = 0,
             limit: int = 10,
+            after_id: Optional[int] = None,
     ) -> list[DoctorWithDetailsEntity]:
         stmt = (
             select(Doctor)
@@ -88,7 +104,9 @@ class DoctorRepository(IDoctorRepository, ABC):
             stmt = stmt.where(Doctor.status == status)
         if specialization_id:
             stmt = stmt.where(Doctor.specialization_id == specialization_id)
-        stmt = stmt.offset(skip).limit(limit)
+        if after_id:
+            stmt = stmt.where(Doctor.id > after_id)
+        stmt = stmt.order_by(Doctor.id).offset(skip).limit(limit)
         result = await self._session.execute(stmt)
         doctors = result.scalars().unique().all()
         return [self._from_orm_with_details(d) for d in doctors]
@@ -104,6 +122,76 @@ class DoctorRepository(IDoctorRepository, ABC):
         doctors = result.scalars().unique().all()
         return [self._from_orm_with_details(d) for d in doctors]
 
+    async def get_ranked_doctors(
+            self,
+            specialization_id: int,
+            weights: DoctorMatchWeightsDTO,
+            skip: int = 0,
+            limit: int = 10,
+    ) -> list[DoctorMatchEntity]:
+        """
+        Approved doctors of a specialization ordered by match score, best first.
+
+        With default weights the ORDER BY is exactly the indexed expression, so
+        top-K reads come straight off ix_doctors_specialization_match_score;
+        custom weights still sort in Postgres over that specialization only.
+        """
+        has_availability = (
+            select(Schedule.id)
+            .where(Schedule.doctor_id == Doctor.id, Schedule.is_active.is_(True))
+            .exists()
+        )
+        if weights.is_default:
+            score = DOCTOR_MATCH_SCORE
+        else:
+            score = (
+                Doctor.rating * 10 * weights.rating
+                + func.least(Doctor.experience_years * 2, 20) * weights.experience
+                + case((has_availability, 10), else_=0) * weights.availability
+            )
+
+        stmt = (
+            select(Doctor, score.label("score"), has_availability.label("has_availability"))
+            .options(joinedload(Doctor.user), joinedload(Doctor.specialization))
+            .where(
+                Doctor.specialization_id == specialization_id,
+                Doctor.status == DoctorStatus.APPROVED,
+            )
+            .order_by(score.desc(), Doctor.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            DoctorMatchEntity(
+                doctor=self._from_orm_with_details(doctor),
+                score=float(row_score),
+                has_availability=bool(available),
+            )
+            for doctor, row_score, available in result.unique().all()
+        ]
+
+    async def get_doctors_for_scoring(
+            self,
+            updated_since: Optional[datetime] = None,
+    ) -> list[DoctorEntity]:
+        """
+        Approved doctors for a full scoring snapshot, or every doctor changed
+        after ``updated_since`` (any status, so demotions can be applied).
+        """
+        stmt = select(Doctor)
+        if updated_since is None:
+            stmt = stmt.where(Doctor.status == DoctorStatus.APPROVED)
+        else:
+            stmt = stmt.where(Doctor.updated_at > updated_since)
+        result = await self._session.execute(stmt)
+        return [self._from_orm(d) for d in result.scalars().all()]
+
+    async def get_approved_doctor_ids(self) -> set[int]:
+        stmt = select(Doctor.id).where(Doctor.status == DoctorStatus.APPROVED)
+        result = await self._session.execute(stmt)
+        return set(result.scalars().all())
+
     async def delete_doctor(self, doctor_id: int) -> bool:
         stmt = delete(Doctor).where(Doctor.id == doctor_id)
         result = await self._session.execute(stmt)
@@ -1,14 +1,16 @@
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import insert, select, update, delete, func, or_
+from sqlalchemy import insert, select, update, delete, func, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from src.domain.entities.medical_records import MedicalRecordEntity, MedicalRecordWithDetailsEntity
 from src.domain.interfaces.medical_record_repositories import IMedicalRecordRepository
 from src.infrastructure.database.models.doctors import Doctor
-from src.infrastructure.database.models.medical_records import MedicalRecord
+from src.infrastructure.database.models.medical_records import MedicalRecord, SEARCH_CONFIG
 from src.infrastructure.database.models.users import User
+from src.infrastructure.utilities.search import prefix_tsquery
 from src.use_cases.medical_records.dto import CreateMedicalRecordDTO, UpdateMedicalRecordDTO
 
 
@@ -66,7 +68,12 @@ class MedicalRecordRepository(IMedicalRecordRepository):
         return self._from_orm_with_details(obj)
 
     async def get_medical_records_by_patient_id(
-            self, patient_id: int, skip: int = 0, limit: int = 20
+            self,
+            patient_id: int,
+            skip: int = 0,
+            limit: int = 20,
+            after: Optional[tuple[datetime, int]] = None,
+            doctor_id: Optional[int] = None,
     ) -> list[MedicalRecordWithDetailsEntity]:
         stmt = (
             select(MedicalRecord)
@@ -76,7 +83,13 @@ class MedicalRecordRepository(IMedicalRecordRepository):
                 joinedload(MedicalRecord.doctor).joinedload(Doctor.specialization),
             )
             .where(MedicalRecord.patient_id == patient_id)
-            .order_by(MedicalRecord.created_at.desc())
+        )
+        if doctor_id:
+            stmt = stmt.where(MedicalRecord.doctor_id == doctor_id)
+        if after:
+            stmt = stmt.where(tuple_(MedicalRecord.created_at, MedicalRecord.id) < after)
+        stmt = (
+            stmt.order_by(MedicalRecord.created_at.desc(), MedicalRecord.id.desc())
             .offset(skip)
             .limit(limit)
         )
@@ -89,7 +102,8 @@ class MedicalRecordRepository(IMedicalRecordRepository):
             doctor_id: int,
             search: Optional[str] = None,
             skip: int = 0,
-            limit: int = 20
+            limit: int = 20,
+            after: Optional[tuple[datetime, int]] = None,
     ) -> list[MedicalRecordWithDetailsEntity]:
         stmt = (
             select(MedicalRecord)
@@ -103,15 +117,23 @@ class MedicalRecordRepository(IMedicalRecordRepository):
         )
 
         if search:
-            search_pattern = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    User.full_name.ilike(search_pattern),
-                    MedicalRecord.diagnosis.ilike(search_pattern),
+            # Patient name via the trigram index, record text via the search_vector GIN index
+            conditions = [User.full_name.ilike(f"%{search}%")]
+            query_text = prefix_tsquery(search)
+            if query_text is not None:
+                conditions.append(
+                    MedicalRecord.search_vector.op("@@")(func.to_tsquery(SEARCH_CONFIG, query_text))
                 )
-            )
+            stmt = stmt.where(or_(*conditions))
 
-        stmt = stmt.order_by(MedicalRecord.created_at.desc()).offset(skip).limit(limit)
+        if after:
+            stmt = stmt.where(tuple_(MedicalRecord.created_at, MedicalRecord.id) < after)
+
+        stmt = (
+            stmt.order_by(MedicalRecord.created_at.desc(), MedicalRecord.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self._session.execute(stmt)
         objects = result.scalars().unique().all()
         return [self._from_orm_with_details(obj) for obj in objects]
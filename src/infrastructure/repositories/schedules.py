@@ -80,6 +80,25 @@ class ScheduleRepository(IScheduleRepository):
         objects = result.scalars().all()
         return [self._from_orm(obj) for obj in objects]
 
+    async def get_active_schedules_by_doctor_ids(
+            self, doctor_ids: list[int]
+    ) -> list[ScheduleEntity]:
+        if not doctor_ids:
+            return []
+        stmt = (
+            select(Schedule)
+            .where(
+                and_(
+                    Schedule.doctor_id.in_(doctor_ids),
+                    Schedule.is_active == True,
+                )
+            )
+            .order_by(Schedule.doctor_id, Schedule.day_of_week, Schedule.start_time)
+        )
+        result = await self._session.execute(stmt)
+        objects = result.scalars().all()
+        return [self._from_orm(obj) for obj in objects]
+
     async def delete_schedule(self, schedule_id: int) -> bool:
         stmt = delete(Schedule).where(Schedule.id == schedule_id)
         result = await self._session.execute(stmt)
@@ -0,0 +1,155 @@
+from typing import Optional
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.constants import DoctorStatus
+from src.infrastructure.database.models.doctor_patients import DoctorPatient
+from src.infrastructure.database.models.doctors import Doctor
+from src.infrastructure.database.models.medical_records import MedicalRecord, SEARCH_CONFIG
+from src.infrastructure.database.models.specializations import Specialization
+from src.infrastructure.database.models.users import User
+from src.infrastructure.utilities.search import (
+    SENTINEL_START,
+    SENTINEL_STOP,
+    highlight,
+    prefix_tsquery,
+    sentinels_to_html,
+)
+from src.use_cases.search.dto import SearchHitDTO
+
+HEADLINE_OPTIONS = (
+    f'StartSel="{SENTINEL_START}", StopSel="{SENTINEL_STOP}", MaxFragments=2, MaxWords=20, MinWords=5'
+)
+
+
+class SearchRepository:
+    """
+    Relevance-ordered lookups: users by pg_trgm similarity on the GIN trigram
+    indexes, medical records by ts_rank_cd over the weighted search_vector.
+    Titles and snippets are HTML-escaped, with only the highlight tags as markup.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def search_patients(
+            self,
+            term: str,
+            doctor_id: Optional[int] = None,
+            limit: int = 10,
+    ) -> list[SearchHitDTO]:
+        """Users matching ``term``; with ``doctor_id`` only that doctor's patients."""
+        pattern = f"%{term}%"
+        score = func.greatest(
+            func.similarity(User.full_name, term),
+            func.similarity(User.email, term),
+            func.similarity(func.coalesce(User.phone, ""), term),
+        ).label("score")
+        stmt = select(User, score).where(
+            or_(
+                User.full_name.ilike(pattern),
+                User.email.ilike(pattern),
+                User.phone.ilike(pattern),
+                User.full_name.op("%")(term),
+            )
+        )
+        if doctor_id is not None:
+            stmt = stmt.join(DoctorPatient, DoctorPatient.patient_id == User.id).where(
+                DoctorPatient.doctor_id == doctor_id
+            )
+        stmt = stmt.order_by(score.desc(), User.id).limit(limit)
+
+        result = await self._session.execute(stmt)
+        return [
+            SearchHitDTO(
+                id=row.User.id,
+                title=highlight(row.User.full_name, term),
+                snippet=highlight(" · ".join(filter(None, [row.User.email, row.User.phone])), term),
+                score=float(row.score),
+            )
+            for row in result.all()
+        ]
+
+    async def search_doctors(
+            self,
+            term: str,
+            approved_only: bool = True,
+            limit: int = 10,
+    ) -> list[SearchHitDTO]:
+        """Doctors whose name or specialization matches ``term``."""
+        pattern = f"%{term}%"
+        score = func.greatest(
+            func.similarity(User.full_name, term),
+            func.similarity(Specialization.title, term),
+        ).label("score")
+        stmt = (
+            select(Doctor.id, User.full_name, Specialization.title, score)
+            .join(User, User.id == Doctor.user_id)
+            .join(Specialization, Specialization.id == Doctor.specialization_id)
+            .where(
+                or_(
+                    User.full_name.ilike(pattern),
+                    User.full_name.op("%")(term),
+                    Specialization.title.ilike(pattern),
+                )
+            )
+        )
+        if approved_only:
+            stmt = stmt.where(Doctor.status == DoctorStatus.APPROVED)
+        stmt = stmt.order_by(score.desc(), Doctor.id).limit(limit)
+
+        result = await self._session.execute(stmt)
+        return [
+            SearchHitDTO(
+                id=row.id,
+                title=highlight(row.full_name, term),
+                snippet=highlight(row.title, term),
+                score=float(row.score),
+            )
+            for row in result.all()
+        ]
+
+    async def search_medical_records(
+            self,
+            term: str,
+            doctor_id: Optional[int] = None,
+            limit: int = 10,
+    ) -> list[SearchHitDTO]:
+        """Records whose diagnosis, prescription or notes match every word of ``term`` as a prefix."""
+        query_text = prefix_tsquery(term)
+        if query_text is None:
+            return []
+
+        query = func.to_tsquery(SEARCH_CONFIG, query_text)
+        rank = func.ts_rank_cd(MedicalRecord.search_vector, query).label("score")
+        stmt = select(
+            MedicalRecord.id,
+            MedicalRecord.diagnosis,
+            MedicalRecord.prescription,
+            MedicalRecord.notes,
+            rank,
+        ).where(MedicalRecord.search_vector.op("@@")(query))
+        if doctor_id is not None:
+            stmt = stmt.where(MedicalRecord.doctor_id == doctor_id)
+        top = stmt.order_by(rank.desc(), MedicalRecord.id.desc()).limit(limit).subquery()
+
+        # ts_headline re-parses the text, so it only runs on the top rows
+        document = func.concat_ws(" ", top.c.diagnosis, top.c.prescription, top.c.notes)
+        stmt = select(
+            top.c.id,
+            top.c.diagnosis,
+            top.c.score,
+            func.ts_headline(SEARCH_CONFIG, document, query, HEADLINE_OPTIONS).label("snippet"),
+        ).order_by(top.c.score.desc(), top.c.id.desc())
+
+        result = await self._session.execute(stmt)
+        return [
+            SearchHitDTO(
+                id=row.id,
+                title=highlight(row.diagnosis, term),
+                snippet=sentinels_to_html(row.snippet),
+                score=float(row.score),
+            )
+            for row in result.all()
+        ]
@@ -1,9 +1,8 @@
-from sqlalchemy import insert, select, update, delete, func
+from sqlalchemy import insert, select, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.specializations import SpecializationEntity, SpecializationWithCountEntity
 from src.domain.interfaces.specialization_repository import ISpecializationRepository
-from src.infrastructure.database.models.doctors import Doctor
 from src.infrastructure.database.models.specializations import Specialization
 from src.use_cases.specializations.dto import CreateSpecializationDTO, UpdateSpecializationDTO
 
@@ -58,26 +57,19 @@ class SpecializationRepository(ISpecializationRepository):
         return [self._from_orm(obj) for obj in objects]
 
     async def get_all_specializations_with_count(self) -> list[SpecializationWithCountEntity]:
-        stmt = (
-            select(
-                Specialization,
-                func.count(Doctor.id).label("doctors_count")
-            )
-            .outerjoin(Doctor, Doctor.specialization_id == Specialization.id)
-            .group_by(Specialization.id)
-            .order_by(Specialization.title)
-        )
+        stmt = select(Specialization).order_by(Specialization.title)
         result = await self._session.execute(stmt)
-        rows = result.all()
+        objects = result.scalars().all()
         return [
             SpecializationWithCountEntity(
-                id=row.Specialization.id,
-                title=row.Specialization.title,
-                slug=row.Specialization.slug,
-                description=row.Specialization.description,
-                doctors_count=row.doctors_count,
+                id=obj.id,
+                title=obj.title,
+                slug=obj.slug,
+                description=obj.description,
+                doctors_count=obj.doctors_count,
+                approved_doctors_count=obj.approved_doctors_count,
             )
-            for row in rows
+            for obj in objects
         ]
 
     async def delete_specialization(self, specialization_id: int) -> bool:
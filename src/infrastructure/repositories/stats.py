@@ -0,0 +1,208 @@
+from datetime import date, datetime
+from typing import Literal, Optional
+
+import sqlalchemy as sa
+from sqlalchemy import delete, exists, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.constants import AppointmentStatus, DoctorStatus
+from src.infrastructure.database.models.admin_stats_snapshots import AdminStatsSnapshot
+from src.infrastructure.database.models.appointments import Appointment
+from src.infrastructure.database.models.chat_messages import ChatMessage
+from src.infrastructure.database.models.chat_sessions import ChatSession
+from src.infrastructure.database.models.doctor_patients import DoctorPatient
+from src.infrastructure.database.models.doctors import Doctor
+from src.infrastructure.database.models.medical_records import MedicalRecord
+from src.infrastructure.database.models.specializations import Specialization
+from src.infrastructure.database.models.users import User
+from src.use_cases.stats.dto import AdminStatsDTO
+
+SNAPSHOT_ID = 1
+
+
+class StatsRepository:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    @staticmethod
+    def _admin_counts_select() -> sa.Select:
+        """All dashboard counters in one statement; appointments are scanned once using FILTER."""
+        today = sa.literal_column("CURRENT_DATE")
+        tomorrow = sa.literal_column("CURRENT_DATE + 1")
+        bookings = (
+            select(
+                func.count().label("total_bookings"),
+                func.count().filter(
+                    Appointment.date_time >= today, Appointment.date_time < tomorrow
+                ).label("today_bookings"),
+                func.count().filter(
+                    Appointment.status == AppointmentStatus.SCHEDULED
+                ).label("pending_bookings"),
+                func.count().filter(
+                    Appointment.status == AppointmentStatus.COMPLETED
+                ).label("completed_bookings"),
+            )
+            .select_from(Appointment)
+            .subquery()
+        )
+        return select(
+            select(func.count()).select_from(User).scalar_subquery().label("total_users"),
+            select(func.count()).select_from(Doctor).scalar_subquery().label("total_doctors"),
+            bookings.c.total_bookings,
+            bookings.c.today_bookings,
+            bookings.c.pending_bookings,
+            bookings.c.completed_bookings,
+            select(func.count()).select_from(MedicalRecord).scalar_subquery().label("total_emrs"),
+        ).select_from(bookings)
+
+    async def get_admin_stats(self) -> AdminStatsDTO:
+        result = await self._session.execute(self._admin_counts_select())
+        return AdminStatsDTO(**result.mappings().one())
+
+    async def get_snapshot(self) -> Optional[AdminStatsDTO]:
+        stmt = select(AdminStatsSnapshot).where(AdminStatsSnapshot.id == SNAPSHOT_ID)
+        result = await self._session.execute(stmt)
+        obj = result.scalar_one_or_none()
+        if obj is None:
+            return None
+        return self._from_orm(obj)
+
+    async def refresh_snapshot(self) -> AdminStatsDTO:
+        counts = self._admin_counts_select().subquery()
+        columns = [c.name for c in counts.c]
+        stmt = insert(AdminStatsSnapshot).from_select(
+            ["id", *columns, "refreshed_at"],
+            # WHERE TRUE keeps ON CONFLICT from being parsed as part of the FROM clause
+            select(literal(SNAPSHOT_ID), *counts.c, func.now()).where(sa.true()),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AdminStatsSnapshot.id],
+            set_={name: stmt.excluded[name] for name in [*columns, "refreshed_at"]},
+        ).returning(AdminStatsSnapshot)
+        result = await self._session.execute(stmt)
+        return self._from_orm(result.scalar_one())
+
+    async def get_booking_trends(
+            self,
+            start: datetime,
+            end: datetime,
+            bucket: Literal["day", "week"] = "day",
+    ) -> dict[date, int]:
+        bucket_start = sa.cast(func.date_trunc(bucket, Appointment.date_time), sa.Date).label("bucket_start")
+        stmt = (
+            select(bucket_start, func.count())
+            .where(Appointment.date_time >= start, Appointment.date_time < end)
+            .group_by(bucket_start)
+        )
+        result = await self._session.execute(stmt)
+        return {row[0]: row[1] for row in result.all()}
+
+    async def repair_counters(self) -> dict[str, int]:
+        """
+        Recompute the trigger-maintained counters from their source tables, one
+        aggregate pass per table. Returns how many rows had drifted per table.
+        """
+        specializations = (
+            select(
+                Specialization.id,
+                func.count(Doctor.id).label("doctors_count"),
+                func.count(Doctor.id).filter(
+                    Doctor.status == DoctorStatus.APPROVED
+                ).label("approved_doctors_count"),
+            )
+            .outerjoin(Doctor, Doctor.specialization_id == Specialization.id)
+            .group_by(Specialization.id)
+        )
+        doctors = (
+            select(
+                Doctor.id,
+                func.count(Appointment.id).label("appointments_count"),
+                func.count(func.distinct(Appointment.patient_id)).label("patients_count"),
+            )
+            .outerjoin(Appointment, Appointment.doctor_id == Doctor.id)
+            .group_by(Doctor.id)
+        )
+        # Token totals are API usage only; content_tokens is deliberately left out
+        chat_sessions = (
+            select(
+                ChatSession.id,
+                func.count(ChatMessage.id).label("message_count"),
+                func.coalesce(func.sum(ChatMessage.token_input), 0).label("token_input_total"),
+                func.coalesce(func.sum(ChatMessage.token_output), 0).label("token_output_total"),
+            )
+            .outerjoin(ChatMessage, ChatMessage.session_id == ChatSession.id)
+            .group_by(ChatSession.id)
+        )
+        return {
+            "specializations": await self._repair_counts(Specialization, specializations),
+            "doctors": await self._repair_counts(Doctor, doctors),
+            "chat_sessions": await self._repair_counts(ChatSession, chat_sessions),
+            "doctor_patients": await self._repair_doctor_patients(),
+        }
+
+    async def _repair_doctor_patients(self) -> int:
+        """Rebuild drifted doctor_patients rows and drop pairs without appointments."""
+        summary = (
+            select(
+                Appointment.doctor_id,
+                Appointment.patient_id,
+                func.count().label("total_appointments"),
+                func.max(Appointment.date_time).label("last_appointment_date"),
+            )
+            .group_by(Appointment.doctor_id, Appointment.patient_id)
+        )
+        columns = ["total_appointments", "last_appointment_date"]
+        stmt = insert(DoctorPatient).from_select(["doctor_id", "patient_id", *columns], summary)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DoctorPatient.doctor_id, DoctorPatient.patient_id],
+            set_={name: stmt.excluded[name] for name in columns},
+            where=(
+                sa.tuple_(*(getattr(DoctorPatient, name) for name in columns))
+                != sa.tuple_(*(stmt.excluded[name] for name in columns))
+            ),
+        )
+        upserted = await self._session.execute(stmt)
+
+        orphaned = await self._session.execute(
+            delete(DoctorPatient).where(
+                ~exists().where(
+                    Appointment.doctor_id == DoctorPatient.doctor_id,
+                    Appointment.patient_id == DoctorPatient.patient_id,
+                )
+            )
+        )
+        return upserted.rowcount + orphaned.rowcount
+
+    async def _repair_counts(self, model, counts: sa.Select) -> int:
+        counts = counts.subquery()
+        columns = [column for column in counts.c if column.name != "id"]
+        values = {column.name: column for column in columns}
+        if "updated_at" in model.__table__.c:
+            # Counter fixes are not content changes; keep updated_at from bumping
+            values["updated_at"] = model.updated_at
+        stmt = (
+            update(model)
+            .where(model.id == counts.c.id)
+            .where(
+                sa.tuple_(*(getattr(model, column.name) for column in columns))
+                != sa.tuple_(*columns)
+            )
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    @staticmethod
+    def _from_orm(obj: AdminStatsSnapshot) -> AdminStatsDTO:
+        return AdminStatsDTO(
+            total_users=obj.total_users,
+            total_doctors=obj.total_doctors,
+            total_bookings=obj.total_bookings,
+            today_bookings=obj.today_bookings,
+            pending_bookings=obj.pending_bookings,
+            completed_bookings=obj.completed_bookings,
+            total_emrs=obj.total_emrs,
+            refreshed_at=obj.refreshed_at,
+        )
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy import insert, select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -68,8 +68,13 @@ class UserRepository:
             password_hash=obj.password_hash,
         )
 
-    async def get_all_users(self, skip: int = 0, limit: int = 20) -> List[UserEntity]:
-        stmt = select(User).offset(skip).limit(limit)
+    async def get_all_users(
+            self, skip: int = 0, limit: int = 20, after_id: Optional[int] = None
+    ) -> List[UserEntity]:
+        stmt = select(User)
+        if after_id:
+            stmt = stmt.where(User.id > after_id)
+        stmt = stmt.order_by(User.id).offset(skip).limit(limit)
         result = await self._session.execute(stmt)
         users = result.scalars().all()
         return [self._from_orm(user) for user in users]
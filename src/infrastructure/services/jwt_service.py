@@ -1,10 +1,13 @@
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import jwt
 
+from src.domain.entities.users import UserEntityWithDetails
+
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 REFRESH_TOKEN_EXPIRE_DAYS = 30
+IDENTITY_CLAIM = "usr"
 
 
 class JWTService:
@@ -32,6 +35,39 @@ class JWTService:
         to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc)})
         return jwt.encode(to_encode, key=self._jwt_access_secret_key, algorithm="HS256")
 
+    @staticmethod
+    def identity_claims(user: UserEntityWithDetails) -> dict:
+        """Claims for "claims-only" access tokens, which authenticate without a user lookup."""
+        return {
+            IDENTITY_CLAIM: {
+                "email": user.email,
+                "full_name": user.full_name,
+                "phone": user.phone,
+                "is_admin": user.is_admin,
+                "is_doctor": user.is_doctor,
+                "doctor_id": user.doctor_id,
+            }
+        }
+
+    @staticmethod
+    def user_from_claims(decoded: Dict[str, Any]) -> Optional[UserEntityWithDetails]:
+        claims = decoded.get(IDENTITY_CLAIM)
+        if not isinstance(claims, dict):
+            return None
+        try:
+            return UserEntityWithDetails(
+                id=int(decoded["sub"]),
+                email=claims["email"],
+                full_name=claims["full_name"],
+                password_hash="",
+                phone=claims.get("phone"),
+                is_admin=bool(claims["is_admin"]),
+                is_doctor=bool(claims["is_doctor"]),
+                doctor_id=claims.get("doctor_id"),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
     def encode_refresh_token(self, payload: dict) -> str:
         to_encode = payload.copy()
         expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
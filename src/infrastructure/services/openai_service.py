@@ -1,134 +1,98 @@
 import json
 from typing import AsyncGenerator, Optional
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from src.domain.entities.doctors import DoctorWithDetailsEntity
-
-
-class OpenAIService:
-    def __init__(self, api_key: str):
-        self._client = AsyncOpenAI(api_key=api_key)
-        self._model = "gpt-4-turbo-preview"
-
-    def _format_doctors_for_prompt(self, doctors: list[DoctorWithDetailsEntity]) -> str:
-        if not doctors:
-            return "\n\nNO DOCTORS CURRENTLY AVAILABLE ON OUR PLATFORM."
-
-        doctors_by_spec: dict[str, list[DoctorWithDetailsEntity]] = {}
-        for doctor in doctors:
-            spec = doctor.specialization_name
-            if spec not in doctors_by_spec:
-                doctors_by_spec[spec] = []
-            doctors_by_spec[spec].append(doctor)
-
-        lines = ["\n\nAVAILABLE DOCTORS IN OUR PLATFORM:"]
-        lines.append(f"(Specializations available: {', '.join(doctors_by_spec.keys())})")
-        for spec, spec_doctors in doctors_by_spec.items():
-            lines.append(f"\n{spec}:")
-            for doc in spec_doctors:
-                bio_preview = doc.bio[:100] if doc.bio else "No bio available"
-                lines.append(
-                    f"  - Dr. {doc.full_name} (ID: {doc.id}) | "
-                    f"Rating: {doc.rating}/5 | "
-                    f"Experience: {doc.experience_years} years | "
-                    f"Bio: {bio_preview}..."
-                )
-        return "\n".join(lines)
-
-    def _get_system_prompt(
-        self, doctors: Optional[list[DoctorWithDetailsEntity]] = None
-    ) -> str:
-        doctors_section = self._format_doctors_for_prompt(doctors) if doctors else ""
-
-        return f"""You are an AI medical assistant for a healthcare platform called MedCare. Your role is to:
-
-1. Listen to patient symptoms and concerns with empathy
-2. Ask 1-2 brief clarifying questions to understand their condition better
-3. Provide general health information (NOT diagnoses)
-4. Recommend which type of medical specialist they should consult
-5. Assess urgency level (low, medium, high, emergency)
-6. Recommend specific doctors from our platform OR provide external resources if no matching doctors available
-
-IMPORTANT GUIDELINES:
-- Never provide definitive diagnoses
-- Always recommend consulting a real doctor
-- For emergency symptoms (chest pain, difficulty breathing, severe bleeding, etc.), immediately advise seeking emergency care
-- Be compassionate and professional
-- ASK MAXIMUM 2-3 QUESTIONS before making a recommendation. After 2 exchanges, you MUST provide doctor recommendations
-- When recommending doctors, prefer those with higher ratings and more experience
-- Recommend up to 3 doctors that best match the patient's needs
-- ALWAYS include a JSON recommendation block after your conversational response once you have basic symptom information
-{doctors_section}
-
-RESPONSE FORMAT:
-After gathering basic information (usually after 1-2 questions), include both a conversational response AND a JSON block.
-
-CASE 1 - If matching doctors ARE available on our platform:
-```json
-{{
-    "recommendation": true,
-    "specialization": "Dentistry",
-    "confidence": 0.85,
-    "urgency": "medium",
-    "reasoning": "Based on the described symptoms...",
-    "has_platform_doctors": true,
-    "recommended_doctor_ids": [1, 2, 3],
-    "recommended_doctors": [
-        {{"id": 1, "name": "Dr. John Smith", "specialization": "Dentistry", "rating": 4.8, "experience_years": 10}}
-    ]
-}}
-```
-
-CASE 2 - If NO matching doctors available on our platform (or platform has no doctors):
-Provide helpful external resources. Include search links and general guidance.
-```json
-{{
-    "recommendation": true,
-    "specialization": "Cardiology",
-    "confidence": 0.80,
-    "urgency": "high",
-    "reasoning": "Based on your symptoms, you should see a cardiologist...",
-    "has_platform_doctors": false,
-    "external_resources": [
-        {{
-            "name": "Find Cardiologists Near You",
-            "type": "search",
-            "url": "https://www.google.com/search?q=cardiologist+near+me",
-            "description": "Search for cardiologists in your area"
-        }},
-        {{
-            "name": "Zocdoc - Book Cardiologist",
-            "type": "booking",
-            "url": "https://www.zocdoc.com/search?dr_specialty=cardiologist",
-            "description": "Find and book appointments with cardiologists"
-        }},
-        {{
-            "name": "Healthgrades",
-            "type": "directory",
-            "url": "https://www.healthgrades.com/cardiology-directory",
-            "description": "Doctor reviews and ratings"
-        }}
-    ],
-    "emergency_contacts": {{
-        "emergency": "911",
-        "poison_control": "1-800-222-1222",
-        "mental_health": "988"
-    }},
-    "general_advice": "While we don't have cardiologists on our platform yet, I recommend using the links above to find a specialist near you. If symptoms worsen, please seek emergency care immediately."
-}}
-```
-
-For the FIRST message from a patient, ask 1-2 clarifying questions without the JSON block.
-For the SECOND or THIRD message, you MUST include the JSON block with recommendations (either platform doctors OR external resources)."""
+from src.domain.interfaces.llm_provider import ILLMProvider
+from src.infrastructure.services.llm_prompts import build_system_prompt, format_doctors_for_prompt
+
+
+class OpenAIService(ILLMProvider):
+    """
+    OpenAI chat client. Meant to be shared process-wide: it owns a keep-alive
+    httpx pool, so repeated completions reuse warm TLS connections. Call
+    ``close()`` on shutdown.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4-turbo-preview",
+        base_url: Optional[str] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        max_retries: int = 2,
+    ):
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._requests = 0
+        self._new_connections = 0
+        http_client = DefaultAsyncHttpxClient(
+            limits=self._limits,
+            timeout=self._timeout,
+            event_hooks={"request": [self._on_request]},
+        )
+        self._client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=http_client,
+            timeout=self._timeout,
+            max_retries=max_retries,
+        )
+        self._model = model
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        self._requests += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: dict) -> None:
+        # Emitted by the transport only when the pool has to open a new connection
+        if event_name == "connection.connect_tcp.complete":
+            self._new_connections += 1
+
+    def get_stats(self) -> dict:
+        reused = max(0, self._requests - self._new_connections)
+        return {
+            "requests": self._requests,
+            "new_connections": self._new_connections,
+            "reused_connections": reused,
+            "reuse_ratio": reused / self._requests if self._requests else 0.0,
+            "max_connections": self._limits.max_connections,
+            "max_keepalive_connections": self._limits.max_keepalive_connections,
+            "keepalive_expiry": self._limits.keepalive_expiry,
+            "connect_timeout": self._timeout.connect,
+            "read_timeout": self._timeout.read,
+        }
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    def format_doctors_for_prompt(self, doctors: list[DoctorWithDetailsEntity]) -> str:
+        return format_doctors_for_prompt(doctors)
 
     async def chat_stream(
             self,
             messages: list[dict],
             doctors: Optional[list[DoctorWithDetailsEntity]] = None,
             temperature: float = 0.7,
+            usage: Optional[dict] = None,
+            doctors_section: Optional[str] = None,
     ) -> AsyncGenerator[str, None]:
-        system_message = {"role": "system", "content": self._get_system_prompt(doctors)}
+        """Yield completion tokens; fills ``usage`` with token counts once the stream ends."""
+        system_message = {"role": "system", "content": build_system_prompt(doctors, doctors_section)}
         all_messages = [system_message] + messages
 
         stream = await self._client.chat.completions.create(
@@ -136,10 +100,14 @@ For the SECOND or THIRD message, you MUST include the JSON block with recommenda
             messages=all_messages,
             temperature=temperature,
             stream=True,
+            stream_options={"include_usage": True},
         )
 
         async for chunk in stream:
-            if chunk.choices[0].delta.content:
+            if chunk.usage and usage is not None:
+                usage["prompt_tokens"] = chunk.usage.prompt_tokens
+                usage["completion_tokens"] = chunk.usage.completion_tokens
+            if chunk.choices and chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
 
     async def chat(
@@ -147,8 +115,10 @@ For the SECOND or THIRD message, you MUST include the JSON block with recommenda
             messages: list[dict],
             doctors: Optional[list[DoctorWithDetailsEntity]] = None,
             temperature: float = 0.7,
+            doctors_section: Optional[str] = None,
+            usage: Optional[dict] = None,
     ) -> str:
-        system_message = {"role": "system", "content": self._get_system_prompt(doctors)}
+        system_message = {"role": "system", "content": build_system_prompt(doctors, doctors_section)}
         all_messages = [system_message] + messages
 
         response = await self._client.chat.completions.create(
@@ -157,6 +127,9 @@ For the SECOND or THIRD message, you MUST include the JSON block with recommenda
             temperature=temperature,
         )
 
+        if response.usage and usage is not None:
+            usage["prompt_tokens"] = response.usage.prompt_tokens
+            usage["completion_tokens"] = response.usage.completion_tokens
         return response.choices[0].message.content
 
     async def analyze_symptoms(
@@ -188,3 +161,30 @@ Provide your response in this exact JSON format:
         )
 
         return json.loads(response.choices[0].message.content)
+
+    async def summarize_conversation(
+            self,
+            messages: list[dict],
+            previous_summary: Optional[str] = None,
+            max_tokens: int = 300,
+    ) -> str:
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        summary_prompt = f"""Update the running summary of a medical assistant conversation.
+Keep symptoms, their duration and severity, answers to clarifying questions, urgency,
+and any specialists or doctors already recommended. Be concise and factual.
+
+Current summary: {previous_summary or "(none)"}
+
+New messages:
+{transcript}
+
+Return only the updated summary."""
+
+        response = await self._client.chat.completions.create(
+            model=self._model,
+            messages=[{"role": "user", "content": summary_prompt}],
+            temperature=0.2,
+            max_tokens=max_tokens,
+        )
+
+        return response.choices[0].message.content.strip()
@@ -1,9 +1,81 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 import bcrypt
 
+T = TypeVar("T")
+
 
 class PasswordService:
+    """
+    bcrypt hashing. The async methods run on a bounded thread pool (bcrypt
+    releases the GIL) so hashing never blocks the event loop; calls beyond
+    ``max_workers`` queue up and are reported by ``get_stats``.
+    """
+
+    def __init__(self, rounds: int = 12, max_workers: int = 4):
+        self._rounds = rounds
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._in_flight = 0
+        self._peak_queue_depth = 0
+        self._completed = 0
+        self._total_wait_ms = 0.0
+        self._total_run_ms = 0.0
+
     def encrypt(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=self._rounds)).decode("utf-8")
 
     def verify(self, password: str, db_password: str) -> bool:
         return bcrypt.checkpw(password=password.encode("utf-8"), hashed_password=db_password.encode("utf-8"))
+
+    def needs_rehash(self, db_password: str) -> bool:
+        """True when the stored hash was made with a different cost factor."""
+        try:
+            return int(db_password.split("$")[2]) != self._rounds
+        except (IndexError, ValueError):
+            return True
+
+    async def encrypt_async(self, password: str) -> str:
+        return await self._run(self.encrypt, password)
+
+    async def verify_async(self, password: str, db_password: str) -> bool:
+        return await self._run(self.verify, password, db_password)
+
+    def get_stats(self) -> dict:
+        return {
+            "max_workers": self._max_workers,
+            "rounds": self._rounds,
+            "in_flight": self._in_flight,
+            "queue_depth": max(0, self._in_flight - self._max_workers),
+            "peak_queue_depth": self._peak_queue_depth,
+            "completed": self._completed,
+            "avg_wait_ms": self._total_wait_ms / self._completed if self._completed else 0.0,
+            "avg_run_ms": self._total_run_ms / self._completed if self._completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        def timed() -> tuple[T, float, float]:
+            started_at = time.perf_counter()
+            result = func(*args)
+            return result, started_at, time.perf_counter()
+
+        self._in_flight += 1
+        self._peak_queue_depth = max(self._peak_queue_depth, self._in_flight - self._max_workers)
+        submitted_at = time.perf_counter()
+        try:
+            result, started_at, finished_at = await asyncio.get_running_loop().run_in_executor(
+                self._executor, timed
+            )
+        finally:
+            self._in_flight -= 1
+
+        self._completed += 1
+        self._total_wait_ms += (started_at - submitted_at) * 1000
+        self._total_run_ms += (finished_at - started_at) * 1000
+        return result
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import re
+from typing import AsyncGenerator, Optional
+
+from src.domain.entities.doctors import DoctorWithDetailsEntity
+from src.domain.interfaces.llm_provider import ILLMProvider
+from src.infrastructure.services.llm_prompts import build_system_prompt, format_doctors_for_prompt
+
+_DOCTOR_PATTERN = re.compile(r"Dr\. (?P<name>.+?) \(ID: (?P<id>\d+)\)")
+_SPECIALIZATIONS_PATTERN = re.compile(r"\(Specializations available: (?P<names>[^)]*)\)")
+_TOKEN_PATTERN = re.compile(r"\s*\S+")
+
+
+class StubLLMService(ILLMProvider):
+    """
+    Deterministic stand-in for the OpenAI provider, for load tests and benchmarks.
+
+    Replies follow the same script as the real assistant: a clarifying question
+    on the first patient message, then a reply with a JSON recommendation block.
+    Unless a canned recommendation is configured, it picks up to three doctors
+    from the roster in the system prompt. Latency is simulated as a fixed
+    time-to-first-token plus a steady token rate.
+    """
+
+    CLARIFYING_REPLY = (
+        "Thank you for sharing that. How long have you had these symptoms, "
+        "and how severe are they on a scale from 1 to 10?"
+    )
+    RECOMMENDATION_REPLY = (
+        "Thanks for the details. Based on what you've described, I recommend "
+        "seeing a specialist. This is not a diagnosis; if your symptoms get "
+        "worse, please seek emergency care."
+    )
+
+    def __init__(
+            self,
+            first_token_latency_ms: int = 300,
+            tokens_per_second: float = 50.0,
+            recommendation: Optional[dict] = None,
+            model: str = "stub-llm",
+    ):
+        self._first_token_latency = first_token_latency_ms / 1000
+        self._token_interval = 1 / tokens_per_second if tokens_per_second > 0 else 0.0
+        self._recommendation = recommendation
+        self._model = model
+        self._requests = 0
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    def format_doctors_for_prompt(self, doctors: list[DoctorWithDetailsEntity]) -> str:
+        return format_doctors_for_prompt(doctors)
+
+    def reply_for(self, messages: list[dict]) -> str:
+        """Build the scripted reply for a full message list (system prompt included)."""
+        user_turns = sum(1 for m in messages if m["role"] == "user")
+        if user_turns <= 1:
+            return self.CLARIFYING_REPLY
+
+        system_prompt = next((m["content"] for m in messages if m["role"] == "system"), "")
+        recommendation = self._recommendation or self._recommendation_from_roster(system_prompt)
+        return f"{self.RECOMMENDATION_REPLY}\n\n```json\n{json.dumps(recommendation, indent=4)}\n```"
+
+    def analysis_for(self, symptoms: str) -> dict:
+        recommendation = self._recommendation or self._recommendation_from_roster("")
+        return {
+            "recommended_specialization": recommendation.get("specialization", "General Practice"),
+            "confidence": recommendation.get("confidence", 0.8),
+            "urgency": recommendation.get("urgency", "low"),
+            "summary": f"Patient reported: {symptoms}",
+            "key_symptoms": [s.strip() for s in symptoms.split(",") if s.strip()],
+            "suggested_questions_for_doctor": ["What could be causing these symptoms?"],
+        }
+
+    async def paced_tokens(self, text: str) -> AsyncGenerator[str, None]:
+        """Yield ``text`` token by token at the configured latency and rate."""
+        self._requests += 1
+        await asyncio.sleep(self._first_token_latency)
+        for i, token in enumerate(self.tokenize(text)):
+            if i and self._token_interval:
+                await asyncio.sleep(self._token_interval)
+            yield token
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        return _TOKEN_PATTERN.findall(text)
+
+    @staticmethod
+    def count_prompt_tokens(messages: list[dict]) -> int:
+        return sum(len(m.get("content") or "") for m in messages) // 4
+
+    async def chat_stream(
+            self,
+            messages: list[dict],
+            doctors: Optional[list[DoctorWithDetailsEntity]] = None,
+            temperature: float = 0.7,
+            usage: Optional[dict] = None,
+            doctors_section: Optional[str] = None,
+    ) -> AsyncGenerator[str, None]:
+        all_messages = [{"role": "system", "content": build_system_prompt(doctors, doctors_section)}] + messages
+        completion_tokens = 0
+        async for token in self.paced_tokens(self.reply_for(all_messages)):
+            completion_tokens += 1
+            yield token
+
+        if usage is not None:
+            usage["prompt_tokens"] = self.count_prompt_tokens(all_messages)
+            usage["completion_tokens"] = completion_tokens
+
+    async def chat(
+            self,
+            messages: list[dict],
+            doctors: Optional[list[DoctorWithDetailsEntity]] = None,
+            temperature: float = 0.7,
+            doctors_section: Optional[str] = None,
+            usage: Optional[dict] = None,
+    ) -> str:
+        return "".join([
+            token async for token in self.chat_stream(
+                messages, doctors, temperature, usage=usage, doctors_section=doctors_section
+            )
+        ])
+
+    async def analyze_symptoms(self, symptoms: str, conversation_history: list[dict]) -> dict:
+        self._requests += 1
+        await asyncio.sleep(self._first_token_latency)
+        return self.analysis_for(symptoms)
+
+    async def summarize_conversation(
+            self,
+            messages: list[dict],
+            previous_summary: Optional[str] = None,
+            max_tokens: int = 300,
+    ) -> str:
+        self._requests += 1
+        await asyncio.sleep(self._first_token_latency)
+        parts = [previous_summary] if previous_summary else []
+        parts += [f"{m['role']}: {m['content']}" for m in messages]
+        return " ".join(self.tokenize(" ".join(parts))[-max_tokens:]).strip()
+
+    def get_stats(self) -> dict:
+        return {
+            "requests": self._requests,
+            "new_connections": 0,
+            "reused_connections": 0,
+            "reuse_ratio": 0.0,
+        }
+
+    async def close(self) -> None:
+        pass
+
+    @staticmethod
+    def _recommendation_from_roster(system_prompt: str) -> dict:
+        doctors = [
+            {"id": int(m.group("id")), "name": f"Dr. {m.group('name')}"}
+            for m in _DOCTOR_PATTERN.finditer(system_prompt)
+        ][:3]
+        specializations = _SPECIALIZATIONS_PATTERN.search(system_prompt)
+        specialization = (
+            specializations.group("names").split(",")[0].strip()
+            if specializations else "General Practice"
+        )
+        return {
+            "recommendation": True,
+            "specialization": specialization,
+            "confidence": 0.8,
+            "urgency": "low",
+            "reasoning": "Deterministic stub recommendation.",
+            "has_platform_doctors": bool(doctors),
+            "recommended_doctor_ids": [d["id"] for d in doctors],
+            "recommended_doctors": doctors,
+        }
@@ -0,0 +1,23 @@
+class TokenCounter:
+    """Counts tokens with tiktoken when it is installed, otherwise estimates ~4 characters per token."""
+
+    # Per-message framing tokens added by the chat completion format
+    MESSAGE_OVERHEAD = 4
+
+    def __init__(self, model: str = "gpt-4"):
+        try:
+            import tiktoken
+
+            self._encoding = tiktoken.encoding_for_model(model)
+        except Exception:
+            self._encoding = None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return (len(text) + 3) // 4
+
+    def count_message(self, content: str) -> int:
+        return self.count(content) + self.MESSAGE_OVERHEAD
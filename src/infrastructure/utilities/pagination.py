@@ -0,0 +1,56 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from src.domain.errors import BadRequestException
+
+
+class Keyset:
+    """
+    Opaque cursor codec for keyset pagination over an ordered column tuple.
+
+    A cursor holds the sort values of the last row of a page, e.g.
+    ``(date_time, id)``; the next page is every row strictly after it in the
+    list's order, so page N costs the same index range scan as page 1.
+    """
+
+    def __init__(self, *fields: tuple[str, type]):
+        self.fields = fields
+
+    def encode(self, item: Any) -> str:
+        values = []
+        for name, kind in self.fields:
+            value = getattr(item, name)
+            values.append(value.isoformat() if kind is datetime else value)
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode(self, cursor: Optional[str]) -> Optional[tuple]:
+        if not cursor:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError("cursor arity mismatch")
+            return tuple(
+                datetime.fromisoformat(value) if kind is datetime else kind(value)
+                for value, (_, kind) in zip(values, self.fields)
+            )
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+            raise BadRequestException("Invalid pagination cursor")
+
+    def next_cursor(self, items: Sequence[Any], limit: int) -> Optional[str]:
+        """Cursor for the page after ``items``, or None when it was the last page."""
+        if not items or len(items) < limit:
+            return None
+        return self.encode(items[-1])
+
+
+# Keysets matching the ORDER BY of the paginated repository lists
+DATE_TIME_KEYSET = Keyset(("date_time", datetime), ("id", int))
+CREATED_AT_KEYSET = Keyset(("created_at", datetime), ("id", int))
+ID_KEYSET = Keyset(("id", int))
+DOCTOR_PATIENT_KEYSET = Keyset(("last_appointment_date", datetime), ("id", int))
@@ -0,0 +1,58 @@
+import html
+import re
+from typing import Optional
+
+_WORD = re.compile(r"\w+")
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+# Private-use characters handed to ts_headline as StartSel/StopSel, swapped for
+# the tags only after the headline text has been HTML-escaped
+SENTINEL_START = "\ue000"
+SENTINEL_STOP = "\ue001"
+
+
+def prefix_tsquery(term: str) -> Optional[str]:
+    """
+    ``to_tsquery`` input matching every word of ``term`` as a prefix, e.g.
+    "Diab typ" -> "diab:* & typ:*". Only word characters are kept, so user
+    input can never produce a tsquery syntax error. None when no words remain.
+    """
+    words = _WORD.findall(term.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def highlight(text: Optional[str], term: str) -> Optional[str]:
+    """
+    HTML-escape ``text`` and wrap case-insensitive occurrences of the words of
+    ``term`` in highlight tags. Matching runs on the raw text, so escaping never
+    splits or creates a match.
+    """
+    if text is None:
+        return None
+    words = sorted(set(_WORD.findall(term)), key=len, reverse=True)
+    if not words:
+        return html.escape(text)
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+    parts = []
+    position = 0
+    for match in pattern.finditer(text):
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(f"{HIGHLIGHT_START}{html.escape(match.group(0))}{HIGHLIGHT_STOP}")
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    return "".join(parts)
+
+
+def sentinels_to_html(text: Optional[str]) -> Optional[str]:
+    """HTML-escape a ts_headline result built with the sentinel markers and turn them into highlight tags."""
+    if text is None:
+        return None
+    return (
+        html.escape(text)
+        .replace(SENTINEL_START, HIGHLIGHT_START)
+        .replace(SENTINEL_STOP, HIGHLIGHT_STOP)
+    )
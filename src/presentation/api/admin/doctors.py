@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, status, Depends, Query
+from fastapi import APIRouter, status, Depends, Query, Response
 
 from src.domain.entities.users import UserEntity
+from src.infrastructure.utilities.pagination import ID_KEYSET
+from src.presentation.api.pagination import set_next_cursor
 from src.presentation.api.schemas.requests.doctors import AdminCreateDoctorRequest, AdminDoctorUpdateRequest, ChangeDoctorStatusRequest
 from src.presentation.api.schemas.responses.doctors import DoctorResponse, DoctorWithDetailsResponse
 from src.presentation.dependencies import get_doctor_use_case, requires_roles
@@ -38,12 +40,16 @@ async def admin_create_doctor(
     response_model=List[DoctorWithDetailsResponse]
 )
 async def get_all_doctors(
+        response: Response,
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         use_case: DoctorUseCase = Depends(get_doctor_use_case),
         current_user: UserEntity = Depends(requires_roles(is_admin=True)),
 ):
-    return await use_case.get_all_doctors(skip=skip, limit=limit, is_admin=True)
+    items = await use_case.get_all_doctors(skip=skip, limit=limit, is_admin=True, cursor=cursor)
+    set_next_cursor(response, ID_KEYSET, items, limit)
+    return items
 
 
 @router.get(
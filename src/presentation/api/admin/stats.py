@@ -1,23 +1,90 @@
-from fastapi import APIRouter, Depends
+import os
+from typing import Literal
 
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.settings import Settings
 from src.domain.entities.users import UserEntity
-from src.presentation.api.schemas.responses.stats import AdminStatsResponse
-from src.presentation.dependencies import get_stats_use_case, requires_roles
-from src.use_cases.stats.use_case import StatsUseCase
+from src.domain.interfaces.llm_provider import ILLMProvider
+from src.domain.errors import NotFoundException
+from src.infrastructure.database.core import get_pool_stats
+from src.infrastructure.jobs.queue import JobQueue
+from src.infrastructure.services.password_service import PasswordService
+from src.presentation.api.schemas.responses.chat import JobResponse
+from src.presentation.api.schemas.responses.stats import (
+    AdminStatsResponse,
+    BookingTrendResponse,
+    DBPoolStatsResponse,
+    LLMClientStatsResponse,
+    PasswordHashingStatsResponse,
+)
+from src.presentation.dependencies import (
+    get_db_engine,
+    get_job_queue,
+    get_llm_provider,
+    get_password_service,
+    get_settings,
+    get_stats_use_case,
+    requires_roles,
+)
+from src.use_cases.stats.dto import AdminStatsDTO
+from src.use_cases.stats.use_case import REPAIR_COUNTERS_JOB, StatsUseCase
 
 router = APIRouter(prefix="/admin/stats", tags=["Admin Stats"])
 
 
 @router.get("", response_model=AdminStatsResponse)
 async def get_admin_stats(
+        trend_bucket: Literal["day", "week"] = Query("day"),
+        trend_periods: int = Query(0, ge=0, le=366),
         use_case: StatsUseCase = Depends(get_stats_use_case),
         current_user: UserEntity = Depends(requires_roles(is_admin=True)),
 ):
     """
     Get admin dashboard statistics.
-    Includes counts for users, doctors, appointments, and medical records.
+    Includes counts for users, doctors, appointments, and medical records,
+    plus bookings per day/week for the last `trend_periods` buckets.
     """
-    stats = await use_case.get_admin_stats()
+    stats = await use_case.get_admin_stats(trend_bucket=trend_bucket, trend_periods=trend_periods)
+    return _to_response(stats)
+
+
+@router.post("/refresh", response_model=AdminStatsResponse)
+async def refresh_admin_stats(
+        use_case: StatsUseCase = Depends(get_stats_use_case),
+        current_user: UserEntity = Depends(requires_roles(is_admin=True)),
+):
+    """Recompute the materialized admin stats snapshot."""
+    return _to_response(await use_case.refresh_snapshot())
+
+
+@router.post("/repair-counters", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def repair_counters(
+        job_queue: JobQueue = Depends(get_job_queue),
+        current_user: UserEntity = Depends(requires_roles(is_admin=True)),
+):
+    """
+    Enqueue a job that recomputes the denormalized doctor, specialization and
+    chat session counters and the doctor_patients summary from their source tables. Follow it via /admin/stats/jobs/{job_id}.
+    """
+    return await job_queue.enqueue(REPAIR_COUNTERS_JOB, {})
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_admin_job(
+        job_id: str,
+        job_queue: JobQueue = Depends(get_job_queue),
+        current_user: UserEntity = Depends(requires_roles(is_admin=True)),
+):
+    """Get the status of a background job, e.g. a counter repair."""
+    job = await job_queue.get_job(job_id)
+    if job is None:
+        raise NotFoundException("Job not found")
+    return job
+
+
+def _to_response(stats: AdminStatsDTO) -> AdminStatsResponse:
     return AdminStatsResponse(
         totalUsers=stats.total_users,
         totalDoctors=stats.total_doctors,
@@ -26,4 +93,49 @@ async def get_admin_stats(
         pendingBookings=stats.pending_bookings,
         completedBookings=stats.completed_bookings,
         totalEMRs=stats.total_emrs,
+        refreshedAt=stats.refreshed_at,
+        bookingTrends=[
+            BookingTrendResponse(bucketStart=point.bucket_start, count=point.count)
+            for point in stats.booking_trends
+        ],
     )
+
+
+@router.get("/db-pool", response_model=DBPoolStatsResponse)
+async def get_db_pool_stats(
+        engine: AsyncEngine = Depends(get_db_engine),
+        settings: Settings = Depends(get_settings),
+        current_user: UserEntity = Depends(requires_roles(is_admin=True)),
+):
+    """
+    Get connection pool metrics for the worker process serving this request.
+    Each worker owns its own pool, so values differ between workers.
+    """
+    return DBPoolStatsResponse(
+        **get_pool_stats(engine, max_overflow=settings.DB_MAX_OVERFLOW),
+        pid=os.getpid(),
+    )
+
+
+@router.get("/password-hashing", response_model=PasswordHashingStatsResponse)
+async def get_password_hashing_stats(
+        password_service: PasswordService = Depends(get_password_service),
+        current_user: UserEntity = Depends(requires_roles(is_admin=True)),
+):
+    """
+    Get bcrypt executor metrics (concurrency, queue depth, wait time)
+    for the worker process serving this request.
+    """
+    return PasswordHashingStatsResponse(**password_service.get_stats(), pid=os.getpid())
+
+
+@router.get("/llm-client", response_model=LLMClientStatsResponse)
+async def get_llm_client_stats(
+        llm_provider: ILLMProvider = Depends(get_llm_provider),
+        current_user: UserEntity = Depends(requires_roles(is_admin=True)),
+):
+    """
+    Get OpenAI HTTP connection pool metrics (requests vs. newly opened
+    connections) for the worker process serving this request.
+    """
+    return LLMClientStatsResponse(**llm_provider.get_stats(), pid=os.getpid())
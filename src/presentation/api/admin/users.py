@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, status, Depends, Query
+from fastapi import APIRouter, status, Depends, Query, Response
 
 from src.domain.entities.users import UserEntity
+from src.infrastructure.utilities.pagination import ID_KEYSET
+from src.presentation.api.pagination import set_next_cursor
 from src.presentation.api.schemas.requests.users import UserCreateRequest, UserUpdateRequest
 from src.presentation.api.schemas.responses.users import UserResponse
 from src.presentation.dependencies import get_user_use_case, requires_roles
@@ -17,13 +19,17 @@ router = APIRouter(prefix="/admin/users", tags=["Admin Users"])
     response_model=List[UserResponse]
 )
 async def get_all_users(
+        response: Response,
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         use_case: UserUseCase = Depends(get_user_use_case),
         current_user: UserEntity = Depends(requires_roles(is_admin=True)),
 ):
     """Get all users (admin only)"""
-    return await use_case.get_all_users(skip=skip, limit=limit)
+    items = await use_case.get_all_users(skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, ID_KEYSET, items, limit)
+    return items
 
 
 @router.get(
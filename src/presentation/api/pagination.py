@@ -0,0 +1,14 @@
+from typing import Sequence
+
+from fastapi import Response
+
+from src.infrastructure.utilities.pagination import Keyset
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor(response: Response, keyset: Keyset, items: Sequence, limit: int) -> None:
+    """Expose the cursor for the following page; absent on the last page."""
+    next_cursor = keyset.next_cursor(items, limit)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
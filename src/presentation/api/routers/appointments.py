@@ -1,16 +1,25 @@
-from datetime import date
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, status, Response
 
 from src.domain.constants import AppointmentStatus
 from src.domain.entities.users import UserEntityWithDetails
+from src.infrastructure.utilities.pagination import DATE_TIME_KEYSET
+from src.presentation.api.pagination import set_next_cursor
 from src.presentation.api.schemas.requests.appointments import (
     AppointmentCreateRequest,
     AppointmentUpdateRequest,
     AdminAppointmentCreateRequest,
+    SlotHoldRequest,
+)
+from src.presentation.api.schemas.responses.appointments import (
+    AppointmentResponse,
+    AppointmentWithDetailsResponse,
+    AppointmentStatusCountsResponse,
+    DoctorAppointmentStatsResponse,
+    SlotHoldResponse,
 )
-from src.presentation.api.schemas.responses.appointments import AppointmentResponse, AppointmentWithDetailsResponse
 from src.presentation.dependencies import get_current_user, get_appointment_use_case, requires_roles
 from src.use_cases.appointments.dto import CreateAppointmentDTO, UpdateAppointmentDTO
 from src.use_cases.appointments.use_case import AppointmentUseCase
@@ -61,20 +70,52 @@ async def admin_create_appointment(
     )
 
 
+@router.post(
+    "/holds",
+    response_model=SlotHoldResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def hold_slot(
+        request: SlotHoldRequest,
+        current_user: UserEntityWithDetails = Depends(get_current_user),
+        use_case: AppointmentUseCase = Depends(get_appointment_use_case),
+):
+    """Reserve a slot for a short time; booking it consumes the hold."""
+    return await use_case.hold_slot(request.doctor_id, request.date_time, current_user.id)
+
+
+@router.delete(
+    "/holds",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def release_slot_hold(
+        doctor_id: int = Query(...),
+        date_time: datetime = Query(...),
+        current_user: UserEntityWithDetails = Depends(get_current_user),
+        use_case: AppointmentUseCase = Depends(get_appointment_use_case),
+):
+    """Release a slot held by the current user."""
+    await use_case.release_slot_hold(doctor_id, date_time, current_user.id)
+
+
 @router.get(
     "/me",
     response_model=List[AppointmentWithDetailsResponse],
 )
 async def get_my_appointments(
+        response: Response,
         status: AppointmentStatus | None = Query(None),
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         current_user: UserEntityWithDetails = Depends(get_current_user),
         use_case: AppointmentUseCase = Depends(get_appointment_use_case),
 ):
-    return await use_case.get_my_appointments(
-        current_user.id, status=status, skip=skip, limit=limit
+    items = await use_case.get_my_appointments(
+        current_user.id, status=status, skip=skip, limit=limit, cursor=cursor
     )
+    set_next_cursor(response, DATE_TIME_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -82,26 +123,32 @@ async def get_my_appointments(
     response_model=List[AppointmentWithDetailsResponse],
 )
 async def get_my_doctor_appointments(
+        response: Response,
         status: AppointmentStatus | None = Query(None),
         date_from: date | None = Query(None),
         date_to: date | None = Query(None),
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         current_user: UserEntityWithDetails = Depends(requires_roles(is_doctor=True)),
         use_case: AppointmentUseCase = Depends(get_appointment_use_case),
 ):
-    return await use_case.get_my_doctor_appointments(
+    items = await use_case.get_my_doctor_appointments(
         current_user.id,
         status=status,
         date_from=date_from,
         date_to=date_to,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, DATE_TIME_KEYSET, items, limit)
+    return items
 
 
 @router.get(
     "/doctor/me/stats",
+    response_model=AppointmentStatusCountsResponse,
 )
 async def get_my_doctor_appointments_stats(
         target_date: date | None = Query(None, alias="date"),
@@ -115,6 +162,24 @@ async def get_my_doctor_appointments_stats(
     )
 
 
+@router.get(
+    "/doctor/me/stats/daily",
+    response_model=DoctorAppointmentStatsResponse,
+)
+async def get_my_doctor_daily_stats(
+        date_from: date | None = Query(None),
+        date_to: date | None = Query(None),
+        current_user: UserEntityWithDetails = Depends(requires_roles(is_doctor=True)),
+        use_case: AppointmentUseCase = Depends(get_appointment_use_case),
+):
+    """Get per-day appointment status counts for the doctor dashboard."""
+    return await use_case.get_my_doctor_daily_stats(
+        current_user.id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+
+
 @router.post(
     "/{appointment_id}/confirm",
     response_model=AppointmentResponse
@@ -172,16 +237,18 @@ async def mark_no_show(
     response_model=List[AppointmentWithDetailsResponse],
 )
 async def get_doctor_appointments(
+        response: Response,
         doctor_id: int,
         status: AppointmentStatus | None = Query(None),
         date_from: date | None = Query(None),
         date_to: date | None = Query(None),
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         current_user: UserEntityWithDetails = Depends(get_current_user),
         use_case: AppointmentUseCase = Depends(get_appointment_use_case),
 ):
-    return await use_case.get_doctor_appointments(
+    items = await use_case.get_doctor_appointments(
         doctor_id,
         current_user,
         status=status,
@@ -189,7 +256,10 @@ async def get_doctor_appointments(
         date_to=date_to,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, DATE_TIME_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -1,9 +1,19 @@
+import json
+import logging
+import time
+from dataclasses import asdict
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status, Response
+from fastapi.responses import StreamingResponse
 
-from src.domain.constants import ChatSessionStatus, MessageRole, ContentType
+from src.domain.constants import ChatSessionStatus, MessageRole
 from src.domain.entities.users import UserEntityWithDetails
+from src.domain.errors import BadRequestException, NotFoundException
+from src.domain.interfaces.llm_provider import ILLMProvider
+from src.infrastructure.jobs.queue import JobQueue
+from src.infrastructure.utilities.pagination import CREATED_AT_KEYSET
+from src.presentation.api.pagination import set_next_cursor
 from src.presentation.api.schemas.requests.chat import (
     ChatSessionCreateRequest,
     ChatMessageCreateRequest,
@@ -12,8 +22,12 @@ from src.presentation.api.schemas.requests.chat import (
 )
 from src.presentation.api.schemas.responses.chat import (
     ChatSessionResponse,
+    ChatSessionInboxResponse,
+    DoctorMatchResponse,
     ChatSessionWithMessagesResponse,
     ChatMessageResponse,
+    ChatMessageSentResponse,
+    JobResponse,
     TriageRunResponse,
     TriageRunWithDetailsResponse,
     TriageCandidateWithDoctorResponse,
@@ -23,17 +37,35 @@ from src.presentation.dependencies import (
     get_current_user_optional,
     get_chat_use_case,
     get_triage_use_case,
-    get_openai_service,
-    get_doctor_use_case,
+    get_llm_provider,
+    get_assistant_reply_use_case,
+    get_job_queue,
+)
+from src.use_cases.assistant.use_case import (
+    ASSISTANT_REPLY_JOB,
+    REPLY_TEMPERATURE,
+    AssistantReplyUseCase,
 )
-from src.infrastructure.services.openai_service import OpenAIService
-from src.use_cases.doctors.use_case import DoctorUseCase
 from src.use_cases.chat.use_case import ChatUseCase
 from src.use_cases.triage.use_case import TriageUseCase
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
 
+def _format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _parse_etag(if_none_match: Optional[str]) -> Optional[str]:
+    """First entity tag of an If-None-Match header, without the weak prefix and quotes."""
+    if not if_none_match:
+        return None
+    tag = if_none_match.split(",")[0].strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    return tag.strip('"') or None
+
+
 @router.post(
     "/sessions",
     response_model=ChatSessionResponse,
@@ -58,16 +90,41 @@ async def create_chat_session(
     response_model=List[ChatSessionResponse],
 )
 async def get_my_chat_sessions(
+    response: Response,
     session_status: Optional[ChatSessionStatus] = Query(None, alias="status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     current_user: UserEntityWithDetails = Depends(get_current_user),
     use_case: ChatUseCase = Depends(get_chat_use_case),
 ):
     """Get all chat sessions for the current user."""
-    return await use_case.get_my_sessions(
-        current_user.id, status=session_status, skip=skip, limit=limit
+    items = await use_case.get_my_sessions(
+        current_user.id, status=session_status, skip=skip, limit=limit, cursor=cursor
     )
+    set_next_cursor(response, CREATED_AT_KEYSET, items, limit)
+    return items
+
+
+@router.get(
+    "/sessions/me/inbox",
+    response_model=List[ChatSessionInboxResponse],
+)
+async def get_my_chat_inbox(
+    response: Response,
+    session_status: Optional[ChatSessionStatus] = Query(None, alias="status"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    current_user: UserEntityWithDetails = Depends(get_current_user),
+    use_case: ChatUseCase = Depends(get_chat_use_case),
+):
+    """Get the current user's sessions with last message preview, message count and triage urgency."""
+    items = await use_case.get_my_inbox(
+        current_user.id, status=session_status, skip=skip, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, CREATED_AT_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -76,14 +133,22 @@ async def get_my_chat_sessions(
 )
 async def get_chat_session(
     session_id: int,
+    tail: Optional[int] = Query(None, ge=1, le=500),
+    before_id: Optional[int] = Query(None, ge=1),
     current_user: Optional[UserEntityWithDetails] = Depends(get_current_user_optional),
     use_case: ChatUseCase = Depends(get_chat_use_case),
 ):
-    """Get a chat session with all messages."""
+    """Get a chat session with its messages.
+
+    With ``tail`` only the last N messages are returned; pass the id of the
+    oldest one as ``before_id`` to load earlier messages while ``has_earlier`` is set.
+    """
     return await use_case.get_session_with_messages(
         session_id,
         user_id=current_user.id if current_user else None,
         is_admin=current_user.is_admin if current_user else False,
+        tail=tail,
+        before_id=before_id,
     )
 
 
@@ -106,7 +171,7 @@ async def close_chat_session(
 
 @router.post(
     "/sessions/{session_id}/messages",
-    response_model=ChatMessageResponse,
+    response_model=ChatMessageSentResponse,
     status_code=status.HTTP_201_CREATED,
 )
 async def send_message(
@@ -114,10 +179,12 @@ async def send_message(
     request: ChatMessageCreateRequest,
     current_user: Optional[UserEntityWithDetails] = Depends(get_current_user_optional),
     use_case: ChatUseCase = Depends(get_chat_use_case),
-    openai_service: OpenAIService = Depends(get_openai_service),
-    doctor_use_case: DoctorUseCase = Depends(get_doctor_use_case),
+    job_queue: JobQueue = Depends(get_job_queue),
 ):
-    """Send a message to a chat session and get AI response."""
+    """
+    Send a message to a chat session.
+    User messages enqueue an AI reply job; follow it via `reply_job_id`.
+    """
     # Save the user message
     user_message = await use_case.send_message(
         session_id=session_id,
@@ -128,48 +195,160 @@ async def send_message(
         is_admin=current_user.is_admin if current_user else False,
     )
 
-    # If user sent a message, generate AI response
+    reply_job_id = None
     if request.role == MessageRole.USER:
         try:
-            # Get all messages for context
-            all_messages = await use_case.get_messages(
-                session_id=session_id,
-                user_id=current_user.id if current_user else None,
-                is_admin=current_user.is_admin if current_user else False,
+            job = await job_queue.enqueue(
+                ASSISTANT_REPLY_JOB,
+                {"session_id": session_id, "trigger_message_id": user_message.id},
             )
+            reply_job_id = job.id
+        except Exception as e:
+            # Log the error but don't fail the request
+            logging.error(f"Failed to enqueue AI response: {e}")
 
-            # Format messages for OpenAI
-            openai_messages = [
-                {"role": msg.role.value if hasattr(msg.role, 'value') else msg.role, "content": msg.content}
-                for msg in all_messages
-            ]
+    return {**asdict(user_message), "reply_job_id": reply_job_id}
 
-            # Get available doctors for recommendations (approved only)
-            doctors = await doctor_use_case.get_all_doctors(skip=0, limit=50, is_admin=False)
 
-            # Generate AI response
-            ai_response = await openai_service.chat(
-                messages=openai_messages,
-                doctors=doctors,
-                temperature=0.7,
-            )
+@router.post(
+    "/sessions/{session_id}/messages/stream",
+    response_class=StreamingResponse,
+)
+async def send_message_stream(
+    session_id: int,
+    request: ChatMessageCreateRequest,
+    current_user: Optional[UserEntityWithDetails] = Depends(get_current_user_optional),
+    use_case: ChatUseCase = Depends(get_chat_use_case),
+    assistant_use_case: AssistantReplyUseCase = Depends(get_assistant_reply_use_case),
+    llm_provider: ILLMProvider = Depends(get_llm_provider),
+):
+    """Send a user message and stream the AI response as Server-Sent Events.
+
+    Events: ``message`` (saved user message), ``token`` (completion delta),
+    ``done`` (saved assistant message, with ``triage`` holding the triage run
+    recorded from its recommendation block, if any) or ``error``.
+    """
+    if request.role != MessageRole.USER:
+        raise BadRequestException("Only user messages can be streamed")
+
+    user_message = await use_case.send_message(
+        session_id=session_id,
+        content=request.content,
+        role=request.role,
+        content_type=request.content_type,
+        user_id=current_user.id if current_user else None,
+        is_admin=current_user.is_admin if current_user else False,
+    )
+    context = await assistant_use_case.build_context(session_id)
+
+    async def event_stream():
+        yield _format_sse(
+            "message", ChatMessageResponse.model_validate(user_message).model_dump(mode="json")
+        )
 
-            # Save AI response as assistant message
-            await use_case.send_message(
-                session_id=session_id,
-                content=ai_response,
-                role=MessageRole.ASSISTANT,
-                content_type=ContentType.TEXT,
-                user_id=None,
-                is_admin=True,  # Allow system to post
-                model_name="gpt-4-turbo-preview",
+        usage: dict = {}
+        chunks: list[str] = []
+        started_at = time.perf_counter()
+        first_token_ms = None
+        try:
+            async for token in llm_provider.chat_stream(
+                messages=context.messages,
+                doctors=context.roster.doctors,
+                temperature=REPLY_TEMPERATURE,
+                usage=usage,
+                doctors_section=context.roster.prompt_section,
+            ):
+                if first_token_ms is None:
+                    first_token_ms = int((time.perf_counter() - started_at) * 1000)
+                chunks.append(token)
+                yield _format_sse("token", {"content": token})
+
+            reply = await assistant_use_case.save_reply(
+                session_id,
+                "".join(chunks),
+                usage=usage,
+                latency_ms=int((time.perf_counter() - started_at) * 1000),
+                roster=context.roster,
             )
         except Exception as e:
-            # Log the error but don't fail the request
-            import logging
-            logging.error(f"Failed to generate AI response: {e}")
+            logging.error(f"Failed to stream AI response: {e}")
+            yield _format_sse("error", {"detail": "Failed to generate AI response"})
+            return
+
+        payload = ChatMessageResponse.model_validate(reply.message).model_dump(mode="json")
+        payload["first_token_ms"] = first_token_ms
+        payload["triage"] = (
+            TriageRunWithDetailsResponse.model_validate(reply.triage_run).model_dump(mode="json")
+            if reply.triage_run else None
+        )
+        yield _format_sse("done", payload)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    return user_message
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+)
+async def get_job(
+    job_id: str,
+    current_user: Optional[UserEntityWithDetails] = Depends(get_current_user_optional),
+    use_case: ChatUseCase = Depends(get_chat_use_case),
+    job_queue: JobQueue = Depends(get_job_queue),
+):
+    """Get the status of a background job, e.g. an AI reply."""
+    job = await job_queue.get_job(job_id)
+    if job is None or "session_id" not in job.payload:
+        raise NotFoundException("Job not found")
+
+    # Jobs are visible to whoever can access the chat session they belong to
+    await use_case.get_session_by_id(
+        job.payload["session_id"],
+        user_id=current_user.id if current_user else None,
+        is_admin=current_user.is_admin if current_user else False,
+    )
+    return job
+
+
+@router.get(
+    "/sessions/{session_id}/messages/delta",
+    response_model=List[ChatMessageResponse],
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "No new messages"}},
+)
+async def get_message_delta(
+    session_id: int,
+    response: Response,
+    since_id: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Optional[UserEntityWithDetails] = Depends(get_current_user_optional),
+    use_case: ChatUseCase = Depends(get_chat_use_case),
+):
+    """Poll for messages newer than ``since_id``.
+
+    Send the returned ETag back as If-None-Match with the id of the last
+    message received; an unchanged session answers 304 with no body.
+    """
+    delta = await use_case.get_message_delta(
+        session_id,
+        after_id=since_id,
+        known_version=_parse_etag(if_none_match),
+        limit=limit,
+        user_id=current_user.id if current_user else None,
+        is_admin=current_user.is_admin if current_user else False,
+    )
+    headers = {"Cache-Control": "private, no-cache"}
+    if delta.version is not None:
+        headers["ETag"] = f'W/"{delta.version}"'
+    if delta.not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return delta.messages
 
 
 @router.get(
@@ -177,20 +356,25 @@ async def send_message(
     response_model=List[ChatMessageResponse],
 )
 async def get_messages(
+    response: Response,
     session_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
     current_user: Optional[UserEntityWithDetails] = Depends(get_current_user_optional),
     use_case: ChatUseCase = Depends(get_chat_use_case),
 ):
     """Get all messages for a chat session."""
-    return await use_case.get_messages(
+    items = await use_case.get_messages(
         session_id,
         user_id=current_user.id if current_user else None,
         is_admin=current_user.is_admin if current_user else False,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, CREATED_AT_KEYSET, items, limit)
+    return items
 
 
 @router.post(
@@ -253,6 +437,35 @@ async def get_latest_triage_run(
     )
 
 
+@router.get(
+    "/triage/doctor-matches",
+    response_model=dict[int, List[DoctorMatchResponse]],
+)
+async def get_doctor_matches(
+    specialization_ids: List[int] = Query(..., min_length=1, max_length=50),
+    limit: int = Query(5, ge=1, le=50),
+    rating_weight: Optional[float] = Query(None, ge=0),
+    experience_weight: Optional[float] = Query(None, ge=0),
+    availability_weight: Optional[float] = Query(None, ge=0),
+    use_case: TriageUseCase = Depends(get_triage_use_case),
+):
+    """Rank doctors for several specializations in one call, keyed by specialization id."""
+    weights = {
+        name: value
+        for name, value in (
+            ("rating", rating_weight),
+            ("experience", experience_weight),
+            ("availability", availability_weight),
+        )
+        if value is not None
+    }
+    return await use_case.rank_doctors_for_specializations(
+        specialization_ids,
+        filters={"weights": weights},
+        limit=limit,
+    )
+
+
 @router.get(
     "/triage/{triage_run_id}",
     response_model=TriageRunWithDetailsResponse,
@@ -1,15 +1,21 @@
 from datetime import date
-from typing import List
+from typing import List, Union, Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, status, Response
 
 from src.domain.constants import DoctorStatus
 from src.domain.entities.users import UserEntity
+from src.domain.errors import BadRequestException
+from src.infrastructure.utilities.pagination import DOCTOR_PATIENT_KEYSET, ID_KEYSET
+from src.presentation.api.pagination import set_next_cursor
 from src.presentation.api.schemas.requests.doctors import (
     DoctorRegisterRequest,
     DoctorUpdateRequest,
 )
-from src.presentation.api.schemas.responses.appointments import DoctorAvailabilityResponse
+from src.presentation.api.schemas.responses.appointments import (
+    DoctorAvailabilityResponse,
+    DoctorAvailabilityRangeResponse,
+)
 from src.presentation.api.schemas.responses.doctors import (
     DoctorResponse,
     DoctorWithDetailsResponse,
@@ -82,19 +88,24 @@ async def get_application_status(
     response_model=List[DoctorPatientResponse],
 )
 async def get_my_patients(
+        response: Response,
         search: str = Query(None, description="Search by name, email or phone"),
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         current_user: UserEntity = Depends(requires_roles(is_doctor=True)),
         use_case: DoctorUseCase = Depends(get_doctor_use_case),
 ):
     """Get all patients who have appointments with the current doctor."""
-    return await use_case.get_my_patients(
+    items = await use_case.get_my_patients(
         user_id=current_user.id,
         search=search,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, DOCTOR_PATIENT_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -125,13 +136,17 @@ async def withdraw_application(
     response_model=List[DoctorWithDetailsResponse],
 )
 async def get_all_doctors(
+        response: Response,
         skip: int = Query(0, ge=0),
         limit: int = Query(10, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         status: DoctorStatus = Query(None),
         use_case: DoctorUseCase = Depends(get_doctor_use_case),
         current_user: UserEntity = Depends(get_current_user),
 ):
-    return await use_case.get_all_doctors(skip=skip, limit=limit,status=status, is_admin=current_user.is_admin)
+    items = await use_case.get_all_doctors(skip=skip, limit=limit,status=status, is_admin=current_user.is_admin, cursor=cursor)
+    set_next_cursor(response, ID_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -168,12 +183,18 @@ async def update_doctor(
 
 @router.get(
     "/{doctor_id}/availability",
-    response_model=DoctorAvailabilityResponse,
+    response_model=Union[DoctorAvailabilityResponse, DoctorAvailabilityRangeResponse],
 )
 async def get_doctor_availability(
         doctor_id: int,
-        target_date: date = Query(..., description="Date to check availability (YYYY-MM-DD)"),
+        target_date: date | None = Query(None, description="Date to check availability (YYYY-MM-DD)"),
+        date_from: date | None = Query(None, alias="from", description="First day of a range (YYYY-MM-DD)"),
+        date_to: date | None = Query(None, alias="to", description="Last day of a range (YYYY-MM-DD)"),
         appointment_use_case: AppointmentUseCase = Depends(get_appointment_use_case),
 ):
-    """Get available time slots for a doctor on a specific date."""
-    return await appointment_use_case.get_doctor_availability(doctor_id, target_date)
+    """Get time slots for a doctor on a specific date or for every day in a range."""
+    if target_date:
+        return await appointment_use_case.get_doctor_availability(doctor_id, target_date)
+    if not date_from:
+        raise BadRequestException("Either 'target_date' or 'from' is required")
+    return await appointment_use_case.get_doctor_availability_range(doctor_id, date_from, date_to)
@@ -1,9 +1,11 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, status, Response
 
 from src.domain.entities.users import UserEntity, UserEntityWithDetails
 from src.domain.errors import BadRequestException
+from src.infrastructure.utilities.pagination import CREATED_AT_KEYSET
+from src.presentation.api.pagination import set_next_cursor
 from src.presentation.api.schemas.requests.medical_records import MedicalRecordCreateRequest, MedicalRecordUpdateRequest
 from src.presentation.api.schemas.responses.medical_records import MedicalRecordResponse, \
     MedicalRecordWithDetailsResponse
@@ -44,15 +46,19 @@ async def create_medical_record(
     response_model=List[MedicalRecordWithDetailsResponse]
 )
 async def get_my_medical_records(
+        response: Response,
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         use_case: MedicalRecordUseCase = Depends(get_medical_record_use_case),
         current_user: UserEntity = Depends(get_current_user),
 ):
     """Get medical records where current user is the patient."""
-    return await use_case.get_my_medical_records(
-        current_user.id, skip=skip, limit=limit
+    items = await use_case.get_my_medical_records(
+        current_user.id, skip=skip, limit=limit, cursor=cursor
     )
+    set_next_cursor(response, CREATED_AT_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -60,19 +66,24 @@ async def get_my_medical_records(
     response_model=List[MedicalRecordWithDetailsResponse]
 )
 async def get_my_doctor_medical_records(
+        response: Response,
         search: str = Query(None, description="Search by patient name or diagnosis"),
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         use_case: MedicalRecordUseCase = Depends(get_medical_record_use_case),
         current_user: UserEntityWithDetails = Depends(requires_roles(is_doctor=True)),
 ):
     """Get medical records created by the current doctor."""
-    return await use_case.get_my_created_records(
+    items = await use_case.get_my_created_records(
         doctor_id=current_user.doctor_id,
         search=search,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, CREATED_AT_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -80,18 +91,23 @@ async def get_my_doctor_medical_records(
     response_model=List[MedicalRecordWithDetailsResponse]
 )
 async def get_patient_medical_records(
+        response: Response,
         patient_id: int,
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         current_user: UserEntity = Depends(get_current_user),
         use_case: MedicalRecordUseCase = Depends(get_medical_record_use_case),
 ):
-    return await use_case.get_patient_medical_records(
+    items = await use_case.get_patient_medical_records(
         patient_id,
         current_user=current_user,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, CREATED_AT_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -99,18 +115,23 @@ async def get_patient_medical_records(
     response_model=list[MedicalRecordWithDetailsResponse]
 )
 async def get_doctor_medical_records(
+        response: Response,
         doctor_id: int,
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None),
         current_user: UserEntity = Depends(get_current_user),
         use_case: MedicalRecordUseCase = Depends(get_medical_record_use_case),
 ):
-    return await use_case.get_doctor_medical_records(
+    items = await use_case.get_doctor_medical_records(
         doctor_id,
         current_user=current_user,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, CREATED_AT_KEYSET, items, limit)
+    return items
 
 
 @router.get(
@@ -0,0 +1,29 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from src.domain.entities.users import UserEntityWithDetails
+from src.presentation.api.schemas.responses.search import SearchResultsResponse
+from src.presentation.dependencies import get_search_use_case, requires_roles
+from src.use_cases.search.use_case import SearchUseCase
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get(
+    "",
+    response_model=SearchResultsResponse,
+)
+async def search(
+        q: str = Query(..., min_length=2, max_length=100, description="Name, email, phone or record text"),
+        kind: Optional[List[Literal["patients", "doctors", "medical_records"]]] = Query(None),
+        limit: int = Query(10, ge=1, le=50),
+        current_user: UserEntityWithDetails = Depends(requires_roles(is_admin=True, is_doctor=True)),
+        use_case: SearchUseCase = Depends(get_search_use_case),
+):
+    """
+    Search patients, doctors and medical records, each list ordered by relevance.
+    Matches are wrapped in <mark> tags in `title` and `snippet`. Doctors only
+    see their own patients and records.
+    """
+    return await use_case.search(q, current_user, kinds=kind, limit=limit)
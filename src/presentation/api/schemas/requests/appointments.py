@@ -55,3 +55,16 @@ class AppointmentUpdateRequest(BaseModel):
     visit_type: Optional[VisitType] = None
     notes: Optional[str] = Field(None, max_length=2000)
     cancel_reason: Optional[str] = Field(None, max_length=500)
+
+
+class SlotHoldRequest(BaseModel):
+    doctor_id: int
+    date_time: datetime
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "doctor_id": 1,
+                "date_time": "2024-12-20T10:00:00"
+            }
+        }
@@ -15,6 +15,7 @@ class SpecializationWithCountResponse(BaseModel):
     title: str
     description: str
     doctors_count: int
+    approved_doctors_count: int = 0
 
     class Config:
         from_attributes = True
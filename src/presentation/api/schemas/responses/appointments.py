@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from pydantic import BaseModel
@@ -48,6 +48,16 @@ class AppointmentWithDetailsResponse(BaseModel):
         from_attributes = True
 
 
+class SlotHoldResponse(BaseModel):
+    doctor_id: int
+    date_time: datetime
+    patient_id: int
+    expires_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class TimeSlotResponse(BaseModel):
     start_time: datetime
     end_time: datetime
@@ -58,3 +68,54 @@ class DoctorAvailabilityResponse(BaseModel):
     doctor_id: int
     date: str
     slots: list[TimeSlotResponse]
+
+
+class DayAvailabilityResponse(BaseModel):
+    date: date
+    slots: list[TimeSlotResponse]
+
+    class Config:
+        from_attributes = True
+
+
+class DoctorAvailabilityRangeResponse(BaseModel):
+    doctor_id: int
+    date_from: date
+    date_to: date
+    days: list[DayAvailabilityResponse]
+
+    class Config:
+        from_attributes = True
+
+
+class AppointmentStatusCountsResponse(BaseModel):
+    total: int
+    active: int
+    done: int
+    scheduled: int
+    confirmed: int
+    in_progress: int
+    completed: int
+    cancelled: int
+    no_show: int
+
+    class Config:
+        from_attributes = True
+
+
+class DailyAppointmentStatsResponse(BaseModel):
+    day: date
+    counts: AppointmentStatusCountsResponse
+
+    class Config:
+        from_attributes = True
+
+
+class DoctorAppointmentStatsResponse(BaseModel):
+    date_from: date
+    date_to: date
+    totals: AppointmentStatusCountsResponse
+    days: list[DailyAppointmentStatsResponse]
+
+    class Config:
+        from_attributes = True
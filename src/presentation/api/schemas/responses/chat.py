@@ -8,6 +8,7 @@ from src.domain.constants import (
     ChatSource,
     MessageRole,
     ContentType,
+    JobStatus,
     TriageStatus,
     UrgencyLevel,
 )
@@ -30,6 +31,23 @@ class ChatMessageResponse(BaseModel):
         from_attributes = True
 
 
+class ChatMessageSentResponse(ChatMessageResponse):
+    reply_job_id: Optional[str] = None
+
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    status: JobStatus
+    result: Optional[dict]
+    error: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class ChatSessionResponse(BaseModel):
     id: int
     status: ChatSessionStatus
@@ -45,6 +63,24 @@ class ChatSessionResponse(BaseModel):
         from_attributes = True
 
 
+class ChatSessionInboxResponse(BaseModel):
+    id: int
+    status: ChatSessionStatus
+    source: ChatSource
+    locale: Optional[str]
+    last_message_at: Optional[datetime]
+    user_id: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+    message_count: int
+    last_message_preview: Optional[str]
+    last_message_role: Optional[MessageRole]
+    latest_urgency: Optional[UrgencyLevel]
+
+    class Config:
+        from_attributes = True
+
+
 class ChatSessionWithMessagesResponse(BaseModel):
     id: int
     status: ChatSessionStatus
@@ -56,6 +92,7 @@ class ChatSessionWithMessagesResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     messages: list[ChatMessageResponse]
+    has_earlier: bool = False
 
     class Config:
         from_attributes = True
@@ -92,6 +129,16 @@ class TriageCandidateWithDoctorResponse(BaseModel):
         from_attributes = True
 
 
+class DoctorMatchResponse(BaseModel):
+    doctor_id: int
+    score: float
+    rank: int
+    next_available_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
 class TriageRunResponse(BaseModel):
     id: int
     status: TriageStatus
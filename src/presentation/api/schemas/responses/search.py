@@ -0,0 +1,22 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class SearchHitResponse(BaseModel):
+    id: int
+    title: str
+    snippet: Optional[str]
+    score: float
+
+    class Config:
+        from_attributes = True
+
+
+class SearchResultsResponse(BaseModel):
+    patients: List[SearchHitResponse]
+    doctors: List[SearchHitResponse]
+    medical_records: List[SearchHitResponse]
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,18 @@
+from datetime import date, datetime
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
 
+class BookingTrendResponse(BaseModel):
+    bucket_start: date = Field(..., alias="bucketStart")
+    count: int
+
+    class Config:
+        populate_by_name = True
+        from_attributes = True
+
+
 class AdminStatsResponse(BaseModel):
     total_users: int = Field(..., alias="totalUsers")
     total_doctors: int = Field(..., alias="totalDoctors")
@@ -9,7 +21,46 @@ class AdminStatsResponse(BaseModel):
     pending_bookings: int = Field(..., alias="pendingBookings")
     completed_bookings: int = Field(..., alias="completedBookings")
     total_emrs: int = Field(..., alias="totalEMRs")
+    refreshed_at: Optional[datetime] = Field(None, alias="refreshedAt")
+    booking_trends: List[BookingTrendResponse] = Field(default_factory=list, alias="bookingTrends")
 
     class Config:
         populate_by_name = True
         from_attributes = True
+
+
+class DBPoolStatsResponse(BaseModel):
+    pool_class: str
+    pooled: bool
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    timeout: Optional[float] = None
+    pid: int
+
+
+class PasswordHashingStatsResponse(BaseModel):
+    max_workers: int
+    rounds: int
+    in_flight: int
+    queue_depth: int
+    peak_queue_depth: int
+    completed: int
+    avg_wait_ms: float
+    avg_run_ms: float
+    pid: int
+
+
+class LLMClientStatsResponse(BaseModel):
+    requests: int
+    new_connections: int
+    reused_connections: int
+    reuse_ratio: float
+    max_connections: Optional[int] = None
+    max_keepalive_connections: Optional[int] = None
+    keepalive_expiry: Optional[float] = None
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    pid: int
@@ -4,32 +4,44 @@ import jwt
 from dependency_injector.wiring import inject, Provide
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.app.container import AppContainer
+from src.app.settings import Settings
 from src.domain.entities.users import UserEntityWithDetails
 from src.domain.errors import UnauthorizedException
+from src.domain.interfaces.llm_provider import ILLMProvider
+from src.domain.interfaces.slot_holds import ISlotHoldStore
+from src.infrastructure.cache.doctor_roster import DoctorRosterCache
+from src.infrastructure.cache.identity import IdentityCache
 from src.infrastructure.database.uow import UoW
+from src.infrastructure.jobs.queue import JobQueue
 from src.infrastructure.repositories.appointments import AppointmentRepository
 from src.infrastructure.repositories.chat_messages import ChatMessageRepository
 from src.infrastructure.repositories.chat_sessions import ChatSessionRepository
 from src.infrastructure.repositories.doctors import DoctorRepository
 from src.infrastructure.repositories.medical_records import MedicalRecordRepository
 from src.infrastructure.repositories.schedules import ScheduleRepository
+from src.infrastructure.repositories.search import SearchRepository
 from src.infrastructure.repositories.specializations import SpecializationRepository
+from src.infrastructure.repositories.stats import StatsRepository
 from src.infrastructure.repositories.triage_candidates import TriageCandidateRepository
 from src.infrastructure.repositories.triage_runs import TriageRunRepository
 from src.infrastructure.repositories.users import UserRepository
 from src.infrastructure.services.jwt_service import JWTService
-from src.infrastructure.services.openai_service import OpenAIService
 from src.infrastructure.services.password_service import PasswordService
+from src.infrastructure.services.token_counter import TokenCounter
 from src.use_cases.appointments.use_case import AppointmentUseCase
+from src.use_cases.assistant.use_case import AssistantReplyUseCase
 from src.use_cases.chat.use_case import ChatUseCase
 from src.use_cases.doctors.use_case import DoctorUseCase
 from src.use_cases.medical_records.use_case import MedicalRecordUseCase
+from src.use_cases.schedules.availability import AvailabilityEngine
 from src.use_cases.schedules.use_case import ScheduleUseCase
+from src.use_cases.search.use_case import SearchUseCase
 from src.use_cases.specializations.use_case import SpecializationUseCase
 from src.use_cases.stats.use_case import StatsUseCase
+from src.use_cases.triage.scoring import DoctorScoringEngine
 from src.use_cases.triage.use_case import TriageUseCase
 from src.use_cases.users.use_case import UserUseCase
 
@@ -55,18 +67,27 @@ async def get_db_session(
 async def get_user_use_case(
         session: AsyncSession = Depends(get_db_session),
         jwt_service: JWTService = Depends(Provide[AppContainer.jwt_service]),
-        password_service: PasswordService = Depends(Provide[AppContainer.password_service])
+        password_service: PasswordService = Depends(Provide[AppContainer.password_service]),
+        identity_cache: IdentityCache = Depends(Provide[AppContainer.identity_cache]),
+        roster_cache: DoctorRosterCache = Depends(Provide[AppContainer.doctor_roster_cache]),
+        settings: Settings = Depends(Provide[AppContainer.settings]),
 ) -> UserUseCase:
     return UserUseCase(
         uow=UoW(session),
         user_repository=UserRepository(session),
         jwt_service=jwt_service,
         password_service=password_service,
+        identity_cache=identity_cache,
+        claims_only_tokens=settings.AUTH_CLAIMS_ONLY,
+        roster_cache=roster_cache,
     )
 
 
+@inject
 async def get_doctor_use_case(
         session: AsyncSession = Depends(get_db_session),
+        roster_cache: DoctorRosterCache = Depends(Provide[AppContainer.doctor_roster_cache]),
+        identity_cache: IdentityCache = Depends(Provide[AppContainer.identity_cache]),
 ) -> DoctorUseCase:
     return DoctorUseCase(
         uow=UoW(session),
@@ -74,6 +95,8 @@ async def get_doctor_use_case(
         user_repository=UserRepository(session),
         specialization_repository=SpecializationRepository(session),
         appointment_repository=AppointmentRepository(session),
+        roster_cache=roster_cache,
+        identity_cache=identity_cache,
     )
 
 
@@ -86,14 +109,17 @@ async def get_specialization_use_case(
     )
 
 
+@inject
 async def get_schedule_use_case(
         session: AsyncSession = Depends(get_db_session),
+        slot_holds: ISlotHoldStore = Depends(Provide[AppContainer.slot_hold_store]),
 ) -> ScheduleUseCase:
     return ScheduleUseCase(
         uow=UoW(session),
         schedule_repository=ScheduleRepository(session),
         doctor_repository=DoctorRepository(session),
         appointment_repository=AppointmentRepository(session),
+        slot_holds=slot_holds,
     )
 
 
@@ -107,14 +133,20 @@ async def get_medical_record_use_case(
     )
 
 
+@inject
 async def get_appointment_use_case(
         session: AsyncSession = Depends(get_db_session),
+        slot_holds: ISlotHoldStore = Depends(Provide[AppContainer.slot_hold_store]),
+        settings: Settings = Depends(Provide[AppContainer.settings]),
 ) -> AppointmentUseCase:
     return AppointmentUseCase(
         uow=UoW(session),
         appointment_repository=AppointmentRepository(session),
         doctor_repository=DoctorRepository(session),
         schedule_repository=ScheduleRepository(session),
+        slot_holds=slot_holds,
+        slot_hold_ttl_seconds=settings.SLOT_HOLD_TTL_SECONDS,
+        slot_hold_max_per_patient=settings.SLOT_HOLD_MAX_PER_PATIENT,
     )
 
 
@@ -128,8 +160,10 @@ async def get_chat_use_case(
     )
 
 
+@inject
 async def get_triage_use_case(
         session: AsyncSession = Depends(get_db_session),
+        scoring_engine: DoctorScoringEngine = Depends(Provide[AppContainer.doctor_scoring_engine]),
 ) -> TriageUseCase:
     return TriageUseCase(
         uow=UoW(session),
@@ -138,26 +172,115 @@ async def get_triage_use_case(
         chat_session_repository=ChatSessionRepository(session),
         doctor_repository=DoctorRepository(session),
         specialization_repository=SpecializationRepository(session),
+        scoring_engine=scoring_engine,
+        availability_engine=AvailabilityEngine(
+            ScheduleRepository(session),
+            AppointmentRepository(session),
+        ),
     )
 
 
+@inject
 async def get_stats_use_case(
         session: AsyncSession = Depends(get_db_session),
+        settings: Settings = Depends(Provide[AppContainer.settings]),
 ) -> StatsUseCase:
     return StatsUseCase(
         uow=UoW(session),
-        user_repository=UserRepository(session),
-        doctor_repository=DoctorRepository(session),
-        appointment_repository=AppointmentRepository(session),
-        medical_record_repository=MedicalRecordRepository(session),
+        stats_repository=StatsRepository(session),
+        use_snapshot=settings.ADMIN_STATS_USE_SNAPSHOT,
+        snapshot_max_age_seconds=settings.ADMIN_STATS_SNAPSHOT_MAX_AGE_SECONDS,
     )
 
 
+async def get_search_use_case(
+        session: AsyncSession = Depends(get_db_session),
+) -> SearchUseCase:
+    return SearchUseCase(search_repository=SearchRepository(session))
+
+
 @inject
-def get_openai_service(
-        openai_service: OpenAIService = Depends(Provide[AppContainer.openai_service]),
-) -> OpenAIService:
-    return openai_service
+def get_db_engine(
+        engine: AsyncEngine = Depends(Provide[AppContainer.engine]),
+) -> AsyncEngine:
+    return engine
+
+
+@inject
+def get_settings(
+        settings: Settings = Depends(Provide[AppContainer.settings]),
+) -> Settings:
+    return settings
+
+
+@inject
+def get_password_service(
+        password_service: PasswordService = Depends(Provide[AppContainer.password_service]),
+) -> PasswordService:
+    return password_service
+
+
+@inject
+def get_llm_provider(
+        llm_provider: ILLMProvider = Depends(Provide[AppContainer.llm_provider]),
+) -> ILLMProvider:
+    return llm_provider
+
+
+@inject
+def get_job_queue(
+        job_queue: JobQueue = Depends(Provide[AppContainer.job_queue]),
+) -> JobQueue:
+    return job_queue
+
+
+@inject
+async def get_assistant_reply_use_case(
+        chat_use_case: ChatUseCase = Depends(get_chat_use_case),
+        doctor_use_case: DoctorUseCase = Depends(get_doctor_use_case),
+        triage_use_case: TriageUseCase = Depends(get_triage_use_case),
+        llm_provider: ILLMProvider = Depends(get_llm_provider),
+        token_counter: TokenCounter = Depends(Provide[AppContainer.token_counter]),
+        settings: Settings = Depends(Provide[AppContainer.settings]),
+) -> AssistantReplyUseCase:
+    return AssistantReplyUseCase(
+        chat_use_case=chat_use_case,
+        doctor_use_case=doctor_use_case,
+        llm_provider=llm_provider,
+        token_counter=token_counter,
+        context_token_budget=settings.CHAT_CONTEXT_TOKEN_BUDGET,
+        max_context_messages=settings.CHAT_CONTEXT_MAX_MESSAGES,
+        triage_use_case=triage_use_case,
+    )
+
+
+async def _resolve_user(
+        decoded: dict,
+        session: AsyncSession,
+        identity_cache: IdentityCache,
+        claims_only: bool,
+) -> Optional[UserEntityWithDetails]:
+    try:
+        user_id = int(decoded.get("sub"))
+    except (TypeError, ValueError):
+        return None
+
+    if claims_only:
+        user = JWTService.user_from_claims(decoded)
+        if user is not None:
+            return user
+
+    iat = decoded.get("iat")
+    if iat is not None:
+        user = await identity_cache.get(user_id, iat)
+        if user is not None:
+            return user
+
+    user_repository = UserRepository(session)
+    user = await user_repository.get_user_with_details(user_id)
+    if user is not None and iat is not None:
+        await identity_cache.set(iat, user)
+    return user
 
 
 @inject
@@ -165,6 +288,8 @@ async def get_current_user(
         credentials: HTTPAuthorizationCredentials | None = Depends(http_bearer),
         session: AsyncSession = Depends(get_db_session),
         jwt_service: JWTService = Depends(Provide[AppContainer.jwt_service]),
+        identity_cache: IdentityCache = Depends(Provide[AppContainer.identity_cache]),
+        settings: Settings = Depends(Provide[AppContainer.settings]),
 ) -> UserEntityWithDetails:
     if credentials is None or not credentials.credentials:
         raise UnauthorizedException("Token is required")
@@ -176,14 +301,7 @@ async def get_current_user(
     except jwt.InvalidTokenError:
         raise UnauthorizedException("Invalid token")
 
-    sub = decoded.get("sub")
-    try:
-        user_id = int(sub)
-    except (TypeError, ValueError):
-        raise UnauthorizedException("Invalid token")
-
-    user_repository = UserRepository(session)
-    user = await user_repository.get_user_with_details(user_id)
+    user = await _resolve_user(decoded, session, identity_cache, settings.AUTH_CLAIMS_ONLY)
     if user is None:
         raise UnauthorizedException("Invalid token")
 
@@ -195,6 +313,8 @@ async def get_current_user_optional(
         credentials: HTTPAuthorizationCredentials | None = Depends(http_bearer_optional),
         session: AsyncSession = Depends(get_db_session),
         jwt_service: JWTService = Depends(Provide[AppContainer.jwt_service]),
+        identity_cache: IdentityCache = Depends(Provide[AppContainer.identity_cache]),
+        settings: Settings = Depends(Provide[AppContainer.settings]),
 ) -> Optional[UserEntityWithDetails]:
     if credentials is None or not credentials.credentials:
         return None
@@ -204,14 +324,7 @@ async def get_current_user_optional(
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
         return None
 
-    sub = decoded.get("sub")
-    try:
-        user_id = int(sub)
-    except (TypeError, ValueError):
-        return None
-
-    user_repository = UserRepository(session)
-    return await user_repository.get_user_with_details(user_id)
+    return await _resolve_user(decoded, session, identity_cache, settings.AUTH_CLAIMS_ONLY)
 
 
 def requires_roles(*, is_admin: bool = False, is_doctor: bool = False) -> Callable[
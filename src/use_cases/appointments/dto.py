@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from typing import Optional
 
 from src.domain.constants import AppointmentStatus, VisitType
@@ -27,3 +27,48 @@ class UpdateAppointmentDTO(BaseDTOMixin):
     visit_type: Optional[VisitType] = None
     notes: Optional[str] = None
     cancel_reason: Optional[str] = None
+
+
+@dataclass
+class AppointmentStatusCountsDTO:
+    total: int = 0
+    active: int = 0
+    done: int = 0
+    scheduled: int = 0
+    confirmed: int = 0
+    in_progress: int = 0
+    completed: int = 0
+    cancelled: int = 0
+    no_show: int = 0
+
+    @classmethod
+    def from_counts(cls, counts: dict[AppointmentStatus, int]) -> "AppointmentStatusCountsDTO":
+        scheduled = counts.get(AppointmentStatus.SCHEDULED, 0)
+        confirmed = counts.get(AppointmentStatus.CONFIRMED, 0)
+        in_progress = counts.get(AppointmentStatus.IN_PROGRESS, 0)
+        completed = counts.get(AppointmentStatus.COMPLETED, 0)
+        return cls(
+            total=sum(counts.values()),
+            active=scheduled + confirmed + in_progress,
+            done=completed,
+            scheduled=scheduled,
+            confirmed=confirmed,
+            in_progress=in_progress,
+            completed=completed,
+            cancelled=counts.get(AppointmentStatus.CANCELLED, 0),
+            no_show=counts.get(AppointmentStatus.NO_SHOW, 0),
+        )
+
+
+@dataclass
+class DailyAppointmentStatsDTO:
+    day: date
+    counts: AppointmentStatusCountsDTO
+
+
+@dataclass
+class DoctorAppointmentStatsDTO:
+    date_from: date
+    date_to: date
+    totals: AppointmentStatusCountsDTO
+    days: list[DailyAppointmentStatsDTO] = field(default_factory=list)
@@ -1,15 +1,32 @@
+from dataclasses import asdict
 from datetime import datetime, date, timedelta
-from typing import List
+from typing import List, Optional
 
-from src.domain.constants import AppointmentStatus
-from src.domain.entities.appointments import AppointmentEntity, AppointmentWithDetailsEntity
+from src.domain.constants import AppointmentStatus, DoctorStatus
+from src.domain.entities.appointments import AppointmentEntity, AppointmentWithDetailsEntity, SlotHoldEntity
+from src.domain.entities.schedules import ScheduleEntity
 from src.domain.entities.users import UserEntityWithDetails
-from src.domain.errors import BadRequestException, NotFoundException, ForbiddenException
+from src.domain.errors import BadRequestException, ConflictException, NotFoundException, ForbiddenException
 from src.domain.interfaces.appointment_repository import IAppointmentRepository
 from src.domain.interfaces.doctor_repository import IDoctorRepository
 from src.domain.interfaces.schedule_repository import IScheduleRepository
+from src.domain.interfaces.slot_holds import ISlotHoldStore
 from src.domain.interfaces.uow import IUoW
-from src.use_cases.appointments.dto import CreateAppointmentDTO, UpdateAppointmentDTO
+from src.infrastructure.utilities.pagination import DATE_TIME_KEYSET
+from src.use_cases.appointments.dto import (
+    CreateAppointmentDTO,
+    UpdateAppointmentDTO,
+    AppointmentStatusCountsDTO,
+    DailyAppointmentStatsDTO,
+    DoctorAppointmentStatsDTO,
+)
+from src.use_cases.schedules.availability import AvailabilityEngine
+from src.use_cases.schedules.dto import DoctorAvailabilityRangeDTO
+
+DEFAULT_STATS_RANGE_DAYS = 7
+MAX_STATS_RANGE_DAYS = 92
+DEFAULT_AVAILABILITY_RANGE_DAYS = 7
+MAX_AVAILABILITY_RANGE_DAYS = 42
 
 
 class AppointmentUseCase:
@@ -19,11 +36,20 @@ class AppointmentUseCase:
             appointment_repository: IAppointmentRepository,
             doctor_repository: IDoctorRepository,
             schedule_repository: IScheduleRepository,
+            slot_holds: Optional[ISlotHoldStore] = None,
+            slot_hold_ttl_seconds: int = 120,
+            slot_hold_max_per_patient: Optional[int] = 3,
     ):
         self._uow = uow
         self._appointment_repo = appointment_repository
         self._doctor_repo = doctor_repository
         self._schedule_repo = schedule_repository
+        self._slot_holds = slot_holds
+        self._slot_hold_ttl_seconds = slot_hold_ttl_seconds
+        self._slot_hold_max_per_patient = slot_hold_max_per_patient
+        self._availability = AvailabilityEngine(
+            schedule_repository, appointment_repository, slot_holds
+        )
 
     async def create_appointment(
             self, appointment: CreateAppointmentDTO, user_id: int
@@ -31,47 +57,83 @@ class AppointmentUseCase:
         if appointment.patient_id != user_id:
             raise ForbiddenException("Cannot book appointment for another user")
 
-        if appointment.date_time.replace(tzinfo=None) <= datetime.now():
-            raise BadRequestException("Cannot book appointment in the past")
-
-        doctor = await self._doctor_repo.get_doctor_by_id(appointment.doctor_id)
-        if not doctor:
-            raise NotFoundException("Doctor not found")
-
-        await self._validate_appointment_slot(appointment.doctor_id, appointment.date_time)
-
-        is_available = await self._appointment_repo.check_slot_availability(
-            appointment.doctor_id, appointment.date_time
-        )
-        if not is_available:
-            raise BadRequestException("This time slot is already booked")
-
-        async with self._uow:
-            created = await self._appointment_repo.create_appointment(appointment)
-        return created
+        return await self._book(appointment, respect_holds=True)
 
     async def admin_create_appointment(
             self, appointment: CreateAppointmentDTO
     ) -> AppointmentEntity:
         """Admin can create appointments for any patient without restrictions."""
+        return await self._book(appointment, respect_holds=False)
+
+    async def _book(
+            self, appointment: CreateAppointmentDTO, respect_holds: bool
+    ) -> AppointmentEntity:
         if appointment.date_time.replace(tzinfo=None) <= datetime.now():
             raise BadRequestException("Cannot book appointment in the past")
 
+        if respect_holds and self._slot_holds is not None:
+            holders = await self._slot_holds.get_holders(
+                appointment.doctor_id, [appointment.date_time]
+            )
+            holder = holders.get(appointment.date_time)
+            if holder is not None and holder != appointment.patient_id:
+                raise ConflictException("This time slot is held by another patient")
+
+        async with self._uow:
+            created = await self._appointment_repo.book_appointment(appointment)
+        if created:
+            if self._slot_holds is not None:
+                await self._slot_holds.release(
+                    appointment.doctor_id, appointment.date_time, appointment.patient_id
+                )
+            return created
+
+        # The conditional insert was rejected; work out why only on this slow path.
         doctor = await self._doctor_repo.get_doctor_by_id(appointment.doctor_id)
         if not doctor:
             raise NotFoundException("Doctor not found")
-
         await self._validate_appointment_slot(appointment.doctor_id, appointment.date_time)
+        raise ConflictException("This time slot is already booked")
 
-        is_available = await self._appointment_repo.check_slot_availability(
-            appointment.doctor_id, appointment.date_time
+    async def hold_slot(
+            self, doctor_id: int, date_time: datetime, user_id: int
+    ) -> SlotHoldEntity:
+        """Reserve a slot for the patient for a short time before booking it."""
+        if self._slot_holds is None:
+            raise BadRequestException("Slot holds are not enabled")
+        if date_time.replace(tzinfo=None) <= datetime.now():
+            raise BadRequestException("Cannot hold a slot in the past")
+
+        doctor = await self._doctor_repo.get_doctor_by_id(doctor_id)
+        if not doctor:
+            raise NotFoundException("Doctor not found")
+        if doctor.status != DoctorStatus.APPROVED:
+            raise BadRequestException("Doctor is not accepting appointments")
+        schedule = await self._validate_appointment_slot(doctor_id, date_time)
+        self._validate_slot_grid(schedule, date_time)
+
+        hold = await self._slot_holds.acquire(
+            doctor_id,
+            date_time,
+            user_id,
+            self._slot_hold_ttl_seconds,
+            max_per_patient=self._slot_hold_max_per_patient,
         )
+        if hold is None:
+            raise ConflictException("This time slot is held by another patient")
+
+        is_available = await self._appointment_repo.check_slot_availability(doctor_id, date_time)
         if not is_available:
-            raise BadRequestException("This time slot is already booked")
+            await self._slot_holds.release(doctor_id, date_time, user_id)
+            raise ConflictException("This time slot is already booked")
+        return hold
 
-        async with self._uow:
-            created = await self._appointment_repo.create_appointment(appointment)
-        return created
+    async def release_slot_hold(
+            self, doctor_id: int, date_time: datetime, user_id: int
+    ) -> bool:
+        if self._slot_holds is None:
+            return False
+        return await self._slot_holds.release(doctor_id, date_time, user_id)
 
     async def update_appointment(
             self,
@@ -98,10 +160,13 @@ class AppointmentUseCase:
             await self._validate_appointment_slot(existing.doctor_id, appointment.date_time)
 
             is_available = await self._appointment_repo.check_slot_availability(
-                existing.doctor_id, appointment.date_time
+                existing.doctor_id,
+                appointment.date_time,
+                appointment.duration_minutes or existing.duration_minutes,
+                exclude_appointment_id=appointment_id,
             )
             if not is_available:
-                raise BadRequestException("This time slot is already booked")
+                raise ConflictException("This time slot is already booked")
 
         if appointment.status and not is_doctor and not is_admin:
             allowed_patient_statuses = [AppointmentStatus.CANCELLED]
@@ -158,9 +223,14 @@ class AppointmentUseCase:
             status: AppointmentStatus | None = None,
             skip: int = 0,
             limit: int = 20,
+            cursor: str | None = None,
     ) -> list[AppointmentWithDetailsEntity]:
         return await self._appointment_repo.get_appointments_by_patient_id(
-            user_id, status=status, skip=skip, limit=limit
+            user_id,
+            status=status,
+            skip=skip,
+            limit=limit,
+            after=DATE_TIME_KEYSET.decode(cursor),
         )
 
     async def get_doctor_appointments(
@@ -172,6 +242,7 @@ class AppointmentUseCase:
             date_to: date | None = None,
             skip: int = 0,
             limit: int = 20,
+            cursor: str | None = None,
     ) -> List[AppointmentWithDetailsEntity]:
         db_doctor = await self._doctor_repo.get_doctor_by_id(doctor_id)
         if not db_doctor:
@@ -186,6 +257,7 @@ class AppointmentUseCase:
             date_to=date_to,
             skip=skip,
             limit=limit,
+            after=DATE_TIME_KEYSET.decode(cursor),
         )
 
     async def get_my_doctor_appointments(
@@ -196,6 +268,7 @@ class AppointmentUseCase:
             date_to: date | None = None,
             skip: int = 0,
             limit: int = 20,
+            cursor: str | None = None,
     ) -> List[AppointmentWithDetailsEntity]:
         # Get doctor by user_id first
         doctor = await self._doctor_repo.get_doctor_by_user_id(user_id)
@@ -209,6 +282,7 @@ class AppointmentUseCase:
             date_to=date_to,
             skip=skip,
             limit=limit,
+            after=DATE_TIME_KEYSET.decode(cursor),
         )
 
     async def get_my_doctor_appointments_stats(
@@ -219,39 +293,63 @@ class AppointmentUseCase:
         """Get appointment statistics for a doctor."""
         doctor = await self._doctor_repo.get_doctor_by_user_id(user_id)
         if not doctor:
-            return {"total": 0, "active": 0, "done": 0, "scheduled": 0, "cancelled": 0}
-
-        # Get appointments for the date (or all if no date specified)
-        date_from = target_date if target_date else None
-        date_to = target_date if target_date else None
+            return asdict(AppointmentStatusCountsDTO())
 
-        appointments = await self._appointment_repo.get_appointments_by_doctor_id(
+        rows = await self._appointment_repo.count_doctor_appointments_by_status(
             doctor.id,
-            date_from=date_from,
-            date_to=date_to,
-            skip=0,
-            limit=1000,
+            date_from=target_date,
+            date_to=target_date,
         )
+        counts = {row.status: row.count for row in rows}
+        return asdict(AppointmentStatusCountsDTO.from_counts(counts))
 
-        total = len(appointments)
-        scheduled = sum(1 for a in appointments if a.status == AppointmentStatus.SCHEDULED)
-        confirmed = sum(1 for a in appointments if a.status == AppointmentStatus.CONFIRMED)
-        in_progress = sum(1 for a in appointments if a.status == AppointmentStatus.IN_PROGRESS)
-        completed = sum(1 for a in appointments if a.status == AppointmentStatus.COMPLETED)
-        cancelled = sum(1 for a in appointments if a.status == AppointmentStatus.CANCELLED)
-        no_show = sum(1 for a in appointments if a.status == AppointmentStatus.NO_SHOW)
+    async def get_my_doctor_daily_stats(
+            self,
+            user_id: int,
+            date_from: date | None = None,
+            date_to: date | None = None,
+    ) -> DoctorAppointmentStatsDTO:
+        """Get per-day appointment statistics for a doctor over a date range."""
+        date_from = date_from or date.today()
+        date_to = date_to or date_from + timedelta(days=DEFAULT_STATS_RANGE_DAYS - 1)
+        if date_to < date_from:
+            raise BadRequestException("date_to must not be before date_from")
+        if (date_to - date_from).days >= MAX_STATS_RANGE_DAYS:
+            raise BadRequestException(
+                f"Date range cannot exceed {MAX_STATS_RANGE_DAYS} days"
+            )
 
-        return {
-            "total": total,
-            "active": scheduled + confirmed + in_progress,
-            "done": completed,
-            "scheduled": scheduled,
-            "confirmed": confirmed,
-            "in_progress": in_progress,
-            "completed": completed,
-            "cancelled": cancelled,
-            "no_show": no_show,
-        }
+        per_day: dict[date, dict[AppointmentStatus, int]] = {}
+        doctor = await self._doctor_repo.get_doctor_by_user_id(user_id)
+        if doctor:
+            rows = await self._appointment_repo.count_doctor_appointments_by_status(
+                doctor.id,
+                date_from=date_from,
+                date_to=date_to,
+                by_day=True,
+            )
+            for row in rows:
+                per_day.setdefault(row.day, {})[row.status] = row.count
+
+        totals: dict[AppointmentStatus, int] = {}
+        days = []
+        current = date_from
+        while current <= date_to:
+            counts = per_day.get(current, {})
+            for status, count in counts.items():
+                totals[status] = totals.get(status, 0) + count
+            days.append(DailyAppointmentStatsDTO(
+                day=current,
+                counts=AppointmentStatusCountsDTO.from_counts(counts),
+            ))
+            current += timedelta(days=1)
+
+        return DoctorAppointmentStatsDTO(
+            date_from=date_from,
+            date_to=date_to,
+            totals=AppointmentStatusCountsDTO.from_counts(totals),
+            days=days,
+        )
 
     async def confirm_appointment(self, appointment_id: int, user_id: int) -> AppointmentEntity:
         """Confirm a scheduled appointment (SCHEDULED → CONFIRMED)."""
@@ -319,53 +417,45 @@ class AppointmentUseCase:
         if not doctor:
             raise NotFoundException("Doctor not found")
 
-        day_of_week = target_date.weekday()
-        schedule = await self._schedule_repo.get_schedule_by_doctor_and_day(
-            doctor_id, day_of_week
+        now = datetime.now()
+        availability = await self._availability.get_availability(
+            [doctor_id], target_date, target_date, now=now
         )
-
-        if not schedule or not schedule.is_active:
-            return {
-                "doctor_id": doctor_id,
-                "date": target_date.isoformat(),
-                "slots": [],
-            }
-
-        booked_appointments = await self._appointment_repo.get_doctor_appointments_for_date(
-            doctor_id, target_date
-        )
-
-        booked_times = set()
-        for appt in booked_appointments:
-            slot_start = appt.date_time
-            slot_end = slot_start + timedelta(minutes=appt.duration_minutes)
-            current = slot_start
-            while current < slot_end:
-                booked_times.add(current)
-                current += timedelta(minutes=schedule.slot_duration_minutes)
-
-        slots = []
-        current_time = datetime.combine(target_date, schedule.start_time)
-        end_time = datetime.combine(target_date, schedule.end_time)
-        slot_duration = timedelta(minutes=schedule.slot_duration_minutes)
-
-        while current_time + slot_duration <= end_time:
-            is_available = current_time not in booked_times
-            if current_time > datetime.now():
-                slots.append({
-                    "start_time": current_time,
-                    "end_time": current_time + slot_duration,
-                    "is_available": is_available,
-                })
-            current_time += slot_duration
+        day = availability[doctor_id][0]
 
         return {
             "doctor_id": doctor_id,
             "date": target_date.isoformat(),
-            "slots": slots,
+            "slots": [asdict(slot) for slot in day.slots if slot.start_time > now],
         }
 
-    async def _validate_appointment_slot(self, doctor_id: int, date_time: datetime) -> None:
+    async def get_doctor_availability_range(
+        self, doctor_id: int, date_from: date, date_to: date | None = None
+    ) -> DoctorAvailabilityRangeDTO:
+        """Get time slots for a doctor for every day in a date range."""
+        date_to = date_to or date_from + timedelta(days=DEFAULT_AVAILABILITY_RANGE_DAYS - 1)
+        if date_to < date_from:
+            raise BadRequestException("'to' must not be before 'from'")
+        if (date_to - date_from).days >= MAX_AVAILABILITY_RANGE_DAYS:
+            raise BadRequestException(
+                f"Date range cannot exceed {MAX_AVAILABILITY_RANGE_DAYS} days"
+            )
+
+        doctor = await self._doctor_repo.get_doctor_by_id(doctor_id)
+        if not doctor:
+            raise NotFoundException("Doctor not found")
+
+        availability = await self._availability.get_availability(
+            [doctor_id], date_from, date_to
+        )
+        return DoctorAvailabilityRangeDTO(
+            doctor_id=doctor_id,
+            date_from=date_from,
+            date_to=date_to,
+            days=availability[doctor_id],
+        )
+
+    async def _validate_appointment_slot(self, doctor_id: int, date_time: datetime) -> ScheduleEntity:
         day_of_week = date_time.weekday()
         appointment_time = date_time.time()
 
@@ -378,3 +468,16 @@ class AppointmentUseCase:
             raise BadRequestException(
                 f"Appointment time must be between {schedule.start_time} and {schedule.end_time}"
             )
+        return schedule
+
+    @staticmethod
+    def _validate_slot_grid(schedule: ScheduleEntity, date_time: datetime) -> None:
+        """Require the time to start one of the slots AvailabilityEngine generates for the day."""
+        start = datetime.combine(date.min, schedule.start_time)
+        end = datetime.combine(date.min, schedule.end_time)
+        slot_start = datetime.combine(date.min, date_time.time())
+        slot_duration = timedelta(minutes=schedule.slot_duration_minutes)
+        if (slot_start - start) % slot_duration or slot_start + slot_duration > end:
+            raise BadRequestException(
+                f"Time must fall on the doctor's {schedule.slot_duration_minutes}-minute slot grid"
+            )
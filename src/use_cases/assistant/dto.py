@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.domain.entities.chat_messages import ChatMessageEntity
+from src.domain.entities.doctors import DoctorRosterEntity
+from src.domain.entities.triage_runs import TriageRunWithDetailsEntity
+
+
+@dataclass
+class AssistantContextDTO:
+    messages: list[dict]
+    roster: DoctorRosterEntity
+    token_count: int = 0
+
+
+@dataclass
+class AssistantReplyDTO:
+    message: ChatMessageEntity
+    triage_run: Optional[TriageRunWithDetailsEntity] = None
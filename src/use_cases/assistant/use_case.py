@@ -0,0 +1,243 @@
+import logging
+import time
+from typing import Optional
+
+from src.domain.constants import ContentType, MessageRole
+from src.domain.entities.chat_messages import ChatMessageEntity
+from src.domain.entities.doctors import DoctorRosterEntity
+from src.domain.entities.triage_runs import TriageRunWithDetailsEntity
+from src.domain.interfaces.llm_provider import ILLMProvider
+from src.infrastructure.services.token_counter import TokenCounter
+from src.use_cases.assistant.dto import AssistantContextDTO, AssistantReplyDTO
+from src.use_cases.chat.use_case import ChatUseCase
+from src.use_cases.doctors.use_case import DoctorUseCase
+from src.use_cases.triage.recommendation import extract_recommendation
+from src.use_cases.triage.use_case import TriageUseCase
+
+ASSISTANT_REPLY_JOB = "assistant_reply"
+REPLY_TEMPERATURE = 0.7
+
+logger = logging.getLogger(__name__)
+
+
+class AssistantReplyUseCase:
+    """Builds the model context for a chat session and persists the assistant reply."""
+
+    def __init__(
+            self,
+            chat_use_case: ChatUseCase,
+            doctor_use_case: DoctorUseCase,
+            llm_provider: ILLMProvider,
+            token_counter: Optional[TokenCounter] = None,
+            context_token_budget: int = 3000,
+            max_context_messages: int = 200,
+            triage_use_case: Optional[TriageUseCase] = None,
+    ):
+        self._chat = chat_use_case
+        self._doctors = doctor_use_case
+        self._llm = llm_provider
+        self._triage = triage_use_case
+        self._tokens = token_counter or TokenCounter()
+        self._context_token_budget = context_token_budget
+        self._max_context_messages = max_context_messages
+
+    async def build_context(self, session_id: int) -> AssistantContextDTO:
+        """
+        Recent messages that fit the token budget, preceded by a rolling summary
+        of everything older (kept in ChatSession.context_json["summary"]).
+        Unsummarized messages beyond max_context_messages are folded into the
+        summary first rather than dropped.
+        """
+        session = await self._chat.get_session_by_id(session_id, is_admin=True)
+        context_json = dict(session.context_json or {})
+        summary = context_json.get("summary") or {}
+
+        messages = await self._chat.get_recent_messages(
+            session_id,
+            after_message_id=summary.get("through_message_id"),
+            limit=self._max_context_messages + 1,
+            is_admin=True,
+        )
+        if len(messages) > self._max_context_messages:
+            messages = messages[1:]
+            summary = await self._summarize_backlog(session_id, context_json, summary, before_id=messages[0].id)
+        token_counts = await self._get_token_counts(messages)
+
+        budget = self._context_token_budget
+        if summary.get("text"):
+            budget -= self._tokens.count_message(summary["text"])
+        start = self.select_window(token_counts, budget)
+        overflow, window = messages[:start], messages[start:]
+
+        if overflow:
+            try:
+                summary = await self._fold_into_summary(session_id, context_json, summary, overflow)
+            except Exception as e:
+                logger.error(f"Failed to summarize chat session {session_id}: {e}")
+
+        context_messages = [self._to_llm_message(m) for m in window]
+        if summary.get("text"):
+            context_messages.insert(0, {
+                "role": MessageRole.SYSTEM.value,
+                "content": f"Summary of the earlier conversation:\n{summary['text']}",
+            })
+
+        roster = await self._doctors.get_prompt_roster(
+            render=self._llm.format_doctors_for_prompt, limit=50
+        )
+        return AssistantContextDTO(
+            messages=context_messages,
+            roster=roster,
+            token_count=sum(token_counts[start:]),
+        )
+
+    async def _summarize_backlog(
+            self, session_id: int, context_json: dict, summary: dict, before_id: int
+    ) -> dict:
+        """Fold unsummarized messages older than ``before_id`` into the summary, a page at a time."""
+        while True:
+            page = await self._chat.get_messages_after(
+                session_id,
+                after_message_id=summary.get("through_message_id") or 0,
+                limit=self._max_context_messages,
+                is_admin=True,
+            )
+            page = [m for m in page if m.id < before_id]
+            if not page:
+                return summary
+            try:
+                summary = await self._fold_into_summary(session_id, context_json, summary, page)
+            except Exception as e:
+                logger.warning(
+                    f"Chat session {session_id} has more than {self._max_context_messages} unsummarized "
+                    f"messages and summarizing them failed; messages before {before_id} are left out: {e}"
+                )
+                return summary
+
+    async def _fold_into_summary(
+            self, session_id: int, context_json: dict, summary: dict, messages: list[ChatMessageEntity]
+    ) -> dict:
+        text = await self._llm.summarize_conversation(
+            [self._to_llm_message(m) for m in messages],
+            previous_summary=summary.get("text"),
+        )
+        summary = {
+            "text": text,
+            "through_message_id": messages[-1].id,
+            "message_count": summary.get("message_count", 0) + len(messages),
+        }
+        context_json["summary"] = summary
+        await self._chat.update_context(session_id, context_json)
+        return summary
+
+    async def generate_reply(self, session_id: int) -> AssistantReplyDTO:
+        context = await self.build_context(session_id)
+
+        usage: dict = {}
+        started_at = time.perf_counter()
+        content = await self._llm.chat(
+            messages=context.messages,
+            doctors=context.roster.doctors,
+            temperature=REPLY_TEMPERATURE,
+            doctors_section=context.roster.prompt_section,
+            usage=usage,
+        )
+        return await self.save_reply(
+            session_id,
+            content,
+            usage=usage,
+            latency_ms=int((time.perf_counter() - started_at) * 1000),
+            roster=context.roster,
+        )
+
+    async def save_reply(
+            self,
+            session_id: int,
+            content: str,
+            usage: dict,
+            latency_ms: int,
+            roster: Optional[DoctorRosterEntity] = None,
+    ) -> AssistantReplyDTO:
+        """
+        Save the assistant message and, when it carries a recommendation block,
+        the triage run and candidates derived from it.
+        """
+        message = await self._chat.send_message(
+            session_id=session_id,
+            content=content,
+            role=MessageRole.ASSISTANT,
+            content_type=ContentType.TEXT,
+            user_id=None,
+            is_admin=True,  # Allow system to post
+            model_name=self._llm.model,
+            token_input=usage.get("prompt_tokens"),
+            token_output=usage.get("completion_tokens"),
+            latency_ms=latency_ms,
+        )
+        triage_run = await self._record_triage(message, roster)
+        return AssistantReplyDTO(message=message, triage_run=triage_run)
+
+    async def _record_triage(
+            self,
+            message: ChatMessageEntity,
+            roster: Optional[DoctorRosterEntity],
+    ) -> Optional[TriageRunWithDetailsEntity]:
+        if self._triage is None:
+            return None
+
+        recommendation = extract_recommendation(message.content)
+        if recommendation is None:
+            return None
+
+        try:
+            return await self._triage.record_recommendation(
+                session_id=message.session_id,
+                recommendation=recommendation,
+                doctors=roster.doctors if roster else [],
+                trigger_message_id=message.id,
+                model_name=message.model_name,
+                temperature=REPLY_TEMPERATURE,
+                token_input=message.token_input,
+                token_output=message.token_output,
+                latency_ms=message.latency_ms,
+            )
+        except Exception as e:
+            # The reply itself is already saved; a failed triage must not lose it
+            logger.error(f"Failed to record triage for message {message.id}: {e}")
+            return None
+
+    @staticmethod
+    def select_window(token_counts: list[int], budget: int) -> int:
+        """Index of the oldest message kept so the newest messages fit the budget (always keeps one)."""
+        start = len(token_counts)
+        total = 0
+        for index in range(len(token_counts) - 1, -1, -1):
+            total += token_counts[index]
+            if total > budget and start < len(token_counts):
+                break
+            start = index
+        return start
+
+    async def _get_token_counts(self, messages: list[ChatMessageEntity]) -> list[int]:
+        """
+        Content token count per message, computed once and cached in
+        content_tokens (token_input/token_output are API usage, not content size).
+        """
+        counts: list[int] = []
+        missing: dict[int, int] = {}
+        for message in messages:
+            count = message.content_tokens
+            if count is None:
+                count = missing[message.id] = self._tokens.count(message.content)
+            counts.append(count + TokenCounter.MESSAGE_OVERHEAD)
+
+        if missing:
+            await self._chat.cache_content_tokens(missing)
+        return counts
+
+    @staticmethod
+    def _to_llm_message(message: ChatMessageEntity) -> dict:
+        return {
+            "role": message.role.value if hasattr(message.role, 'value') else message.role,
+            "content": message.content,
+        }
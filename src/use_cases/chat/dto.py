@@ -8,6 +8,7 @@ from src.domain.constants import (
     MessageRole,
     ContentType,
 )
+from src.domain.entities.chat_messages import ChatMessageEntity
 from src.infrastructure.utilities.dto import BaseDTOMixin
 
 
@@ -37,3 +38,14 @@ class CreateChatMessageDTO(BaseDTOMixin):
     token_input: Optional[int] = None
     token_output: Optional[int] = None
     latency_ms: Optional[int] = None
+
+
+@dataclass
+class ChatMessageDeltaDTO:
+    """
+    Messages after a client's last seen id. ``version`` identifies the session
+    state the client is now up to date with; None when more messages remain.
+    """
+    version: Optional[str]
+    messages: list[ChatMessageEntity]
+    not_modified: bool = False
@@ -10,13 +10,16 @@ from src.domain.constants import (
 from src.domain.entities.chat_messages import ChatMessageEntity
 from src.domain.entities.chat_sessions import (
     ChatSessionEntity,
+    ChatSessionInboxEntity,
     ChatSessionWithMessagesEntity,
 )
 from src.domain.errors import BadRequestException, NotFoundException, ForbiddenException
 from src.domain.interfaces.chat_message_repository import IChatMessageRepository
 from src.domain.interfaces.chat_session_repository import IChatSessionRepository
 from src.domain.interfaces.uow import IUoW
+from src.infrastructure.utilities.pagination import CREATED_AT_KEYSET
 from src.use_cases.chat.dto import (
+    ChatMessageDeltaDTO,
     CreateChatSessionDTO,
     UpdateChatSessionDTO,
     CreateChatMessageDTO,
@@ -72,8 +75,12 @@ class ChatUseCase:
         session_id: int,
         user_id: Optional[int] = None,
         is_admin: bool = False,
+        tail: Optional[int] = None,
+        before_id: Optional[int] = None,
     ) -> ChatSessionWithMessagesEntity:
-        session = await self._session_repo.get_session_with_messages(session_id)
+        session = await self._session_repo.get_session_with_messages(
+            session_id, limit=tail, before_id=before_id
+        )
         if not session:
             raise NotFoundException("Chat session not found")
 
@@ -88,9 +95,30 @@ class ChatUseCase:
         status: Optional[ChatSessionStatus] = None,
         skip: int = 0,
         limit: int = 20,
+        cursor: Optional[str] = None,
     ) -> List[ChatSessionEntity]:
         return await self._session_repo.get_sessions_by_user_id(
-            user_id, status=status, skip=skip, limit=limit
+            user_id,
+            status=status,
+            skip=skip,
+            limit=limit,
+            after=CREATED_AT_KEYSET.decode(cursor),
+        )
+
+    async def get_my_inbox(
+        self,
+        user_id: int,
+        status: Optional[ChatSessionStatus] = None,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> List[ChatSessionInboxEntity]:
+        return await self._session_repo.get_session_inbox_by_user_id(
+            user_id,
+            status=status,
+            skip=skip,
+            limit=limit,
+            after=CREATED_AT_KEYSET.decode(cursor),
         )
 
     async def close_session(
@@ -168,6 +196,7 @@ class ChatUseCase:
         is_admin: bool = False,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[ChatMessageEntity]:
         session = await self._session_repo.get_session_by_id(session_id)
         if not session:
@@ -177,9 +206,77 @@ class ChatUseCase:
             raise ForbiddenException("Access denied")
 
         return await self._message_repo.get_messages_by_session_id(
-            session_id, skip=skip, limit=limit
+            session_id, skip=skip, limit=limit, after=CREATED_AT_KEYSET.decode(cursor)
+        )
+
+    async def get_recent_messages(
+        self,
+        session_id: int,
+        after_message_id: Optional[int] = None,
+        limit: int = 200,
+        user_id: Optional[int] = None,
+        is_admin: bool = False,
+    ) -> List[ChatMessageEntity]:
+        """Latest messages (oldest first), optionally only those after a given message."""
+        await self.get_session_by_id(session_id, user_id=user_id, is_admin=is_admin)
+        return await self._message_repo.get_recent_messages(
+            session_id, after_id=after_message_id, limit=limit
         )
 
+    async def get_messages_after(
+        self,
+        session_id: int,
+        after_message_id: int = 0,
+        limit: int = 100,
+        user_id: Optional[int] = None,
+        is_admin: bool = False,
+    ) -> List[ChatMessageEntity]:
+        """Oldest messages after a given message (oldest first)."""
+        await self.get_session_by_id(session_id, user_id=user_id, is_admin=is_admin)
+        return await self._message_repo.get_messages_after(session_id, after_message_id, limit=limit)
+
+    async def get_message_delta(
+        self,
+        session_id: int,
+        after_id: int = 0,
+        known_version: Optional[str] = None,
+        limit: int = 100,
+        user_id: Optional[int] = None,
+        is_admin: bool = False,
+    ) -> ChatMessageDeltaDTO:
+        """
+        Messages newer than ``after_id``. When ``known_version`` still matches the
+        session's last_message_at the messages table is not queried at all.
+        """
+        session = await self.get_session_by_id(session_id, user_id=user_id, is_admin=is_admin)
+        version = self.delta_version(session, after_id)
+        if known_version == version:
+            return ChatMessageDeltaDTO(version=version, messages=[], not_modified=True)
+
+        messages = await self._message_repo.get_messages_after(session_id, after_id, limit=limit)
+        if len(messages) >= limit:
+            # Possibly truncated: the client must poll again, so don't hand out a matching version
+            return ChatMessageDeltaDTO(version=None, messages=messages)
+
+        last_id = messages[-1].id if messages else after_id
+        return ChatMessageDeltaDTO(version=self.delta_version(session, last_id), messages=messages)
+
+    @staticmethod
+    def delta_version(session: ChatSessionEntity, after_id: int) -> str:
+        last_message_at = session.last_message_at
+        stamp = int(last_message_at.timestamp() * 1_000_000) if last_message_at else 0
+        return f"{session.id}.{stamp}.{after_id}"
+
+    async def cache_content_tokens(self, counts: dict[int, int]) -> None:
+        async with self._uow:
+            await self._message_repo.update_content_tokens(counts)
+
+    async def update_context(self, session_id: int, context_json: dict) -> ChatSessionEntity:
+        async with self._uow:
+            return await self._session_repo.update_session(
+                session_id, UpdateChatSessionDTO(context_json=context_json)
+            )
+
     async def delete_session(
         self,
         session_id: int,
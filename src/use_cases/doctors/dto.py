@@ -44,3 +44,19 @@ class UpdateDoctorDTO(BaseDTOMixin):
     license_number: Optional[str] = None
     status: Optional[DoctorStatus] = None
     rejection_reason: Optional[str] = None
+
+
+@dataclass
+class DoctorMatchWeightsDTO:
+    """
+    Multipliers for the triage match score components: rating (rating * 10),
+    experience (2 points per year, capped at 20) and availability (10 points
+    when the doctor has an active schedule).
+    """
+    rating: float = 1.0
+    experience: float = 1.0
+    availability: float = 0.0
+
+    @property
+    def is_default(self) -> bool:
+        return (self.rating, self.experience, self.availability) == (1.0, 1.0, 0.0)
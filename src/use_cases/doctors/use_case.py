@@ -1,7 +1,7 @@
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 from src.domain.constants import DoctorStatus
-from src.domain.entities.doctors import DoctorEntity, DoctorWithDetailsEntity
+from src.domain.entities.doctors import DoctorEntity, DoctorRosterEntity, DoctorWithDetailsEntity
 from src.domain.entities.users import DoctorPatientEntity
 from src.domain.errors import BadRequestException, NotFoundException
 from src.domain.interfaces.appointment_repository import IAppointmentRepository
@@ -9,6 +9,9 @@ from src.domain.interfaces.doctor_repository import IDoctorRepository
 from src.domain.interfaces.specialization_repository import ISpecializationRepository
 from src.domain.interfaces.uow import IUoW
 from src.domain.interfaces.user_repository import IUserRepository
+from src.infrastructure.cache.doctor_roster import DoctorRosterCache
+from src.infrastructure.cache.identity import IdentityCache
+from src.infrastructure.utilities.pagination import DOCTOR_PATIENT_KEYSET, ID_KEYSET
 from src.use_cases.doctors.dto import (
     CreateDoctorDTO,
     RegisterDoctorDTO,
@@ -24,12 +27,16 @@ class DoctorUseCase:
             user_repository: IUserRepository,
             specialization_repository: ISpecializationRepository,
             appointment_repository: Optional[IAppointmentRepository] = None,
+            roster_cache: Optional[DoctorRosterCache] = None,
+            identity_cache: Optional[IdentityCache] = None,
     ):
         self._uow = uow
         self._doctor_repo = doctor_repository
         self._user_repo = user_repository
         self._specialization_repo = specialization_repository
         self._appointment_repo = appointment_repository
+        self._roster_cache = roster_cache
+        self._identity_cache = identity_cache
 
     async def admin_create_doctor(
             self, dto: AdminCreateDoctorDTO
@@ -48,7 +55,7 @@ class DoctorUseCase:
             raise NotFoundException("Specialization not found")
 
         async with self._uow:
-            return await self._doctor_repo.create_doctor(
+            doctor = await self._doctor_repo.create_doctor(
                 CreateDoctorDTO(
                     bio=dto.bio,
                     experience_years=dto.experience_years,
@@ -59,6 +66,9 @@ class DoctorUseCase:
                     status=DoctorStatus.APPROVED,
                 )
             )
+        await self._invalidate_roster()
+        await self._invalidate_identity(dto.user_id)
+        return doctor
 
     async def get_pending_doctors(
             self, skip: int = 0, limit: int = 20
@@ -95,6 +105,7 @@ class DoctorUseCase:
         )
         async with self._uow:
             doctor = await self._doctor_repo.create_doctor(create_dto)
+        await self._invalidate_identity(user_id)
         return doctor
 
     async def get_my_doctor_profile(self, user_id: int) -> DoctorWithDetailsEntity:
@@ -133,7 +144,10 @@ class DoctorUseCase:
                 raise NotFoundException("Specialization not found")
         async with self._uow:
             updated = await self._doctor_repo.update_doctor(doctor_id, dto)
+        await self._invalidate_roster()
+        await self._invalidate_identity(db_doctor.user_id)
         return updated
+
     async def change_doctor_status(
             self,
             doctor_id: int,
@@ -157,6 +171,8 @@ class DoctorUseCase:
 
         async with self._uow:
             updated_doctor = await self._doctor_repo.update_doctor(doctor_id, update_dto)
+        await self._invalidate_roster()
+        await self._invalidate_identity(doctor.user_id)
 
         return updated_doctor
 
@@ -177,14 +193,17 @@ class DoctorUseCase:
             skip: int = 0,
             limit: int = 10,
             is_admin: bool = False,
+            cursor: Optional[str] = None,
     ) -> list[DoctorWithDetailsEntity]:
         if not is_admin:
             status = DoctorStatus.APPROVED
+        after = ID_KEYSET.decode(cursor)
         return await self._doctor_repo.get_all_doctors(
             specialization_id=specialization_id,
             status=status,
             skip=skip,
-            limit=limit
+            limit=limit,
+            after_id=after[0] if after else None,
         )
 
     async def delete_doctor(
@@ -194,7 +213,35 @@ class DoctorUseCase:
         if not doctor:
             raise NotFoundException("Doctor not found")
         async with self._uow:
-            return await self._doctor_repo.delete_doctor(doctor_id)
+            deleted = await self._doctor_repo.delete_doctor(doctor_id)
+        await self._invalidate_roster()
+        await self._invalidate_identity(doctor.user_id)
+        return deleted
+
+    async def get_prompt_roster(
+            self,
+            render: Callable[[list[DoctorWithDetailsEntity]], str],
+            limit: int = 50,
+    ) -> DoctorRosterEntity:
+        """Approved doctors plus their rendered prompt section, served from the roster cache."""
+        if self._roster_cache is not None:
+            roster = await self._roster_cache.get(limit)
+            if roster is not None:
+                return roster
+
+        doctors = await self.get_all_doctors(skip=0, limit=limit, is_admin=False)
+        prompt_section = render(doctors) if doctors else ""
+        if self._roster_cache is None:
+            return DoctorRosterEntity(doctors=doctors, prompt_section=prompt_section, version=0)
+        return await self._roster_cache.set(limit, doctors, prompt_section)
+
+    async def _invalidate_roster(self) -> None:
+        if self._roster_cache is not None:
+            await self._roster_cache.invalidate()
+
+    async def _invalidate_identity(self, user_id: int) -> None:
+        if self._identity_cache is not None:
+            await self._identity_cache.invalidate(user_id)
 
     async def get_my_patients(
             self,
@@ -202,6 +249,7 @@ class DoctorUseCase:
             search: Optional[str] = None,
             skip: int = 0,
             limit: int = 20,
+            cursor: Optional[str] = None,
     ) -> List[DoctorPatientEntity]:
         """Get patients for the current doctor."""
         doctor = await self._doctor_repo.get_doctor_by_user_id(user_id)
@@ -215,6 +263,7 @@ class DoctorUseCase:
             search=search,
             skip=skip,
             limit=limit,
+            after=DOCTOR_PATIENT_KEYSET.decode(cursor),
         )
 
     async def get_my_patients_stats(self, user_id: int) -> dict:
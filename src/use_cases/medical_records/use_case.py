@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from src.domain.entities.medical_records import MedicalRecordEntity, MedicalRecordWithDetailsEntity
 from src.domain.entities.users import UserEntity
@@ -6,6 +6,7 @@ from src.domain.errors import BadRequestException, NotFoundException, ForbiddenE
 from src.domain.interfaces.doctor_repository import IDoctorRepository
 from src.domain.interfaces.medical_record_repositories import IMedicalRecordRepository
 from src.domain.interfaces.uow import IUoW
+from src.infrastructure.utilities.pagination import CREATED_AT_KEYSET
 from src.use_cases.medical_records.dto import CreateMedicalRecordDTO, UpdateMedicalRecordDTO
 
 
@@ -92,10 +93,11 @@ class MedicalRecordUseCase:
             self,
             user_id: int,
             skip: int = 0,
-            limit: int = 20
+            limit: int = 20,
+            cursor: Optional[str] = None,
     ) -> List[MedicalRecordWithDetailsEntity]:
         return await self._medical_record_repo.get_medical_records_by_patient_id(
-            user_id, skip=skip, limit=limit
+            user_id, skip=skip, limit=limit, after=CREATED_AT_KEYSET.decode(cursor)
         )
 
     async def get_patient_medical_records(
@@ -104,19 +106,21 @@ class MedicalRecordUseCase:
             current_user: UserEntity,
             skip: int = 0,
             limit: int = 20,
+            cursor: Optional[str] = None,
     ) -> List[MedicalRecordWithDetailsEntity]:
+        after = CREATED_AT_KEYSET.decode(cursor)
         if current_user.is_admin or current_user.id == patient_id:
             return await self._medical_record_repo.get_medical_records_by_patient_id(
-                patient_id, skip=skip, limit=limit
+                patient_id, skip=skip, limit=limit, after=after
             )
         doctor = await self._get_doctor_by_user_or_none(current_user.id)
         if not doctor:
             raise ForbiddenException("Access denied to these medical records")
 
-        records = await self._medical_record_repo.get_medical_records_by_patient_id(
-            patient_id, skip=skip, limit=limit
+        # Filter in SQL so pages stay full and cursors stay contiguous
+        return await self._medical_record_repo.get_medical_records_by_patient_id(
+            patient_id, skip=skip, limit=limit, after=after, doctor_id=doctor.id
         )
-        return [r for r in records if r.doctor_id == doctor.id]
 
     async def get_doctor_medical_records(
             self,
@@ -124,6 +128,7 @@ class MedicalRecordUseCase:
             current_user: UserEntity,
             skip: int = 0,
             limit: int = 20,
+            cursor: Optional[str] = None,
     ) -> list[MedicalRecordWithDetailsEntity]:
         if not current_user.is_admin:
             doctor = await self._get_doctor_by_user_or_none(current_user.id)
@@ -131,7 +136,7 @@ class MedicalRecordUseCase:
                 raise ForbiddenException("Access denied to these medical records")
 
         return await self._medical_record_repo.get_medical_records_by_doctor_id(
-            doctor_id, skip=skip, limit=limit
+            doctor_id, skip=skip, limit=limit, after=CREATED_AT_KEYSET.decode(cursor)
         )
 
     async def get_my_created_records(
@@ -140,8 +145,13 @@ class MedicalRecordUseCase:
             search: str = None,
             skip: int = 0,
             limit: int = 20,
+            cursor: Optional[str] = None,
     ) -> List[MedicalRecordWithDetailsEntity]:
         """Get medical records created by the doctor with optional search."""
         return await self._medical_record_repo.get_medical_records_by_doctor_id(
-            doctor_id, search=search, skip=skip, limit=limit
+            doctor_id,
+            search=search,
+            skip=skip,
+            limit=limit,
+            after=CREATED_AT_KEYSET.decode(cursor),
         )
@@ -0,0 +1,135 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from src.domain.entities.schedules import ScheduleEntity
+from src.domain.interfaces.appointment_repository import IAppointmentRepository
+from src.domain.interfaces.schedule_repository import IScheduleRepository
+from src.domain.interfaces.slot_holds import ISlotHoldStore
+from src.use_cases.schedules.dto import AvailabilitySlotDTO, DayAvailabilityDTO
+
+BookedRange = tuple[datetime, datetime]
+
+
+class AvailabilityEngine:
+    """Builds slot availability for one or more doctors over a date range.
+
+    Schedules and booked appointments are loaded with one query each for the
+    whole range, then every day is resolved with a sweep over the sorted
+    booked intervals instead of checking each slot against every booking.
+    Slots under an active hold are reported as unavailable.
+    """
+
+    def __init__(
+            self,
+            schedule_repository: IScheduleRepository,
+            appointment_repository: IAppointmentRepository,
+            slot_holds: Optional[ISlotHoldStore] = None,
+    ):
+        self._schedule_repo = schedule_repository
+        self._appointment_repo = appointment_repository
+        self._slot_holds = slot_holds
+
+    async def get_availability(
+            self,
+            doctor_ids: list[int],
+            date_from: date,
+            date_to: date,
+            now: Optional[datetime] = None,
+    ) -> dict[int, list[DayAvailabilityDTO]]:
+        now = now or datetime.now()
+        schedules = await self._schedule_repo.get_active_schedules_by_doctor_ids(doctor_ids)
+        booked = await self._appointment_repo.get_booked_appointments_in_range(
+            doctor_ids,
+            datetime.combine(date_from, datetime.min.time()),
+            datetime.combine(date_to + timedelta(days=1), datetime.min.time()),
+        )
+
+        schedules_by_doctor: dict[int, dict[int, ScheduleEntity]] = {
+            doctor_id: {} for doctor_id in doctor_ids
+        }
+        for schedule in schedules:
+            schedules_by_doctor[schedule.doctor_id][schedule.day_of_week] = schedule
+
+        booked_by_day: dict[tuple[int, date], list[BookedRange]] = {}
+        for appt in booked:
+            start = self._to_local_naive(appt.date_time)
+            end = start + timedelta(minutes=appt.duration_minutes)
+            day = start.date()
+            while datetime.combine(day, datetime.min.time()) < end:
+                booked_by_day.setdefault((appt.doctor_id, day), []).append((start, end))
+                day += timedelta(days=1)
+
+        days = [date_from + timedelta(days=i) for i in range((date_to - date_from).days + 1)]
+        availability = {}
+        for doctor_id in doctor_ids:
+            weekly = schedules_by_doctor[doctor_id]
+            availability[doctor_id] = [
+                DayAvailabilityDTO(
+                    date=day,
+                    slots=self.sweep_slots(
+                        day,
+                        weekly.get(day.weekday()),
+                        sorted(booked_by_day.get((doctor_id, day), [])),
+                        now,
+                    ),
+                )
+                for day in days
+            ]
+            await self._exclude_held(doctor_id, availability[doctor_id])
+        return availability
+
+    async def _exclude_held(self, doctor_id: int, days: list[DayAvailabilityDTO]) -> None:
+        if self._slot_holds is None:
+            return
+        open_slots = [slot for day in days for slot in day.slots if slot.is_available]
+        if not open_slots:
+            return
+        held = await self._slot_holds.get_holders(
+            doctor_id, [slot.start_time for slot in open_slots]
+        )
+        for slot in open_slots:
+            if slot.start_time in held:
+                slot.is_available = False
+
+    @staticmethod
+    def sweep_slots(
+            day: date,
+            schedule: Optional[ScheduleEntity],
+            booked_ranges: list[BookedRange],
+            now: datetime,
+    ) -> list[AvailabilitySlotDTO]:
+        """Generate the day's slots, marking those overlapping a booking or in the past.
+
+        ``booked_ranges`` must be sorted by start time. Slots are visited in
+        order and the booking cursor only moves forward, so a day costs
+        O(slots + bookings).
+        """
+        if not schedule or not schedule.is_active:
+            return []
+
+        slot_duration = timedelta(minutes=schedule.slot_duration_minutes)
+        current = datetime.combine(day, schedule.start_time)
+        end = datetime.combine(day, schedule.end_time)
+
+        slots = []
+        cursor = 0
+        while current + slot_duration <= end:
+            slot_end = current + slot_duration
+            while cursor < len(booked_ranges) and booked_ranges[cursor][1] <= current:
+                cursor += 1
+            is_booked = cursor < len(booked_ranges) and booked_ranges[cursor][0] < slot_end
+            slots.append(
+                AvailabilitySlotDTO(
+                    start_time=current,
+                    end_time=slot_end,
+                    is_available=not is_booked and current > now,
+                )
+            )
+            current = slot_end
+        return slots
+
+    @staticmethod
+    def _to_local_naive(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value
+        return value.astimezone().replace(tzinfo=None)
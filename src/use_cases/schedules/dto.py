@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from datetime import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
 from typing import Optional
 
 from src.infrastructure.utilities.dto import BaseDTOMixin
@@ -21,4 +21,25 @@ class UpdateScheduleDTO(BaseDTOMixin):
     start_time: Optional[time] = None
     end_time: Optional[time] = None
     slot_duration_minutes: Optional[int] = None
-    is_active: Optional[bool] = None
\ No newline at end of file
+    is_active: Optional[bool] = None
+
+
+@dataclass
+class AvailabilitySlotDTO:
+    start_time: datetime
+    end_time: datetime
+    is_available: bool
+
+
+@dataclass
+class DayAvailabilityDTO:
+    date: date
+    slots: list[AvailabilitySlotDTO] = field(default_factory=list)
+
+
+@dataclass
+class DoctorAvailabilityRangeDTO:
+    doctor_id: int
+    date_from: date
+    date_to: date
+    days: list[DayAvailabilityDTO] = field(default_factory=list)
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+SEARCH_KINDS = ("patients", "doctors", "medical_records")
+
+
+@dataclass
+class SearchHitDTO:
+    id: int
+    title: str
+    snippet: Optional[str]
+    score: float
+
+
+@dataclass
+class SearchResultsDTO:
+    patients: list[SearchHitDTO] = field(default_factory=list)
+    doctors: list[SearchHitDTO] = field(default_factory=list)
+    medical_records: list[SearchHitDTO] = field(default_factory=list)
@@ -0,0 +1,46 @@
+from typing import Iterable, Optional
+
+from src.domain.entities.users import UserEntityWithDetails
+from src.domain.errors import ForbiddenException
+from src.infrastructure.repositories.search import SearchRepository
+from src.use_cases.search.dto import SEARCH_KINDS, SearchResultsDTO
+
+
+class SearchUseCase:
+    def __init__(self, search_repository: SearchRepository):
+        self._search_repo = search_repository
+
+    async def search(
+            self,
+            term: str,
+            current_user: UserEntityWithDetails,
+            kinds: Optional[Iterable[str]] = None,
+            limit: int = 10,
+    ) -> SearchResultsDTO:
+        """
+        Search patients, doctors and medical records. Admins search everything;
+        doctors only their own patients and records, and approved doctors.
+        """
+        kinds = set(kinds or SEARCH_KINDS)
+        term = term.strip()
+
+        doctor_id = None
+        if not current_user.is_admin:
+            if not current_user.doctor_id:
+                raise ForbiddenException("Search is available to doctors and admins only")
+            doctor_id = current_user.doctor_id
+
+        results = SearchResultsDTO()
+        if "patients" in kinds:
+            results.patients = await self._search_repo.search_patients(
+                term, doctor_id=doctor_id, limit=limit
+            )
+        if "doctors" in kinds:
+            results.doctors = await self._search_repo.search_doctors(
+                term, approved_only=not current_user.is_admin, limit=limit
+            )
+        if "medical_records" in kinds:
+            results.medical_records = await self._search_repo.search_medical_records(
+                term, doctor_id=doctor_id, limit=limit
+            )
+        return results
@@ -1,4 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Optional
+
+
+@dataclass
+class BookingTrendDTO:
+    bucket_start: date
+    count: int
 
 
 @dataclass
@@ -10,3 +18,5 @@ class AdminStatsDTO:
     pending_bookings: int
     completed_bookings: int
     total_emrs: int
+    refreshed_at: Optional[datetime] = None
+    booking_trends: list[BookingTrendDTO] = field(default_factory=list)
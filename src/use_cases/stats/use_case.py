@@ -1,47 +1,68 @@
-from src.domain.constants import AppointmentStatus
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Literal
+
 from src.domain.interfaces.uow import IUoW
-from src.infrastructure.repositories.appointments import AppointmentRepository
-from src.infrastructure.repositories.doctors import DoctorRepository
-from src.infrastructure.repositories.medical_records import MedicalRecordRepository
-from src.infrastructure.repositories.users import UserRepository
-from src.use_cases.stats.dto import AdminStatsDTO
+from src.infrastructure.repositories.stats import StatsRepository
+from src.use_cases.stats.dto import AdminStatsDTO, BookingTrendDTO
+
+REPAIR_COUNTERS_JOB = "repair_counters"
 
 
 class StatsUseCase:
     def __init__(
             self,
             uow: IUoW,
-            user_repository: UserRepository,
-            doctor_repository: DoctorRepository,
-            appointment_repository: AppointmentRepository,
-            medical_record_repository: MedicalRecordRepository,
+            stats_repository: StatsRepository,
+            use_snapshot: bool = False,
+            snapshot_max_age_seconds: int = 300,
     ):
         self._uow = uow
-        self._user_repo = user_repository
-        self._doctor_repo = doctor_repository
-        self._appointment_repo = appointment_repository
-        self._medical_record_repo = medical_record_repository
+        self._stats_repo = stats_repository
+        self._use_snapshot = use_snapshot
+        self._snapshot_max_age = timedelta(seconds=snapshot_max_age_seconds)
+
+    async def get_admin_stats(
+            self,
+            trend_bucket: Literal["day", "week"] = "day",
+            trend_periods: int = 0,
+    ) -> AdminStatsDTO:
+        if self._use_snapshot:
+            stats = await self._stats_repo.get_snapshot()
+            if stats is None or datetime.now(timezone.utc) - stats.refreshed_at > self._snapshot_max_age:
+                stats = await self.refresh_snapshot()
+        else:
+            stats = await self._stats_repo.get_admin_stats()
+
+        if trend_periods > 0:
+            stats.booking_trends = await self.get_booking_trends(trend_bucket, trend_periods)
+        return stats
 
-    async def get_admin_stats(self) -> AdminStatsDTO:
+    async def refresh_snapshot(self) -> AdminStatsDTO:
         async with self._uow:
-            total_users = await self._user_repo.count_all_users()
-            total_doctors = await self._doctor_repo.count_all_doctors()
-            total_bookings = await self._appointment_repo.count_all_appointments()
-            today_bookings = await self._appointment_repo.count_today_appointments()
-            pending_bookings = await self._appointment_repo.count_appointments_by_status(
-                AppointmentStatus.SCHEDULED
-            )
-            completed_bookings = await self._appointment_repo.count_appointments_by_status(
-                AppointmentStatus.COMPLETED
-            )
-            total_emrs = await self._medical_record_repo.count_all_medical_records()
-
-        return AdminStatsDTO(
-            total_users=total_users,
-            total_doctors=total_doctors,
-            total_bookings=total_bookings,
-            today_bookings=today_bookings,
-            pending_bookings=pending_bookings,
-            completed_bookings=completed_bookings,
-            total_emrs=total_emrs,
+            return await self._stats_repo.refresh_snapshot()
+
+    async def repair_counters(self) -> dict[str, int]:
+        async with self._uow:
+            return await self._stats_repo.repair_counters()
+
+    async def get_booking_trends(
+            self,
+            bucket: Literal["day", "week"] = "day",
+            periods: int = 30,
+    ) -> list[BookingTrendDTO]:
+        """Bookings per day/week for the last ``periods`` buckets, including empty ones."""
+        step = timedelta(days=1 if bucket == "day" else 7)
+        current = date.today()
+        if bucket == "week":
+            current -= timedelta(days=current.weekday())
+        first = current - step * (periods - 1)
+
+        counts = await self._stats_repo.get_booking_trends(
+            start=datetime.combine(first, time.min),
+            end=datetime.combine(current + step, time.min),
+            bucket=bucket,
         )
+        return [
+            BookingTrendDTO(bucket_start=first + step * i, count=counts.get(first + step * i, 0))
+            for i in range(periods)
+        ]
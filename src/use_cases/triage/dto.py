@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
 from src.domain.constants import TriageStatus, UrgencyLevel
@@ -49,3 +50,22 @@ class CreateTriageCandidateDTO(BaseDTOMixin):
     score: float
     reason: Optional[str] = None
     matched_filters_json: Optional[dict] = None
+
+
+@dataclass
+class AssistantRecommendationDTO:
+    """Validated contents of the ```json block the assistant appends to a recommendation."""
+    specialization: str
+    confidence: Optional[float]
+    urgency: Optional[UrgencyLevel]
+    reasoning: Optional[str]
+    doctor_ids: list[int]
+    raw: dict
+
+
+@dataclass
+class DoctorScoreDTO:
+    doctor_id: int
+    score: float
+    rank: int
+    next_available_at: Optional[datetime] = None
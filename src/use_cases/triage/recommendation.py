@@ -0,0 +1,83 @@
+import json
+import logging
+import re
+from typing import Optional
+
+from src.domain.constants import UrgencyLevel
+from src.use_cases.triage.dto import AssistantRecommendationDTO
+
+logger = logging.getLogger(__name__)
+
+_JSON_BLOCK = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+
+# The prompt allows "emergency", which has no column value of its own.
+_URGENCY_ALIASES = {"emergency": UrgencyLevel.HIGH}
+
+
+def extract_recommendation(content: str) -> Optional[AssistantRecommendationDTO]:
+    """
+    Parse the last fenced ```json block of an assistant reply.
+
+    Returns None when there is no block, it is not valid JSON or it is not a
+    recommendation; malformed optional fields are dropped rather than rejected.
+    """
+    blocks = _JSON_BLOCK.findall(content or "")
+    if not blocks:
+        return None
+
+    try:
+        data = json.loads(blocks[-1])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Ignoring malformed recommendation block: {e}")
+        return None
+
+    if not isinstance(data, dict) or data.get("recommendation") is not True:
+        return None
+
+    specialization = data.get("specialization")
+    if not isinstance(specialization, str) or not specialization.strip():
+        return None
+
+    reasoning = data.get("reasoning")
+    return AssistantRecommendationDTO(
+        specialization=specialization.strip(),
+        confidence=_parse_confidence(data.get("confidence")),
+        urgency=_parse_urgency(data.get("urgency")),
+        reasoning=reasoning if isinstance(reasoning, str) else None,
+        doctor_ids=_parse_doctor_ids(data.get("recommended_doctor_ids")),
+        raw=data,
+    )
+
+
+def _parse_confidence(value) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return min(max(float(value), 0.0), 1.0)
+
+
+def _parse_urgency(value) -> Optional[UrgencyLevel]:
+    if not isinstance(value, str):
+        return None
+    value = value.strip().lower()
+    if value in _URGENCY_ALIASES:
+        return _URGENCY_ALIASES[value]
+    try:
+        return UrgencyLevel(value)
+    except ValueError:
+        return None
+
+
+def _parse_doctor_ids(value) -> list[int]:
+    if not isinstance(value, list):
+        return []
+    doctor_ids: list[int] = []
+    for item in value:
+        if isinstance(item, bool):
+            continue
+        try:
+            doctor_id = int(item)
+        except (TypeError, ValueError):
+            continue
+        if doctor_id > 0 and doctor_id not in doctor_ids:
+            doctor_ids.append(doctor_id)
+    return doctor_ids
@@ -0,0 +1,243 @@
+import asyncio
+import heapq
+import math
+from array import array
+from datetime import datetime
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional, install the "numpy" extra for vectorized scoring
+    np = None
+
+from src.domain.entities.doctors import DoctorEntity
+from src.use_cases.doctors.dto import DoctorMatchWeightsDTO
+from src.use_cases.triage.dto import DoctorScoreDTO
+
+ScoringQuery = tuple[int, DoctorMatchWeightsDTO]
+
+
+class _SpecializationColumns:
+    """Score components of one specialization's doctors, one flat column each."""
+
+    __slots__ = ("doctor_ids", "rating_points", "experience_points", "next_free")
+
+    def __init__(self):
+        self.doctor_ids = array("q")
+        self.rating_points = array("d")
+        self.experience_points = array("d")
+        self.next_free = array("d")
+
+    def __len__(self) -> int:
+        return len(self.doctor_ids)
+
+    def columns(self) -> tuple[array, ...]:
+        return self.doctor_ids, self.rating_points, self.experience_points, self.next_free
+
+
+class DoctorScoringEngine:
+    """In-memory columnar snapshot of approved doctors for batch match scoring.
+
+    Score components are precomputed per doctor (rating points, experience
+    points, next free slot as a timestamp) and stored as flat columns per
+    specialization, so ranking a specialization scores one contiguous slice
+    with no per-call database round trip. With NumPy installed the slice is
+    scored as arrays and top-K is taken with ``np.partition``; otherwise a
+    loop over the columns feeds a bounded heap. The scoring formula matches
+    DOCTOR_MATCH_SCORE; the availability component decays linearly from 10
+    points for a slot now to 0 at the end of the horizon.
+
+    ``replace`` loads a full snapshot; ``upsert``/``remove`` apply changes
+    for individual doctors and ``set_next_available`` refreshes the
+    availability of every doctor. ``refresh_lock`` serializes refreshes so
+    readers keep ranking against the previous snapshot meanwhile.
+    ``loaded_at`` is timezone-aware (UTC).
+    """
+
+    AVAILABILITY_POINTS = 10.0
+
+    def __init__(self, max_age_seconds: int = 60, horizon_days: int = 14):
+        self.max_age_seconds = max_age_seconds
+        self.horizon_days = horizon_days
+        self.loaded_at: Optional[datetime] = None
+        self.refresh_lock = asyncio.Lock()
+        self._columns: dict[int, _SpecializationColumns] = {}
+        # doctor id -> (specialization id, index into that specialization's columns)
+        self._rows: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def doctor_ids(self) -> set[int]:
+        return set(self._rows)
+
+    def replace(
+            self,
+            doctors: Iterable[DoctorEntity],
+            next_available: dict[int, datetime],
+            loaded_at: datetime,
+    ) -> None:
+        self._columns = {}
+        self._rows = {}
+        self.upsert(doctors, next_available, loaded_at)
+
+    def upsert(
+            self,
+            doctors: Iterable[DoctorEntity],
+            next_available: dict[int, datetime],
+            loaded_at: datetime,
+    ) -> None:
+        for doctor in doctors:
+            next_free = self._timestamp(next_available.get(doctor.id))
+            location = self._rows.get(doctor.id)
+            if location is not None:
+                if location[0] != doctor.specialization_id:
+                    self._remove(doctor.id)
+                    location = None
+
+            rating_points = doctor.rating * 10
+            experience_points = float(min(doctor.experience_years * 2, 20))
+            if location is not None:
+                block, index = self._columns[location[0]], location[1]
+                block.rating_points[index] = rating_points
+                block.experience_points[index] = experience_points
+                block.next_free[index] = next_free
+                continue
+
+            block = self._columns.setdefault(doctor.specialization_id, _SpecializationColumns())
+            self._rows[doctor.id] = (doctor.specialization_id, len(block))
+            block.doctor_ids.append(doctor.id)
+            block.rating_points.append(rating_points)
+            block.experience_points.append(experience_points)
+            block.next_free.append(next_free)
+        self.loaded_at = loaded_at
+
+    def remove(self, doctor_ids: Iterable[int]) -> None:
+        for doctor_id in doctor_ids:
+            if doctor_id in self._rows:
+                self._remove(doctor_id)
+
+    def set_next_available(self, next_available: dict[int, datetime], loaded_at: datetime) -> None:
+        """Replace the next free slot of every doctor; doctors missing from ``next_available`` have none."""
+        for block in self._columns.values():
+            block.next_free = array(
+                "d", (self._timestamp(next_available.get(doctor_id)) for doctor_id in block.doctor_ids)
+            )
+        self.loaded_at = loaded_at
+
+    def rank(
+            self,
+            specialization_id: int,
+            weights: DoctorMatchWeightsDTO,
+            k: int = 10,
+            now: Optional[datetime] = None,
+    ) -> list[DoctorScoreDTO]:
+        return self.rank_many([(specialization_id, weights)], k=k, now=now)[0]
+
+    def rank_many(
+            self,
+            queries: list[ScoringQuery],
+            k: int = 10,
+            now: Optional[datetime] = None,
+    ) -> list[list[DoctorScoreDTO]]:
+        """Top-K doctors for every (specialization, weights) query, in query order."""
+        now_ts = (now or datetime.now()).timestamp()
+        horizon = self.horizon_days * 86400.0
+        top_k = self._top_k_vectorized if np is not None else self._top_k
+
+        results = []
+        for specialization_id, weights in queries:
+            block = self._columns.get(specialization_id)
+            if block is None or not block or k <= 0:
+                results.append([])
+                continue
+
+            coefficients = (
+                weights.rating,
+                weights.experience,
+                weights.availability * self.AVAILABILITY_POINTS / horizon,
+            )
+            results.append([
+                DoctorScoreDTO(
+                    doctor_id=block.doctor_ids[index],
+                    score=round(score, 4),
+                    rank=rank,
+                    next_available_at=self._datetime(block.next_free[index]),
+                )
+                for rank, (score, index) in enumerate(
+                    top_k(block, coefficients, k, now_ts, horizon), start=1
+                )
+            ])
+        return results
+
+    @staticmethod
+    def _top_k(
+            block: _SpecializationColumns,
+            coefficients: tuple[float, float, float],
+            k: int,
+            now_ts: float,
+            horizon: float,
+    ) -> list[tuple[float, int]]:
+        w_rating, w_experience, w_available = coefficients
+        doctor_ids, rating_points, experience_points, next_free = block.columns()
+        scored = [
+            (
+                w_rating * rating_points[index]
+                + w_experience * experience_points[index]
+                + w_available * max(horizon - max(next_free[index] - now_ts, 0.0), 0.0),
+                -doctor_ids[index],
+                index,
+            )
+            for index in range(len(doctor_ids))
+        ]
+        return [(score, index) for score, _, index in heapq.nlargest(k, scored)]
+
+    @staticmethod
+    def _top_k_vectorized(
+            block: _SpecializationColumns,
+            coefficients: tuple[float, float, float],
+            k: int,
+            now_ts: float,
+            horizon: float,
+    ) -> list[tuple[float, int]]:
+        w_rating, w_experience, w_available = coefficients
+        doctor_ids, rating_points, experience_points, next_free = (
+            np.frombuffer(column, dtype=dtype)
+            for column, dtype in zip(block.columns(), (np.int64, np.float64, np.float64, np.float64))
+        )
+        scores = (
+            w_rating * rating_points
+            + w_experience * experience_points
+            + w_available * np.maximum(horizon - np.maximum(next_free - now_ts, 0.0), 0.0)
+        )
+        candidates = np.arange(len(scores))
+        if k < len(scores):
+            # Everything tied with the K-th best score, so the id tie-break stays exact
+            kth_score = np.partition(scores, len(scores) - k)[len(scores) - k]
+            candidates = np.flatnonzero(scores >= kth_score)
+        order = candidates[np.lexsort((doctor_ids[candidates], -scores[candidates]))][:k]
+        return [(float(scores[index]), int(index)) for index in order]
+
+    def _remove(self, doctor_id: int) -> None:
+        # Swap-with-last keeps every column dense
+        specialization_id, index = self._rows.pop(doctor_id)
+        block = self._columns[specialization_id]
+        last = len(block) - 1
+        if index != last:
+            moved_id = block.doctor_ids[last]
+            for column in block.columns():
+                column[index] = column[last]
+            self._rows[moved_id] = (specialization_id, index)
+        for column in block.columns():
+            column.pop()
+        if not block:
+            del self._columns[specialization_id]
+
+    @staticmethod
+    def _timestamp(value: Optional[datetime]) -> float:
+        return value.timestamp() if value else math.inf
+
+    @staticmethod
+    def _datetime(timestamp: float) -> Optional[datetime]:
+        return datetime.fromtimestamp(timestamp) if timestamp != math.inf else None
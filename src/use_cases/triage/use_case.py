@@ -1,7 +1,13 @@
-from typing import List, Optional
+from dataclasses import asdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
 
 from src.domain.constants import TriageStatus, UrgencyLevel, DoctorStatus
-from src.domain.entities.triage_candidates import TriageCandidateWithDoctorEntity
+from src.domain.entities.doctors import DoctorWithDetailsEntity
+from src.domain.entities.triage_candidates import (
+    TriageCandidateEntity,
+    TriageCandidateWithDoctorEntity,
+)
 from src.domain.entities.triage_runs import (
     TriageRunEntity,
     TriageRunWithDetailsEntity,
@@ -13,7 +19,12 @@ from src.domain.interfaces.specialization_repository import ISpecializationRepos
 from src.domain.interfaces.triage_candidate_repository import ITriageCandidateRepository
 from src.domain.interfaces.triage_run_repository import ITriageRunRepository
 from src.domain.interfaces.uow import IUoW
+from src.use_cases.triage.scoring import DoctorScoringEngine
+from src.use_cases.doctors.dto import DoctorMatchWeightsDTO
+from src.use_cases.schedules.availability import AvailabilityEngine
 from src.use_cases.triage.dto import (
+    AssistantRecommendationDTO,
+    DoctorScoreDTO,
     CreateTriageRunDTO,
     UpdateTriageRunDTO,
     CreateTriageCandidateDTO,
@@ -21,6 +32,8 @@ from src.use_cases.triage.dto import (
 
 
 class TriageUseCase:
+    SCORING_REFRESH_OVERLAP = timedelta(seconds=30)
+
     def __init__(
         self,
         uow: IUoW,
@@ -29,6 +42,8 @@ class TriageUseCase:
         chat_session_repository: IChatSessionRepository,
         doctor_repository: IDoctorRepository,
         specialization_repository: ISpecializationRepository,
+        scoring_engine: Optional[DoctorScoringEngine] = None,
+        availability_engine: Optional[AvailabilityEngine] = None,
     ):
         self._uow = uow
         self._triage_run_repo = triage_run_repository
@@ -36,6 +51,8 @@ class TriageUseCase:
         self._session_repo = chat_session_repository
         self._doctor_repo = doctor_repository
         self._specialization_repo = specialization_repository
+        self._scoring = scoring_engine
+        self._availability = availability_engine
 
     async def create_triage_run(
         self,
@@ -94,6 +111,82 @@ class TriageUseCase:
             triage_run = await self._triage_run_repo.create_triage_run(dto)
         return triage_run
 
+    async def record_recommendation(
+        self,
+        session_id: int,
+        recommendation: AssistantRecommendationDTO,
+        doctors: List[DoctorWithDetailsEntity],
+        trigger_message_id: Optional[int] = None,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+        token_input: Optional[int] = None,
+        token_output: Optional[int] = None,
+        latency_ms: Optional[int] = None,
+    ) -> TriageRunWithDetailsEntity:
+        """
+        Persist a recommendation parsed from an assistant reply as a triage run
+        plus its candidates in one transaction.
+
+        ``doctors`` is the approved roster the model was shown, so recommended
+        ids are validated and candidate details filled without extra lookups.
+        """
+        roster = {doctor.id: doctor for doctor in doctors}
+        specialization_key = recommendation.specialization.casefold()
+        specialization_id, specialization_name = next(
+            (
+                (doctor.specialization_id, doctor.specialization_name)
+                for doctor in doctors
+                if doctor.specialization_name.casefold() == specialization_key
+            ),
+            (None, None),
+        )
+        if specialization_id is None:
+            spec = await self._specialization_repo.get_specialization_by_title(
+                recommendation.specialization
+            )
+            if spec:
+                specialization_id, specialization_name = spec.id, spec.title
+
+        recommended = [roster[i] for i in recommendation.doctor_ids if i in roster]
+        filters = {"specialization": recommendation.specialization}
+
+        run_dto = CreateTriageRunDTO(
+            session_id=session_id,
+            trigger_message_id=trigger_message_id,
+            status=TriageStatus.SUCCESS,
+            urgency=recommendation.urgency,
+            confidence=recommendation.confidence,
+            notes=recommendation.reasoning,
+            outputs_json=recommendation.raw,
+            filters_json=filters,
+            recommended_specialization_id=specialization_id,
+            model_name=model_name,
+            temperature=temperature,
+            token_input=token_input,
+            token_output=token_output,
+            latency_ms=latency_ms,
+        )
+
+        async with self._uow:
+            triage_run = await self._triage_run_repo.create_triage_run(run_dto)
+            created = await self._candidate_repo.create_candidates_bulk([
+                CreateTriageCandidateDTO(
+                    triage_run_id=triage_run.id,
+                    doctor_id=doctor.id,
+                    rank=rank,
+                    score=self._calculate_doctor_score(doctor, filters),
+                    reason=self._generate_reason(doctor, filters),
+                    matched_filters_json=filters,
+                )
+                for rank, doctor in enumerate(recommended, start=1)
+            ])
+
+        return TriageRunWithDetailsEntity(
+            **asdict(triage_run),
+            specialization_name=specialization_name,
+            candidates=self._with_doctors(created, roster),
+        )
+
     async def update_triage_run(
         self,
         triage_run_id: int,
@@ -188,23 +281,31 @@ class TriageUseCase:
         if not candidates:
             raise BadRequestException("Candidates list cannot be empty")
 
-        candidate_dtos = []
+        doctor_ids = []
         for idx, candidate in enumerate(candidates):
             doctor_id = candidate.get("doctor_id")
             if not doctor_id:
                 raise BadRequestException(f"Missing doctor_id for candidate {idx + 1}")
+            doctor_ids.append(doctor_id)
 
-            doctor = await self._doctor_repo.get_doctor_by_id(doctor_id)
-            if not doctor:
-                raise NotFoundException(f"Doctor {doctor_id} not found")
+        doctors = {
+            doctor.id: doctor
+            for doctor in await self._doctor_repo.get_doctors_by_ids(doctor_ids)
+        }
+        missing = next((i for i in doctor_ids if i not in doctors), None)
+        if missing is not None:
+            raise NotFoundException(f"Doctor {missing} not found")
 
+        candidate_dtos = []
+        for idx, candidate in enumerate(candidates):
+            doctor = doctors[candidate["doctor_id"]]
             if doctor.status != DoctorStatus.APPROVED:
                 continue
 
             candidate_dtos.append(
                 CreateTriageCandidateDTO(
                     triage_run_id=triage_run_id,
-                    doctor_id=doctor_id,
+                    doctor_id=doctor.id,
                     rank=candidate.get("rank", idx + 1),
                     score=candidate.get("score", 0.0),
                     reason=candidate.get("reason"),
@@ -213,9 +314,9 @@ class TriageUseCase:
             )
 
         async with self._uow:
-            await self._candidate_repo.create_candidates_bulk(candidate_dtos)
+            created = await self._candidate_repo.create_candidates_bulk(candidate_dtos)
 
-        return await self._candidate_repo.get_candidates_by_triage_run_id(triage_run_id)
+        return self._with_doctors(created, doctors)
 
     async def get_candidates(
         self,
@@ -237,49 +338,170 @@ class TriageUseCase:
         self,
         specialization_id: int,
         filters: Optional[dict] = None,
+        skip: int = 0,
         limit: int = 10,
     ) -> List[dict]:
-        """Find approved doctors for a given specialization with optional filters."""
+        """
+        Rank approved doctors for a specialization by match score, in SQL.
+
+        ``filters["weights"]`` may scale the rating, experience and availability
+        components; ``skip``/``limit`` page through the ranked list.
+        """
         spec = await self._specialization_repo.get_specialization_by_id(
             specialization_id
         )
         if not spec:
             raise NotFoundException("Specialization not found")
 
-        doctors = await self._doctor_repo.get_all_doctors(
-            specialization_id=specialization_id,
-            status=DoctorStatus.APPROVED,
+        matches = await self._doctor_repo.get_ranked_doctors(
+            specialization_id,
+            weights=self._parse_weights(filters),
+            skip=skip,
             limit=limit,
         )
-
-        results = []
-        for doctor in doctors:
-            score = self._calculate_doctor_score(doctor, filters)
-            results.append({
-                "doctor_id": doctor.id,
-                "score": score,
-                "reason": self._generate_reason(doctor, filters),
+        return [
+            {
+                "doctor_id": match.doctor.id,
+                "score": match.score,
+                "reason": self._generate_reason(match.doctor, filters, match.has_availability),
                 "matched_filters_json": filters,
-            })
+                "rank": skip + idx + 1,
+            }
+            for idx, match in enumerate(matches)
+        ]
 
-        results.sort(key=lambda x: x["score"], reverse=True)
+    async def rank_doctors_for_specializations(
+        self,
+        specialization_ids: List[int],
+        filters: Optional[dict] = None,
+        limit: int = 5,
+    ) -> Dict[int, List[DoctorScoreDTO]]:
+        """Top doctors for several specializations at once, from the in-memory scoring snapshot."""
+        if self._scoring is None:
+            raise BadRequestException("Doctor scoring is not configured")
+
+        if self._scoring.loaded_at is None:
+            # Only a cold start waits; later refreshes run in the background
+            async with self._scoring.refresh_lock:
+                if self._scoring.loaded_at is None:
+                    await self._load_scoring_snapshot(datetime.now(timezone.utc))
+
+        weights = self._parse_weights(filters)
+        ranked = self._scoring.rank_many(
+            [(specialization_id, weights) for specialization_id in specialization_ids],
+            k=limit,
+        )
+        return dict(zip(specialization_ids, ranked))
+
+    async def refresh_scoring_snapshot(self) -> int:
+        """
+        Reload the scoring snapshot: everything on first use, otherwise only
+        doctors updated since the previous load. Snapshot ids are diffed
+        against the approved ids so hard-deleted doctors drop out, and next
+        availability is recomputed for every doctor since bookings do not
+        touch doctors.updated_at. Runs under the engine's refresh lock, so
+        concurrent callers queue up while readers rank the previous snapshot.
+        Returns the number of doctors read.
+        """
+        async with self._scoring.refresh_lock:
+            return await self._refresh_scoring_snapshot()
+
+    async def _refresh_scoring_snapshot(self) -> int:
+        engine = self._scoring
+        started_at = datetime.now(timezone.utc)
+        if engine.loaded_at is None:
+            return await self._load_scoring_snapshot(started_at)
+
+        # Overlap so rows committed by transactions that started earlier are not missed
+        since = engine.loaded_at - self.SCORING_REFRESH_OVERLAP
+        approved_ids = await self._doctor_repo.get_approved_doctor_ids()
+        doctors = await self._doctor_repo.get_doctors_for_scoring(updated_since=since)
+        approved = [d for d in doctors if d.id in approved_ids]
+
+        if approved_ids - engine.doctor_ids - {d.id for d in approved}:
+            # Approved doctors the change feed did not return; reload rather than guess
+            return await self._load_scoring_snapshot(started_at)
+
+        # Read everything before touching the engine so readers never see a half-applied refresh
+        next_available = await self._get_next_available(sorted(approved_ids))
+        engine.remove(engine.doctor_ids - approved_ids)
+        engine.upsert(approved, next_available, loaded_at=started_at)
+        engine.set_next_available(next_available, loaded_at=started_at)
+        return len(doctors)
+
+    async def _load_scoring_snapshot(self, started_at: datetime) -> int:
+        doctors = await self._doctor_repo.get_doctors_for_scoring()
+        next_available = await self._get_next_available([d.id for d in doctors])
+        self._scoring.replace(doctors, next_available, loaded_at=started_at)
+        return len(doctors)
+
+    async def _get_next_available(self, doctor_ids: List[int]) -> Dict[int, datetime]:
+        if self._availability is None or not doctor_ids:
+            return {}
+
+        today = date.today()
+        availability = await self._availability.get_availability(
+            doctor_ids, today, today + timedelta(days=self._scoring.horizon_days - 1)
+        )
+        next_available = {}
+        for doctor_id, days in availability.items():
+            slot = next((s for day in days for s in day.slots if s.is_available), None)
+            if slot is not None:
+                next_available[doctor_id] = slot.start_time
+        return next_available
 
-        for idx, result in enumerate(results):
-            result["rank"] = idx + 1
+    @staticmethod
+    def _parse_weights(filters: Optional[dict]) -> DoctorMatchWeightsDTO:
+        weights = (filters or {}).get("weights") or {}
+        if not isinstance(weights, dict):
+            raise BadRequestException("Weights must be an object")
+
+        parsed = DoctorMatchWeightsDTO()
+        for name in ("rating", "experience", "availability"):
+            if name not in weights:
+                continue
+            value = weights[name]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise BadRequestException(f"Weight '{name}' must be a non-negative number")
+            setattr(parsed, name, float(value))
+        return parsed
 
-        return results
+    @staticmethod
+    def _with_doctors(
+        candidates: List[TriageCandidateEntity],
+        doctors: Dict[int, DoctorWithDetailsEntity],
+    ) -> List[TriageCandidateWithDoctorEntity]:
+        """Attach already-loaded doctor details to freshly inserted candidates, by rank."""
+        return [
+            TriageCandidateWithDoctorEntity(
+                **asdict(candidate),
+                doctor_name=doctors[candidate.doctor_id].full_name,
+                doctor_bio=doctors[candidate.doctor_id].bio,
+                doctor_rating=doctors[candidate.doctor_id].rating,
+                doctor_experience_years=doctors[candidate.doctor_id].experience_years,
+                specialization_name=doctors[candidate.doctor_id].specialization_name,
+            )
+            for candidate in sorted(candidates, key=lambda c: c.rank)
+        ]
 
     @staticmethod
     def _calculate_doctor_score(doctor, filters: Optional[dict] = None) -> float:
+        # Same formula as DOCTOR_MATCH_SCORE, for doctors already loaded in memory
         base_score = doctor.rating * 10
         experience_bonus = min(doctor.experience_years * 2, 20)
         return base_score + experience_bonus
 
     @staticmethod
-    def _generate_reason(doctor, filters: Optional[dict] = None) -> str:
+    def _generate_reason(
+        doctor,
+        filters: Optional[dict] = None,
+        has_availability: bool = False,
+    ) -> str:
         reasons = []
         if doctor.rating >= 4.5:
             reasons.append("High rating")
         if doctor.experience_years >= 5:
             reasons.append("Experienced")
+        if has_availability:
+            reasons.append("Accepting appointments")
         return ", ".join(reasons) if reasons else "Matched criteria"
@@ -1,14 +1,17 @@
 import secrets
-from typing import List
+from typing import List, Optional
 
 from starlette.requests import Request
 
-from src.domain.entities.users import UserEntity
+from src.domain.entities.users import UserEntity, UserEntityWithDetails
 from src.domain.errors import BadRequestException, NotFoundException
 from src.domain.interfaces.uow import IUoW
 from src.domain.interfaces.user_repository import IUserRepository
+from src.infrastructure.cache.doctor_roster import DoctorRosterCache
+from src.infrastructure.cache.identity import IdentityCache
 from src.infrastructure.services.jwt_service import JWTService
 from src.infrastructure.services.password_service import PasswordService
+from src.infrastructure.utilities.pagination import ID_KEYSET
 from src.use_cases.users.dto import CreateUserDTO, LoginUserDTO, UpdateUserDTO
 
 
@@ -19,18 +22,24 @@ class UserUseCase:
             user_repository: IUserRepository,
             jwt_service: JWTService,
             password_service: PasswordService,
+            identity_cache: Optional[IdentityCache] = None,
+            claims_only_tokens: bool = False,
+            roster_cache: Optional[DoctorRosterCache] = None,
     ):
         self._uow = uow
         self._user_repo = user_repository
         self._jwt_service = jwt_service
         self._password_service = password_service
+        self._identity_cache = identity_cache
+        self._claims_only_tokens = claims_only_tokens
+        self._roster_cache = roster_cache
 
     async def register(self, user: CreateUserDTO) -> UserEntity:
         db_user = await self._user_repo.get_user_by_email(user.email)
         if db_user:
             raise BadRequestException("User already exists")
 
-        user.password_hash = self._password_service.encrypt(user.password_hash)
+        user.password_hash = await self._password_service.encrypt_async(user.password_hash)
         async with self._uow:
             created_user = await self._user_repo.create_user(user)
         return created_user
@@ -40,10 +49,18 @@ class UserUseCase:
         if not db_user:
             raise NotFoundException("User does not exist")
 
-        if not self._password_service.verify(user.password, db_user.password_hash):
+        if not await self._password_service.verify_async(user.password, db_user.password_hash):
             raise BadRequestException("Invalid credentials")
 
-        access_token = self._jwt_service.encode_access_token({"sub": str(db_user.id)})
+        if self._password_service.needs_rehash(db_user.password_hash):
+            # Transparently upgrade hashes made with an old cost factor
+            password_hash = await self._password_service.encrypt_async(user.password)
+            async with self._uow:
+                await self._user_repo.update_user(db_user.id, UpdateUserDTO(password_hash=password_hash))
+
+        access_token = self._jwt_service.encode_access_token(
+            await self._access_token_payload(db_user.id)
+        )
         refresh_token = self._jwt_service.encode_refresh_token({"sub": str(db_user.id)})
 
         return {
@@ -52,9 +69,14 @@ class UserUseCase:
             "token_type": "bearer",
         }
 
-    async def get_all_users(self, skip: int = 0, limit: int = 20) -> List[UserEntity]:
+    async def get_all_users(
+            self, skip: int = 0, limit: int = 20, cursor: Optional[str] = None
+    ) -> List[UserEntity]:
+        after = ID_KEYSET.decode(cursor)
         async with self._uow:
-            return await self._user_repo.get_all_users(skip=skip, limit=limit)
+            return await self._user_repo.get_all_users(
+                skip=skip, limit=limit, after_id=after[0] if after else None
+            )
 
     async def get_all_patients(self, skip: int = 0, limit: int = 20) -> List[UserEntity]:
         async with self._uow:
@@ -69,17 +91,39 @@ class UserUseCase:
 
     async def update_user(self, user_id: int, dto: UpdateUserDTO) -> UserEntity:
         async with self._uow:
-            user = await self._user_repo.get_user_by_id(user_id)
+            user = await self._user_repo.get_user_with_details(user_id)
             if not user:
                 raise NotFoundException("User not found")
-            return await self._user_repo.update_user(user_id, dto)
+            updated = await self._user_repo.update_user(user_id, dto)
+        await self._invalidate_identity(user_id)
+        await self._invalidate_roster(user)
+        return updated
 
     async def delete_user(self, user_id: int) -> None:
         async with self._uow:
-            user = await self._user_repo.get_user_by_id(user_id)
+            user = await self._user_repo.get_user_with_details(user_id)
             if not user:
                 raise NotFoundException("User not found")
             await self._user_repo.delete_user(user_id)
+        await self._invalidate_identity(user_id)
+        await self._invalidate_roster(user)
+
+    async def _access_token_payload(self, user_id: int) -> dict:
+        payload = {"sub": str(user_id)}
+        if self._claims_only_tokens:
+            user = await self._user_repo.get_user_with_details(user_id)
+            if user is not None:
+                payload.update(self._jwt_service.identity_claims(user))
+        return payload
+
+    async def _invalidate_identity(self, user_id: int) -> None:
+        if self._identity_cache is not None:
+            await self._identity_cache.invalidate(user_id)
+
+    async def _invalidate_roster(self, user: UserEntityWithDetails) -> None:
+        # The prompt roster embeds approved doctors' names and contact details
+        if self._roster_cache is not None and user.is_doctor:
+            await self._roster_cache.invalidate()
 
     async def google_callback(self, request: Request) -> dict:
         try:
@@ -101,7 +145,7 @@ class UserUseCase:
                     db_user = await self._user_repo.create_user(
                         CreateUserDTO(
                             email=email,
-                            password_hash=self._password_service.encrypt(random_password),
+                            password_hash=await self._password_service.encrypt_async(random_password),
                             full_name=full_name,
                             phone=user_info.get("phone"),
                             is_admin=False,
@@ -109,7 +153,7 @@ class UserUseCase:
                     )
 
             access_token = self._jwt_service.encode_access_token(
-                payload={"sub": str(db_user.id)},
+                payload=await self._access_token_payload(db_user.id),
             )
             refresh_token = self._jwt_service.encode_refresh_token({"sub": str(db_user.id)})
 
@@ -0,0 +1,175 @@
+from datetime import datetime, time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.entities.schedules import ScheduleEntity
+from src.domain.errors import ConflictException
+from src.infrastructure.repositories.appointments import AppointmentRepository
+from src.use_cases.appointments.dto import CreateAppointmentDTO, UpdateAppointmentDTO
+from src.use_cases.appointments.use_case import AppointmentUseCase
+
+SLOT = datetime(2030, 1, 7, 9, 30)
+
+
+class _PgError(Exception):
+    def __init__(self, sqlstate):
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+class _FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalar_one(self):
+        return self.value
+
+
+class _FakeSession:
+    """Compiles each statement for PostgreSQL and answers with a canned result or error."""
+
+    def __init__(self, value=None, error=None):
+        self.value = value
+        self.error = error
+        self.sql = []
+
+    async def execute(self, stmt, params=None):
+        self.sql.append(str(stmt.compile(dialect=postgresql.dialect())))
+        if self.error is not None:
+            raise self.error
+        return _FakeResult(self.value)
+
+
+class _FakeUoW:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeAppointmentRepository:
+    def __init__(self, existing=None):
+        self.existing = existing
+        self.availability_calls = []
+
+    async def book_appointment(self, appointment):
+        return None
+
+    async def get_appointment_by_id(self, appointment_id):
+        return self.existing
+
+    async def check_slot_availability(
+            self, doctor_id, date_time, duration_minutes=30, exclude_appointment_id=None
+    ):
+        self.availability_calls.append(exclude_appointment_id)
+        # The only overlapping active appointment is the one being rescheduled
+        return exclude_appointment_id == self.existing.id
+
+    async def update_appointment(self, appointment_id, appointment):
+        return SimpleNamespace(id=appointment_id, date_time=appointment.date_time)
+
+
+class _FakeDoctorRepository:
+    async def get_doctor_by_id(self, doctor_id):
+        return SimpleNamespace(id=doctor_id)
+
+    async def get_doctor_by_user_id(self, user_id):
+        return None
+
+
+class _FakeScheduleRepository:
+    async def get_schedule_by_doctor_and_day(self, doctor_id, day_of_week):
+        return ScheduleEntity(
+            id=1,
+            day_of_week=0,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+            slot_duration_minutes=30,
+            is_active=True,
+            doctor_id=doctor_id,
+        )
+
+
+def _use_case(appointment_repo):
+    return AppointmentUseCase(
+        _FakeUoW(), appointment_repo, _FakeDoctorRepository(), _FakeScheduleRepository()
+    )
+
+
+class TestBookAppointment:
+    """Tests for the conditional INSERT ... SELECT booking path."""
+
+    async def test_insert_is_guarded_by_active_overlap(self):
+        """Test that the insert only selects a row when no active appointment overlaps the slot."""
+        session = _FakeSession()
+
+        booked = await AppointmentRepository(session).book_appointment(
+            CreateAppointmentDTO(date_time=SLOT, patient_id=10, doctor_id=1)
+        )
+
+        sql = session.sql[0]
+        assert booked is None
+        assert sql.startswith("INSERT INTO appointments")
+        assert "NOT (EXISTS (SELECT appointments.id" in sql
+        assert "appointments.time_range && tstzrange(" in sql
+        assert "appointments.status IN (__[POSTCOMPILE_status_1])" in sql
+
+    async def test_rejected_insert_on_valid_slot_is_a_conflict(self):
+        """Test that a rejected insert for an on-schedule slot is reported as already booked."""
+        with pytest.raises(ConflictException):
+            await _use_case(_FakeAppointmentRepository()).admin_create_appointment(
+                CreateAppointmentDTO(date_time=SLOT, patient_id=10, doctor_id=1)
+            )
+
+    @pytest.mark.parametrize("method, args", [
+        ("book_appointment", (CreateAppointmentDTO(date_time=SLOT, patient_id=10, doctor_id=1),)),
+        ("update_appointment", (5, UpdateAppointmentDTO(date_time=SLOT))),
+    ])
+    async def test_exclusion_violation_maps_to_conflict(self, method, args):
+        """Test that SQLSTATE 23P01 from the overlap constraint becomes ConflictException."""
+        error = IntegrityError("INSERT", {}, _PgError("23P01"))
+        repo = AppointmentRepository(_FakeSession(error=error))
+
+        with pytest.raises(ConflictException):
+            await getattr(repo, method)(*args)
+
+    async def test_other_integrity_errors_propagate(self):
+        """Test that integrity errors other than the overlap constraint are re-raised unchanged."""
+        error = IntegrityError("INSERT", {}, _PgError("23503"))
+        repo = AppointmentRepository(_FakeSession(error=error))
+
+        with pytest.raises(IntegrityError):
+            await repo.book_appointment(CreateAppointmentDTO(date_time=SLOT, patient_id=10, doctor_id=1))
+
+
+class TestRescheduleOverlap:
+    """Tests for the exclude_appointment_id reschedule path."""
+
+    async def test_reschedule_does_not_conflict_with_itself(self):
+        """Test that moving an appointment over its own time range is allowed."""
+        existing = SimpleNamespace(id=5, doctor_id=1, patient_id=10, duration_minutes=60)
+        repo = _FakeAppointmentRepository(existing)
+
+        updated = await _use_case(repo).update_appointment(
+            5, UpdateAppointmentDTO(date_time=SLOT), user_id=10
+        )
+
+        assert updated.date_time == SLOT
+        assert repo.availability_calls == [5]
+
+    async def test_overlap_query_excludes_the_rescheduled_appointment(self):
+        """Test that the availability query leaves out the appointment being moved."""
+        session = _FakeSession(value=True)
+
+        await AppointmentRepository(session).check_slot_availability(
+            1, SLOT, exclude_appointment_id=5
+        )
+
+        assert "appointments.id != %(id_1)s::INTEGER" in session.sql[0]
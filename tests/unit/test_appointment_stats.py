@@ -0,0 +1,69 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.constants import AppointmentStatus
+from src.domain.entities.appointments import AppointmentStatusCountEntity
+from src.domain.errors import BadRequestException
+from src.use_cases.appointments.use_case import AppointmentUseCase
+
+
+class _FakeAppointmentRepository:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def count_doctor_appointments_by_status(self, doctor_id, date_from=None, date_to=None, by_day=False):
+        self.calls.append((doctor_id, date_from, date_to, by_day))
+        return self.rows
+
+
+class _FakeDoctorRepository:
+    async def get_doctor_by_user_id(self, user_id):
+        return SimpleNamespace(id=7)
+
+
+class TestDoctorAppointmentStats:
+    """Tests for grouped doctor appointment statistics."""
+
+    def _use_case(self, rows):
+        self.repo = _FakeAppointmentRepository(rows)
+        return AppointmentUseCase(None, self.repo, _FakeDoctorRepository(), None)
+
+    async def test_stats_from_grouped_counts(self):
+        """Test that status counts are folded into the dashboard summary."""
+        use_case = self._use_case([
+            AppointmentStatusCountEntity(status=AppointmentStatus.SCHEDULED, count=3),
+            AppointmentStatusCountEntity(status=AppointmentStatus.IN_PROGRESS, count=1),
+            AppointmentStatusCountEntity(status=AppointmentStatus.COMPLETED, count=2),
+        ])
+
+        stats = await use_case.get_my_doctor_appointments_stats(1, target_date=date(2026, 1, 5))
+
+        assert stats["total"] == 6
+        assert stats["active"] == 4
+        assert stats["done"] == 2
+        assert stats["cancelled"] == 0
+        assert self.repo.calls == [(7, date(2026, 1, 5), date(2026, 1, 5), False)]
+
+    async def test_daily_stats_fill_empty_days(self):
+        """Test that days without appointments are reported with zero counts."""
+        use_case = self._use_case([
+            AppointmentStatusCountEntity(status=AppointmentStatus.CONFIRMED, count=2, day=date(2026, 1, 1)),
+            AppointmentStatusCountEntity(status=AppointmentStatus.CANCELLED, count=1, day=date(2026, 1, 3)),
+        ])
+
+        stats = await use_case.get_my_doctor_daily_stats(1, date(2026, 1, 1), date(2026, 1, 3))
+
+        assert [d.day for d in stats.days] == [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)]
+        assert [d.counts.total for d in stats.days] == [2, 0, 1]
+        assert stats.totals.active == 2
+        assert stats.totals.cancelled == 1
+
+    async def test_daily_stats_rejects_reversed_range(self):
+        """Test that a reversed date range is rejected."""
+        use_case = self._use_case([])
+
+        with pytest.raises(BadRequestException):
+            await use_case.get_my_doctor_daily_stats(1, date(2026, 1, 3), date(2026, 1, 1))
@@ -0,0 +1,143 @@
+from dataclasses import replace
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.domain.constants import ContentType, MessageRole
+from src.domain.entities.chat_messages import ChatMessageEntity
+from src.domain.entities.doctors import DoctorRosterEntity
+from src.infrastructure.services.token_counter import TokenCounter
+from src.use_cases.assistant.use_case import AssistantReplyUseCase
+
+
+def _message(message_id: int, role: MessageRole, content: str, tokens: int) -> ChatMessageEntity:
+    return ChatMessageEntity(
+        id=message_id,
+        role=role,
+        content=content,
+        content_type=ContentType.TEXT,
+        model_name=None,
+        prompt_version=None,
+        token_input=None,
+        token_output=None,
+        content_tokens=tokens,
+        latency_ms=None,
+        session_id=1,
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+class _FakeChat:
+    def __init__(self, messages, context_json=None):
+        self.messages = messages
+        self.context_json = context_json
+        self.saved_context = None
+        self.cached_counts = None
+
+    async def get_session_by_id(self, session_id, user_id=None, is_admin=False):
+        return SimpleNamespace(id=session_id, context_json=self.context_json)
+
+    async def get_recent_messages(self, session_id, after_message_id=None, limit=200, user_id=None, is_admin=False):
+        return [m for m in self.messages if after_message_id is None or m.id > after_message_id][-limit:]
+
+    async def get_messages_after(self, session_id, after_message_id=0, limit=100, user_id=None, is_admin=False):
+        return [m for m in self.messages if m.id > after_message_id][:limit]
+
+    async def cache_content_tokens(self, counts):
+        self.cached_counts = counts
+
+    async def update_context(self, session_id, context_json):
+        self.saved_context = context_json
+
+
+class _FakeDoctors:
+    async def get_prompt_roster(self, render, limit=50):
+        return DoctorRosterEntity(doctors=[], prompt_section="", version=0)
+
+
+class _FakeOpenAI:
+    def __init__(self):
+        self.summarized = None
+        self.calls = []
+
+    def format_doctors_for_prompt(self, doctors):
+        return ""
+
+    async def summarize_conversation(self, messages, previous_summary=None, max_tokens=300):
+        self.summarized = messages
+        self.calls.append(messages)
+        return "summary"
+
+
+class TestAssistantContext:
+    """Tests for token-budgeted context building."""
+
+    def test_select_window_keeps_newest_within_budget(self):
+        """Test that the window is the longest suffix under the budget."""
+        assert AssistantReplyUseCase.select_window([5, 5, 5], budget=10) == 1
+
+    def test_select_window_always_keeps_last_message(self):
+        """Test that an oversized latest message is still sent."""
+        assert AssistantReplyUseCase.select_window([5, 50], budget=10) == 1
+
+    def test_select_window_everything_fits(self):
+        """Test that short conversations are sent whole."""
+        assert AssistantReplyUseCase.select_window([1, 2, 3], budget=100) == 0
+
+    async def test_content_tokens_are_cached_apart_from_api_usage(self):
+        """Test that missing content counts are computed and cached without touching API usage."""
+        message = replace(
+            _message(1, MessageRole.ASSISTANT, "hello there", 0),
+            token_input=900, token_output=40, content_tokens=None,
+        )
+        chat = _FakeChat([message])
+        use_case = AssistantReplyUseCase(chat, _FakeDoctors(), _FakeOpenAI())
+
+        await use_case.build_context(1)
+
+        assert chat.cached_counts == {1: TokenCounter().count("hello there")}
+
+    async def test_build_context_summarizes_overflow(self):
+        """Test that messages outside the budget are folded into the session summary."""
+        chat = _FakeChat([
+            _message(1, MessageRole.USER, "old question", 100),
+            _message(2, MessageRole.ASSISTANT, "old answer", 100),
+            _message(3, MessageRole.USER, "new question", 10),
+        ])
+        openai = _FakeOpenAI()
+        use_case = AssistantReplyUseCase(chat, _FakeDoctors(), openai, context_token_budget=120)
+
+        context = await use_case.build_context(1)
+
+        assert [m["content"] for m in openai.summarized] == ["old question"]
+        assert chat.saved_context["summary"]["through_message_id"] == 1
+        assert context.messages[0]["role"] == "system"
+        assert [m["content"] for m in context.messages[1:]] == ["old answer", "new question"]
+
+    async def test_messages_beyond_cap_are_summarized_not_dropped(self):
+        """Test that unsummarized messages past max_context_messages are folded into the summary."""
+        chat = _FakeChat([_message(i, MessageRole.USER, f"m{i}", 1) for i in range(1, 6)])
+        openai = _FakeOpenAI()
+        use_case = AssistantReplyUseCase(
+            chat, _FakeDoctors(), openai, context_token_budget=1000, max_context_messages=2
+        )
+
+        context = await use_case.build_context(1)
+
+        assert [[m["content"] for m in call] for call in openai.calls] == [["m1", "m2"], ["m3"]]
+        assert chat.saved_context["summary"]["through_message_id"] == 3
+        assert chat.saved_context["summary"]["message_count"] == 3
+        assert [m["content"] for m in context.messages[1:]] == ["m4", "m5"]
+
+    async def test_build_context_skips_summarized_messages(self):
+        """Test that messages already in the summary are not reloaded."""
+        chat = _FakeChat(
+            [_message(1, MessageRole.USER, "old", 10), _message(2, MessageRole.USER, "new", 10)],
+            context_json={"summary": {"text": "earlier", "through_message_id": 1, "message_count": 1}},
+        )
+        use_case = AssistantReplyUseCase(chat, _FakeDoctors(), _FakeOpenAI(), context_token_budget=1000)
+
+        context = await use_case.build_context(1)
+
+        assert "earlier" in context.messages[0]["content"]
+        assert [m["content"] for m in context.messages[1:]] == ["new"]
+        assert chat.saved_context is None
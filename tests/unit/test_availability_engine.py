@@ -0,0 +1,82 @@
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+from src.domain.entities.schedules import ScheduleEntity
+from src.use_cases.schedules.availability import AvailabilityEngine
+
+
+def _schedule(doctor_id=1, day_of_week=0, start=time(9, 0), end=time(12, 0), minutes=30):
+    return ScheduleEntity(
+        id=1,
+        day_of_week=day_of_week,
+        start_time=start,
+        end_time=end,
+        slot_duration_minutes=minutes,
+        is_active=True,
+        doctor_id=doctor_id,
+    )
+
+
+class _FakeScheduleRepository:
+    def __init__(self, schedules):
+        self.schedules = schedules
+        self.calls = 0
+
+    async def get_active_schedules_by_doctor_ids(self, doctor_ids):
+        self.calls += 1
+        return [s for s in self.schedules if s.doctor_id in doctor_ids]
+
+
+class _FakeAppointmentRepository:
+    def __init__(self, appointments):
+        self.appointments = appointments
+        self.calls = 0
+
+    async def get_booked_appointments_in_range(self, doctor_ids, start, end):
+        self.calls += 1
+        return [a for a in self.appointments if a.doctor_id in doctor_ids]
+
+
+class TestAvailabilityEngine:
+    """Tests for the batched availability sweep."""
+
+    MONDAY = date(2030, 1, 7)
+    EARLIER = datetime(2030, 1, 1)
+
+    def test_sweep_marks_overlapping_slots(self):
+        """Test that slots overlapping a booking (including partial overlap) are unavailable."""
+        day = self.MONDAY
+        booked = [
+            (datetime(2030, 1, 7, 9, 0), datetime(2030, 1, 7, 9, 45)),
+            (datetime(2030, 1, 7, 11, 0), datetime(2030, 1, 7, 11, 30)),
+        ]
+
+        slots = AvailabilityEngine.sweep_slots(day, _schedule(), booked, self.EARLIER)
+
+        assert [s.is_available for s in slots] == [False, False, True, True, False, True]
+
+    def test_sweep_marks_past_slots(self):
+        """Test that slots starting before now are unavailable."""
+        now = datetime(2030, 1, 7, 10, 0)
+
+        slots = AvailabilityEngine.sweep_slots(self.MONDAY, _schedule(), [], now)
+
+        assert [s.is_available for s in slots] == [False, False, False, True, True, True]
+
+    async def test_range_uses_one_query_per_source(self):
+        """Test that a multi-day range loads schedules and bookings once."""
+        schedules = _FakeScheduleRepository([_schedule(day_of_week=0), _schedule(day_of_week=2)])
+        appointments = _FakeAppointmentRepository([
+            SimpleNamespace(doctor_id=1, date_time=datetime(2030, 1, 9, 9, 30), duration_minutes=30),
+        ])
+        engine = AvailabilityEngine(schedules, appointments)
+
+        result = await engine.get_availability(
+            [1], self.MONDAY, self.MONDAY + timedelta(days=6), now=self.EARLIER
+        )
+
+        days = result[1]
+        assert schedules.calls == 1 and appointments.calls == 1
+        assert len(days) == 7
+        assert [len(d.slots) for d in days] == [6, 0, 6, 0, 0, 0, 0]
+        assert [s.is_available for s in days[2].slots] == [True, False, True, True, True, True]
@@ -0,0 +1,64 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.presentation.api.routers.chat import _parse_etag
+from src.use_cases.chat.use_case import ChatUseCase
+
+
+class _FakeSessionRepository:
+    def __init__(self, session):
+        self.session = session
+
+    async def get_session_by_id(self, session_id):
+        return self.session
+
+
+class _FakeMessageRepository:
+    def __init__(self, messages):
+        self.messages = messages
+        self.calls = 0
+
+    async def get_messages_after(self, session_id, after_id, limit=100):
+        self.calls += 1
+        return [m for m in self.messages if m.id > after_id][:limit]
+
+
+def _make_use_case(messages):
+    session = SimpleNamespace(id=7, user_id=1, last_message_at=datetime(2026, 1, 1, 12, 0, 0))
+    message_repo = _FakeMessageRepository(messages)
+    use_case = ChatUseCase(
+        uow=None,
+        chat_session_repository=_FakeSessionRepository(session),
+        chat_message_repository=message_repo,
+    )
+    return use_case, message_repo
+
+
+class TestChatMessageDelta:
+    """Tests for ChatUseCase.get_message_delta."""
+
+    async def test_matching_version_skips_message_query(self):
+        """Test that a client holding the current version gets not_modified without a query."""
+        use_case, message_repo = _make_use_case([SimpleNamespace(id=1), SimpleNamespace(id=2)])
+
+        first = await use_case.get_message_delta(7, after_id=0, user_id=1)
+        second = await use_case.get_message_delta(7, after_id=2, known_version=first.version, user_id=1)
+
+        assert [m.id for m in first.messages] == [1, 2]
+        assert second.not_modified
+        assert message_repo.calls == 1
+
+    async def test_truncated_delta_has_no_version(self):
+        """Test that a page filled to the limit is not given a cacheable version."""
+        use_case, _ = _make_use_case([SimpleNamespace(id=i) for i in range(1, 6)])
+
+        delta = await use_case.get_message_delta(7, after_id=0, limit=3, user_id=1)
+
+        assert [m.id for m in delta.messages] == [1, 2, 3]
+        assert delta.version is None
+
+    def test_parse_etag_strips_weak_prefix(self):
+        """Test that If-None-Match values are reduced to the bare version."""
+        assert _parse_etag('W/"7.1.2"') == "7.1.2"
+        assert _parse_etag('"7.1.2", "other"') == "7.1.2"
+        assert _parse_etag(None) is None
@@ -0,0 +1,74 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from src.domain.constants import DoctorStatus
+from src.domain.entities.doctors import DoctorMatchEntity, DoctorWithDetailsEntity
+from src.domain.entities.specializations import SpecializationEntity
+from src.domain.errors import BadRequestException
+from src.infrastructure.database.models.doctors import Doctor
+from src.use_cases.triage.use_case import TriageUseCase
+
+
+def _doctor(doctor_id: int) -> DoctorWithDetailsEntity:
+    now = datetime(2030, 1, 1)
+    return DoctorWithDetailsEntity(
+        id=doctor_id, bio="bio", rating=4.1, experience_years=10, license_number="L",
+        status=DoctorStatus.APPROVED, rejection_reason=None, user_id=doctor_id,
+        specialization_id=7, created_at=now, updated_at=now,
+        full_name=f"Dr. {doctor_id}", email="d@example.com", phone=None,
+        specialization_name="Dentistry",
+    )
+
+
+class _FakeSpecializationRepository:
+    async def get_specialization_by_id(self, specialization_id):
+        return SpecializationEntity(id=specialization_id, title="Dentistry", slug="dentistry", description=None)
+
+
+class _FakeDoctorRepository:
+    def __init__(self):
+        self.calls = []
+
+    async def get_ranked_doctors(self, specialization_id, weights, skip=0, limit=10):
+        self.calls.append((weights, skip, limit))
+        return [DoctorMatchEntity(doctor=_doctor(4), score=61.0, has_availability=True)]
+
+
+class TestFindDoctorsForSpecialization:
+    """Tests for SQL-ranked TriageUseCase.find_doctors_for_specialization."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.doctors = _FakeDoctorRepository()
+        self.use_case = TriageUseCase(
+            None, None, None, None, self.doctors, _FakeSpecializationRepository()
+        )
+
+    async def test_passes_weights_and_ranks_from_offset(self):
+        """Test that weights reach the repository and ranks continue across pages."""
+        results = await self.use_case.find_doctors_for_specialization(
+            7, filters={"weights": {"availability": 2}}, skip=20, limit=5
+        )
+
+        weights, skip, limit = self.doctors.calls[0]
+        assert (weights.rating, weights.experience, weights.availability) == (1.0, 1.0, 2.0)
+        assert not weights.is_default
+        assert (skip, limit) == (20, 5)
+        assert results[0]["rank"] == 21
+        assert results[0]["score"] == 61.0
+        assert "Accepting appointments" in results[0]["reason"]
+
+    async def test_rejects_negative_weight(self):
+        """Test that invalid weights are rejected."""
+        with pytest.raises(BadRequestException):
+            await self.use_case.find_doctors_for_specialization(7, filters={"weights": {"rating": -1}})
+
+    def test_match_score_index_is_an_expression_index(self):
+        """Test that the ranking index covers the default score expression."""
+        index = next(i for i in Doctor.__table__.indexes if i.name == "ix_doctors_specialization_match_score")
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        assert "(rating * 10 + least(experience_years * 2, 20)) DESC" in ddl
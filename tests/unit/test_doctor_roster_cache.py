@@ -0,0 +1,129 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.constants import DoctorStatus
+from src.domain.entities.doctors import DoctorRosterEntity, DoctorWithDetailsEntity
+from src.infrastructure.cache.doctor_roster import DoctorRosterCache
+from src.use_cases.users.use_case import UserUseCase
+
+
+def _doctor(doctor_id: int) -> DoctorWithDetailsEntity:
+    now = datetime(2025, 1, 1, 12, 0)
+    return DoctorWithDetailsEntity(
+        id=doctor_id,
+        bio="Bio",
+        rating=4.5,
+        experience_years=10,
+        license_number=f"LIC-{doctor_id}",
+        status=DoctorStatus.APPROVED,
+        rejection_reason=None,
+        user_id=doctor_id,
+        specialization_id=1,
+        created_at=now,
+        updated_at=now,
+        full_name=f"Doctor {doctor_id}",
+        email=f"doctor{doctor_id}@example.com",
+        phone=None,
+        specialization_name="Cardiology",
+    )
+
+
+class TestDoctorRosterCache:
+    """Tests for DoctorRosterCache without Redis."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cache = DoctorRosterCache(redis=None, max_local_entries=2)
+
+    async def test_get_returns_none_when_empty(self):
+        """Test that a cold cache misses."""
+        assert await self.cache.get(50) is None
+
+    async def test_set_then_get_returns_roster(self):
+        """Test that a stored roster is served from the local cache."""
+        await self.cache.set(50, [_doctor(1)], "section")
+
+        roster = await self.cache.get(50)
+
+        assert roster is not None
+        assert roster.prompt_section == "section"
+        assert [d.id for d in roster.doctors] == [1]
+
+    async def test_invalidate_bumps_version(self):
+        """Test that invalidation hides previously cached rosters."""
+        await self.cache.set(50, [_doctor(1)], "section")
+
+        await self.cache.invalidate()
+
+        assert await self.cache.get(50) is None
+        roster = await self.cache.set(50, [_doctor(2)], "new")
+        assert roster.version == 1
+
+    async def test_local_cache_evicts_least_recently_used(self):
+        """Test that the in-process LRU is bounded."""
+        await self.cache.set(10, [], "")
+        await self.cache.set(20, [], "")
+        await self.cache.get(10)
+        await self.cache.set(30, [], "")
+
+        assert await self.cache.get(20) is None
+        assert await self.cache.get(10) is not None
+
+    async def test_local_entries_expire_after_ttl(self):
+        """Test that local entries are not served past the TTL."""
+        cache = DoctorRosterCache(redis=None, ttl_seconds=0)
+        await cache.set(50, [_doctor(1)], "section")
+
+        assert await cache.get(50) is None
+
+    def test_serialization_round_trip(self):
+        """Test that rosters survive the Redis JSON encoding."""
+        roster = DoctorRosterEntity(doctors=[_doctor(1)], prompt_section="section", version=3)
+
+        restored = DoctorRosterCache._deserialize(DoctorRosterCache._serialize(roster), 3)
+
+        assert restored == roster
+
+
+class _FakeUoW:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeUserRepository:
+    def __init__(self, is_doctor):
+        self.is_doctor = is_doctor
+
+    async def get_user_with_details(self, user_id):
+        return SimpleNamespace(id=user_id, is_doctor=self.is_doctor)
+
+    async def update_user(self, user_id, dto):
+        return SimpleNamespace(id=user_id)
+
+    async def delete_user(self, user_id):
+        return True
+
+
+class TestUserChangesInvalidateRoster:
+    """Tests for roster invalidation from UserUseCase."""
+
+    @pytest.mark.parametrize("is_doctor, expected_version", [(True, 1), (False, 0)])
+    async def test_update_and_delete_invalidate_only_for_doctors(self, is_doctor, expected_version):
+        """Test that editing or deleting a doctor's user drops the cached roster."""
+        for action in ("update", "delete"):
+            cache = DoctorRosterCache(redis=None)
+            use_case = UserUseCase(
+                _FakeUoW(), _FakeUserRepository(is_doctor), None, None, roster_cache=cache
+            )
+
+            if action == "update":
+                await use_case.update_user(1, None)
+            else:
+                await use_case.delete_user(1)
+
+            assert (await cache.set(50, [], "")).version == expected_version
@@ -0,0 +1,166 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.constants import DoctorStatus
+from src.domain.entities.doctors import DoctorEntity
+from src.use_cases.doctors.dto import DoctorMatchWeightsDTO
+from src.use_cases.triage import scoring
+from src.use_cases.triage.scoring import DoctorScoringEngine
+from src.use_cases.triage.use_case import TriageUseCase
+
+NOW = datetime(2030, 1, 7, 9, 0)
+LOADED = datetime(2030, 1, 7, 8, 0, tzinfo=timezone.utc)
+
+
+def _doctor(doctor_id: int, rating: float, experience_years: int, specialization_id: int = 1) -> DoctorEntity:
+    return DoctorEntity(
+        id=doctor_id, bio="", rating=rating, experience_years=experience_years,
+        license_number=str(doctor_id), status=DoctorStatus.APPROVED, rejection_reason=None,
+        user_id=doctor_id, specialization_id=specialization_id, created_at=NOW, updated_at=NOW,
+    )
+
+
+class _FakeDoctorRepository:
+    def __init__(self, full, changed, approved_ids=None):
+        self.full = full
+        self.changed = changed
+        self.approved_ids = approved_ids if approved_ids is not None else {d.id for d in full}
+        self.calls = []
+
+    async def get_doctors_for_scoring(self, updated_since=None):
+        self.calls.append(updated_since)
+        await asyncio.sleep(0)
+        return self.full if updated_since is None else self.changed
+
+    async def get_approved_doctor_ids(self):
+        return self.approved_ids
+
+
+class _FakeTriageUseCase(TriageUseCase):
+    """Serves next availability from a dict instead of the availability engine."""
+
+    def __init__(self, repo, engine, next_available=None):
+        super().__init__(None, None, None, None, repo, None, scoring_engine=engine)
+        self.next_available = next_available or {}
+        self.availability_calls = []
+
+    async def _get_next_available(self, doctor_ids):
+        self.availability_calls.append(list(doctor_ids))
+        return {i: self.next_available[i] for i in doctor_ids if i in self.next_available}
+
+
+class TestDoctorScoringEngine:
+    """Tests for DoctorScoringEngine."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = DoctorScoringEngine(horizon_days=10)
+        self.engine.replace(
+            [_doctor(1, 4.0, 2), _doctor(2, 4.9, 1), _doctor(3, 4.5, 10), _doctor(4, 5.0, 20, 2)],
+            next_available={1: NOW},
+            loaded_at=LOADED,
+        )
+
+    def test_default_weights_match_sql_score(self):
+        """Test that default ranking uses rating * 10 + min(2 * experience, 20)."""
+        ranked = self.engine.rank(1, DoctorMatchWeightsDTO(), k=2, now=NOW)
+
+        assert [(r.doctor_id, r.score, r.rank) for r in ranked] == [(3, 65.0, 1), (2, 51.0, 2)]
+
+    def test_batch_queries_with_weight_vectors(self):
+        """Test that several specializations and weight vectors rank in one call."""
+        ranked = self.engine.rank_many(
+            [(1, DoctorMatchWeightsDTO(availability=5)), (2, DoctorMatchWeightsDTO()), (9, DoctorMatchWeightsDTO())],
+            k=1,
+            now=NOW,
+        )
+
+        assert ranked[0][0].doctor_id == 1
+        assert ranked[0][0].next_available_at == NOW
+        assert ranked[1][0].doctor_id == 4
+        assert ranked[2] == []
+
+    def test_incremental_upsert_and_remove(self):
+        """Test that changes move doctors between specializations and removals keep rows consistent."""
+        self.engine.upsert([replace(_doctor(3, 4.5, 10), specialization_id=2)], {}, loaded_at=LOADED)
+        self.engine.remove([1, 42])
+
+        assert len(self.engine) == 3
+        assert [r.doctor_id for r in self.engine.rank(1, DoctorMatchWeightsDTO(), now=NOW)] == [2]
+        assert [r.doctor_id for r in self.engine.rank(2, DoctorMatchWeightsDTO(), now=NOW)] == [4, 3]
+
+    @pytest.mark.skipif(scoring.np is None, reason="numpy is not installed")
+    def test_vectorized_ranking_matches_loop(self):
+        """Test that NumPy scoring returns the same top-K, ties broken by doctor id, as the loop."""
+        doctors = [_doctor(i, 3.0 + (i % 7) / 4, i % 12, i % 3) for i in range(1, 301)]
+        self.engine.replace(doctors, {i: NOW + timedelta(hours=i) for i in range(1, 301, 4)}, loaded_at=LOADED)
+        self.engine.remove(range(1, 301, 9))
+        queries = [(s, DoctorMatchWeightsDTO(availability=a)) for s in range(3) for a in (0.0, 1.0, 3.0)]
+
+        vectorized = self.engine.rank_many(queries, k=7, now=NOW)
+        scoring.np, numpy = None, scoring.np
+        try:
+            looped = self.engine.rank_many(queries, k=7, now=NOW)
+        finally:
+            scoring.np = numpy
+
+        assert vectorized == looped
+
+
+class TestScoringSnapshotRefresh:
+    """Tests for TriageUseCase.refresh_scoring_snapshot."""
+
+    async def test_first_load_is_full_then_incremental(self):
+        """Test that later refreshes only read changed doctors and drop demoted ones."""
+        demoted = replace(_doctor(2, 4.9, 1), status=DoctorStatus.SUSPENDED)
+        repo = _FakeDoctorRepository([_doctor(1, 4.0, 2), _doctor(2, 4.9, 1)], [demoted], approved_ids={1})
+        engine = DoctorScoringEngine()
+        use_case = _FakeTriageUseCase(repo, engine)
+
+        await use_case.refresh_scoring_snapshot()
+        loaded_at = engine.loaded_at
+        await use_case.refresh_scoring_snapshot()
+
+        assert repo.calls == [None, loaded_at - timedelta(seconds=30)]
+        assert [r.doctor_id for r in engine.rank(1, DoctorMatchWeightsDTO())] == [1]
+
+    async def test_refresh_drops_deleted_doctors_and_recomputes_availability(self):
+        """Test that hard-deleted doctors leave the snapshot and unchanged doctors get fresh slots."""
+        repo = _FakeDoctorRepository([_doctor(1, 4.0, 2), _doctor(2, 4.9, 1)], [], approved_ids={1})
+        engine = DoctorScoringEngine()
+        use_case = _FakeTriageUseCase(repo, engine)
+
+        await use_case.refresh_scoring_snapshot()
+        use_case.next_available = {1: NOW}
+        await use_case.refresh_scoring_snapshot()
+
+        assert engine.doctor_ids == {1}
+        assert use_case.availability_calls[-1] == [1]
+        assert engine.rank(1, DoctorMatchWeightsDTO(), now=NOW)[0].next_available_at == NOW
+
+    async def test_missing_approved_doctor_triggers_full_reload(self):
+        """Test that an approved doctor absent from both snapshot and change feed forces a full load."""
+        repo = _FakeDoctorRepository([_doctor(1, 4.0, 2)], [], approved_ids={1})
+        engine = DoctorScoringEngine()
+        use_case = _FakeTriageUseCase(repo, engine)
+
+        await use_case.refresh_scoring_snapshot()
+        repo.full = [_doctor(1, 4.0, 2), _doctor(3, 4.5, 10)]
+        repo.approved_ids = {1, 3}
+        await use_case.refresh_scoring_snapshot()
+
+        assert repo.calls[-1] is None
+        assert engine.doctor_ids == {1, 3}
+
+    async def test_concurrent_requests_share_one_cold_load(self):
+        """Test that requests racing on an empty snapshot load it once under the refresh lock."""
+        repo = _FakeDoctorRepository([_doctor(1, 4.0, 2)], [])
+        use_case = _FakeTriageUseCase(repo, DoctorScoringEngine())
+
+        results = await asyncio.gather(*(use_case.rank_doctors_for_specializations([1]) for _ in range(5)))
+
+        assert repo.calls == [None]
+        assert all(r[1][0].doctor_id == 1 for r in results)
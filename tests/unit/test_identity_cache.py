@@ -0,0 +1,61 @@
+from src.domain.entities.users import UserEntityWithDetails
+from src.infrastructure.cache.identity import IdentityCache
+
+
+def _user(user_id: int = 1) -> UserEntityWithDetails:
+    return UserEntityWithDetails(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        full_name="User",
+        password_hash="secret-hash",
+        phone=None,
+        is_admin=False,
+        is_doctor=False,
+        doctor_id=None,
+    )
+
+
+class TestIdentityCache:
+    """Tests for IdentityCache without Redis."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cache = IdentityCache(redis=None, ttl_seconds=30, max_local_entries=2)
+
+    async def test_get_is_keyed_by_iat(self):
+        """Test that a cached identity is only served for the same token iat."""
+        await self.cache.set(100, _user())
+
+        assert (await self.cache.get(1, 100)).email == "user1@example.com"
+        assert await self.cache.get(1, 200) is None
+
+    async def test_password_hash_is_not_cached(self):
+        """Test that cached identities never carry the password hash."""
+        await self.cache.set(100, _user())
+
+        assert (await self.cache.get(1, 100)).password_hash == ""
+
+    async def test_invalidate_drops_all_tokens_of_user(self):
+        """Test that invalidation removes every cached token for the user."""
+        await self.cache.set(100, _user())
+        await self.cache.set(200, _user())
+
+        await self.cache.invalidate(1)
+
+        assert await self.cache.get(1, 100) is None
+        assert await self.cache.get(1, 200) is None
+
+    async def test_expired_entries_are_not_served(self):
+        """Test that entries expire after the TTL."""
+        cache = IdentityCache(redis=None, ttl_seconds=0)
+        await cache.set(100, _user())
+
+        assert await cache.get(1, 100) is None
+
+    async def test_size_is_bounded(self):
+        """Test that the oldest entries are evicted beyond max_local_entries."""
+        for user_id in (1, 2, 3):
+            await self.cache.set(100, _user(user_id))
+
+        assert await self.cache.get(1, 100) is None
+        assert await self.cache.get(3, 100) is not None
@@ -0,0 +1,76 @@
+import pytest
+
+from src.domain.constants import JobStatus
+from src.infrastructure.jobs.codec import decode_job, encode_job
+from src.infrastructure.jobs.brokers import InMemoryJobBroker
+from src.infrastructure.jobs.queue import JobQueue, create_job_queue
+from src.infrastructure.jobs.stores import InMemoryJobStore
+
+
+class TestJobQueue:
+    """Tests for JobQueue with the in-memory broker."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.queue = JobQueue(broker=InMemoryJobBroker(), store=InMemoryJobStore())
+
+    async def test_enqueue_stores_queued_job(self):
+        """Test that enqueued jobs are tracked as queued."""
+        job = await self.queue.enqueue("assistant_reply", {"session_id": 1})
+
+        stored = await self.queue.get_job(job.id)
+
+        assert stored.status == JobStatus.QUEUED
+        assert stored.payload == {"session_id": 1}
+
+    async def test_reserve_and_complete(self):
+        """Test the queued -> running -> succeeded lifecycle."""
+        job = await self.queue.enqueue("assistant_reply", {"session_id": 1})
+
+        reserved = await self.queue.reserve(timeout=0.1)
+        assert reserved.id == job.id
+        assert (await self.queue.get_job(job.id)).status == JobStatus.RUNNING
+
+        await self.queue.complete(reserved, {"message_id": 10})
+        done = await self.queue.get_job(job.id)
+        assert done.status == JobStatus.SUCCEEDED
+        assert done.result == {"message_id": 10}
+
+    async def test_fail_records_error(self):
+        """Test that failed jobs keep the error message."""
+        await self.queue.enqueue("assistant_reply", {"session_id": 1})
+        reserved = await self.queue.reserve(timeout=0.1)
+
+        failed = await self.queue.fail(reserved, "boom")
+
+        assert failed.status == JobStatus.FAILED
+        assert failed.error == "boom"
+
+    async def test_reserve_times_out_when_empty(self):
+        """Test that reserve returns None when no job arrives."""
+        assert await self.queue.reserve(timeout=0.01) is None
+
+    async def test_codec_round_trip(self):
+        """Test that jobs survive the broker encoding."""
+        job = await self.queue.enqueue("assistant_reply", {"session_id": 1})
+
+        assert decode_job(encode_job(job)) == job
+
+    async def test_requeue_stale_marks_jobs_queued(self):
+        """Test that jobs handed back by the broker's reaper are tracked as queued again."""
+        job = await self.queue.enqueue("assistant_reply", {"session_id": 1})
+        reserved = await self.queue.reserve(timeout=0.1)
+
+        async def requeue_stale():
+            return [reserved]
+
+        self.queue._broker.requeue_stale = requeue_stale
+        requeued = await self.queue.requeue_stale()
+
+        assert [j.id for j in requeued] == [job.id]
+        assert (await self.queue.get_job(job.id)).status == JobStatus.QUEUED
+
+    def test_create_job_queue_requires_redis_for_redis_broker(self):
+        """Test that the redis broker is rejected without REDIS_URL."""
+        with pytest.raises(ValueError):
+            create_job_queue("redis", redis=None)
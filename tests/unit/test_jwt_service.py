@@ -3,6 +3,7 @@ import time
 import jwt
 import pytest
 
+from src.domain.entities.users import UserEntityWithDetails
 from src.infrastructure.services.jwt_service import JWTService
 
 
@@ -93,3 +94,32 @@ class TestJWTService:
 
         with pytest.raises(jwt.ExpiredSignatureError):
             self.jwt_service.decode_access_token(token)
+
+    def test_identity_claims_round_trip(self):
+        """Test that claims-only tokens carry the identity needed for authorization."""
+        user = UserEntityWithDetails(
+            id=123,
+            email="doctor@example.com",
+            full_name="Doctor",
+            password_hash="hash",
+            phone=None,
+            is_admin=False,
+            is_doctor=True,
+            doctor_id=7,
+        )
+        token = self.jwt_service.encode_access_token(
+            {"sub": "123", **self.jwt_service.identity_claims(user)}
+        )
+
+        restored = JWTService.user_from_claims(self.jwt_service.decode_access_token(token))
+
+        assert restored.id == 123
+        assert restored.is_doctor is True
+        assert restored.doctor_id == 7
+        assert restored.password_hash == ""
+
+    def test_user_from_claims_without_identity_returns_none(self):
+        """Test that plain tokens are not treated as claims-only tokens."""
+        token = self.jwt_service.encode_access_token({"sub": "123"})
+
+        assert JWTService.user_from_claims(self.jwt_service.decode_access_token(token)) is None
@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import httpx
+
+from src.infrastructure.services.openai_service import OpenAIService
+
+
+def _chunk(content=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content is not None else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeCompletions:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.kwargs = None
+
+    async def create(self, **kwargs):
+        self.kwargs = kwargs
+        return _FakeStream(self.chunks)
+
+
+class TestOpenAIServiceStream:
+    """Tests for OpenAIService.chat_stream."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = OpenAIService(api_key="test-key")
+        self.completions = _FakeCompletions([
+            _chunk("Hello"),
+            _chunk(", world"),
+            _chunk(usage=SimpleNamespace(prompt_tokens=42, completion_tokens=3)),
+        ])
+        self.service._client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+    async def test_chat_stream_yields_tokens(self):
+        """Test that chat_stream yields content deltas in order."""
+        tokens = [t async for t in self.service.chat_stream(messages=[])]
+
+        assert tokens == ["Hello", ", world"]
+        assert self.completions.kwargs["stream_options"] == {"include_usage": True}
+
+    async def test_chat_stream_reports_usage(self):
+        """Test that chat_stream fills usage from the final usage-only chunk."""
+        usage = {}
+        async for _ in self.service.chat_stream(messages=[], usage=usage):
+            pass
+
+        assert usage == {"prompt_tokens": 42, "completion_tokens": 3}
+
+
+class TestOpenAIServiceConnectionStats:
+    """Tests for OpenAIService connection reuse metrics."""
+
+    async def test_stats_count_new_and_reused_connections(self):
+        """Test that only requests that opened a TCP connection count as new."""
+        service = OpenAIService(api_key="test-key", max_connections=5, connect_timeout=2.0)
+
+        for _ in range(3):
+            request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+            await service._on_request(request)
+        await request.extensions["trace"]("connection.connect_tcp.complete", {})
+
+        stats = service.get_stats()
+        assert stats["requests"] == 3
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 2
+        assert stats["max_connections"] == 5
+        assert stats["connect_timeout"] == 2.0
+        await service.close()
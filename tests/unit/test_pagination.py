@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.errors import BadRequestException
+from src.infrastructure.utilities.pagination import CREATED_AT_KEYSET, ID_KEYSET
+
+
+@dataclass
+class _Row:
+    id: int
+    created_at: datetime
+
+
+class TestKeyset:
+    """Tests for keyset pagination cursors."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes back to the sort values of the row it was built from."""
+        row = _Row(id=42, created_at=datetime(2030, 1, 7, 9, 30, tzinfo=timezone.utc))
+
+        cursor = CREATED_AT_KEYSET.encode(row)
+
+        assert CREATED_AT_KEYSET.decode(cursor) == (row.created_at, 42)
+        assert "=" not in cursor
+
+    def test_next_cursor_only_for_full_pages(self):
+        """Test that a short page is treated as the last one."""
+        rows = [_Row(id=i, created_at=datetime(2030, 1, i)) for i in (1, 2)]
+
+        assert ID_KEYSET.next_cursor(rows, limit=2) == ID_KEYSET.encode(rows[-1])
+        assert ID_KEYSET.next_cursor(rows, limit=3) is None
+        assert ID_KEYSET.decode(None) is None
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "WzFd", "eyJhIjoxfQ"])
+    def test_rejects_malformed_cursor(self, cursor):
+        """Test that tampered or foreign cursors are a client error."""
+        with pytest.raises(BadRequestException):
+            CREATED_AT_KEYSET.decode(cursor)
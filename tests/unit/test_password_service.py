@@ -55,3 +55,23 @@ class TestPasswordService:
         hashed = self.password_service.encrypt(password)
 
         assert self.password_service.verify("", hashed) is False
+
+    def test_needs_rehash_detects_cost_change(self):
+        """Test that hashes made with another cost factor are flagged for rehash."""
+        old_hash = PasswordService(rounds=4).encrypt("password")
+
+        assert PasswordService(rounds=5).needs_rehash(old_hash) is True
+        assert PasswordService(rounds=4).needs_rehash(old_hash) is False
+
+    async def test_async_encrypt_and_verify(self):
+        """Test that the executor-backed methods match the sync ones."""
+        service = PasswordService(rounds=4, max_workers=2)
+
+        hashed = await service.encrypt_async("password")
+
+        assert await service.verify_async("password", hashed) is True
+        assert await service.verify_async("wrong", hashed) is False
+        stats = service.get_stats()
+        assert stats["completed"] == 3
+        assert stats["in_flight"] == 0
+        service.shutdown()
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.errors import ForbiddenException
+from src.infrastructure.utilities.search import (
+    SENTINEL_START,
+    SENTINEL_STOP,
+    highlight,
+    prefix_tsquery,
+    sentinels_to_html,
+)
+from src.use_cases.search.use_case import SearchUseCase
+
+
+class _FakeSearchRepository:
+    def __init__(self):
+        self.calls = []
+
+    async def search_patients(self, term, doctor_id=None, limit=10):
+        self.calls.append(("patients", doctor_id))
+        return []
+
+    async def search_doctors(self, term, approved_only=True, limit=10):
+        self.calls.append(("doctors", approved_only))
+        return []
+
+    async def search_medical_records(self, term, doctor_id=None, limit=10):
+        self.calls.append(("medical_records", doctor_id))
+        return []
+
+
+def _user(is_admin=False, doctor_id=None):
+    return SimpleNamespace(id=1, is_admin=is_admin, doctor_id=doctor_id)
+
+
+class TestSearchHelpers:
+    """Tests for tsquery building and highlighting."""
+
+    def test_prefix_tsquery_keeps_only_words(self):
+        """Test that operators and punctuation in user input cannot reach to_tsquery."""
+        assert prefix_tsquery("Diab  typ-2") == "diab:* & typ:* & 2:*"
+        assert prefix_tsquery("a & !b:*") == "a:* & b:*"
+        assert prefix_tsquery("!!! ") is None
+
+    def test_highlight_wraps_matches_case_insensitively(self):
+        """Test that every occurrence of a search word is marked, keeping original case."""
+        assert highlight("Anna Annenkova", "ann") == "<mark>Ann</mark>a <mark>Ann</mark>enkova"
+        assert highlight(None, "ann") is None
+
+    def test_highlight_escapes_html_in_text(self):
+        """Test that markup in a stored name comes back escaped, with only the highlight tags live."""
+        result = highlight("<img src=x onerror=alert(1)> Ann", "ann")
+
+        assert result == "&lt;img src=x onerror=alert(1)&gt; <mark>Ann</mark>"
+        assert highlight("<b>", "zzz") == "&lt;b&gt;"
+
+    def test_headline_sentinels_become_tags_after_escaping(self):
+        """Test that ts_headline output is escaped before its markers turn into tags."""
+        headline = f"<script>x</script> {SENTINEL_START}flu{SENTINEL_STOP}"
+
+        assert sentinels_to_html(headline) == "&lt;script&gt;x&lt;/script&gt; <mark>flu</mark>"
+
+
+class TestSearchUseCase:
+    """Tests for SearchUseCase scoping."""
+
+    async def test_doctor_search_is_scoped_to_own_patients_and_records(self):
+        """Test that doctors only search their patients, records and approved doctors."""
+        repo = _FakeSearchRepository()
+
+        await SearchUseCase(repo).search("ann", _user(doctor_id=5))
+
+        assert repo.calls == [("patients", 5), ("doctors", True), ("medical_records", 5)]
+
+    async def test_admin_search_is_unscoped(self):
+        """Test that admins search every patient, doctor and record."""
+        repo = _FakeSearchRepository()
+
+        await SearchUseCase(repo).search("ann", _user(is_admin=True), kinds=["doctors"])
+
+        assert repo.calls == [("doctors", False)]
+
+    async def test_user_without_doctor_profile_is_rejected(self):
+        """Test that a non-admin without a doctor profile cannot search."""
+        with pytest.raises(ForbiddenException):
+            await SearchUseCase(_FakeSearchRepository()).search("ann", _user())
@@ -0,0 +1,130 @@
+from datetime import date, datetime, time
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.constants import DoctorStatus
+from src.domain.entities.schedules import ScheduleEntity
+from src.domain.errors import BadRequestException, ConflictException
+from src.infrastructure.holds.stores import InMemorySlotHoldStore
+from src.use_cases.appointments.use_case import AppointmentUseCase
+from src.use_cases.schedules.availability import AvailabilityEngine
+
+SCHEDULE = ScheduleEntity(
+    id=1,
+    day_of_week=0,
+    start_time=time(9, 0),
+    end_time=time(10, 0),
+    slot_duration_minutes=30,
+    is_active=True,
+    doctor_id=1,
+)
+
+
+class _FakeScheduleRepository:
+    async def get_active_schedules_by_doctor_ids(self, doctor_ids):
+        return [SCHEDULE]
+
+    async def get_schedule_by_doctor_and_day(self, doctor_id, day_of_week):
+        return SCHEDULE if day_of_week == SCHEDULE.day_of_week else None
+
+
+class _FakeAppointmentRepository:
+    async def get_booked_appointments_in_range(self, doctor_ids, start, end):
+        return []
+
+    async def check_slot_availability(self, doctor_id, date_time):
+        return True
+
+
+class _FakeDoctorRepository:
+    def __init__(self, status=DoctorStatus.APPROVED):
+        self.status = status
+
+    async def get_doctor_by_id(self, doctor_id):
+        return SimpleNamespace(id=doctor_id, status=self.status) if doctor_id == 1 else None
+
+
+class TestInMemorySlotHoldStore:
+    """Tests for InMemorySlotHoldStore."""
+
+    SLOT = datetime(2030, 1, 7, 9, 30)
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.store = InMemorySlotHoldStore()
+
+    async def test_acquire_is_exclusive(self):
+        """Test that a second patient cannot take a held slot but the holder can refresh it."""
+        assert await self.store.acquire(1, self.SLOT, patient_id=10, ttl_seconds=60) is not None
+        assert await self.store.acquire(1, self.SLOT, patient_id=11, ttl_seconds=60) is None
+        assert await self.store.acquire(1, self.SLOT, patient_id=10, ttl_seconds=60) is not None
+
+    async def test_release_only_by_holder(self):
+        """Test that only the holder can release a hold."""
+        await self.store.acquire(1, self.SLOT, patient_id=10, ttl_seconds=60)
+
+        assert await self.store.release(1, self.SLOT, patient_id=11) is False
+        assert await self.store.release(1, self.SLOT, patient_id=10) is True
+        assert await self.store.get_holders(1, [self.SLOT]) == {}
+
+    async def test_new_holds_are_capped_per_patient(self):
+        """Test that a patient cannot exceed the hold cap but can still refresh a held slot."""
+        await self.store.acquire(1, self.SLOT, patient_id=10, ttl_seconds=60, max_per_patient=1)
+
+        with pytest.raises(ConflictException):
+            await self.store.acquire(2, self.SLOT, patient_id=10, ttl_seconds=60, max_per_patient=1)
+        assert await self.store.acquire(1, self.SLOT, patient_id=10, ttl_seconds=60, max_per_patient=1)
+
+    async def test_expired_hold_is_free(self):
+        """Test that an expired hold no longer blocks the slot."""
+        await self.store.acquire(1, self.SLOT, patient_id=10, ttl_seconds=0)
+
+        assert await self.store.acquire(1, self.SLOT, patient_id=11, ttl_seconds=60) is not None
+
+    async def test_availability_excludes_held_slots(self):
+        """Test that held slots are reported as unavailable."""
+        await self.store.acquire(1, self.SLOT, patient_id=10, ttl_seconds=60)
+        engine = AvailabilityEngine(_FakeScheduleRepository(), _FakeAppointmentRepository(), self.store)
+
+        result = await engine.get_availability(
+            [1], date(2030, 1, 7), date(2030, 1, 7), now=datetime(2030, 1, 1)
+        )
+
+        assert [s.is_available for s in result[1][0].slots] == [True, False]
+
+
+class TestHoldSlot:
+    """Tests for AppointmentUseCase.hold_slot validation."""
+
+    SLOT = datetime(2030, 1, 7, 9, 30)
+
+    def _use_case(self, status=DoctorStatus.APPROVED):
+        return AppointmentUseCase(
+            uow=None,
+            appointment_repository=_FakeAppointmentRepository(),
+            doctor_repository=_FakeDoctorRepository(status),
+            schedule_repository=_FakeScheduleRepository(),
+            slot_holds=InMemorySlotHoldStore(),
+        )
+
+    async def test_hold_on_slot_grid(self):
+        """Test that an approved doctor's slot start can be held."""
+        hold = await self._use_case().hold_slot(1, self.SLOT, user_id=10)
+
+        assert hold.date_time == self.SLOT
+
+    async def test_unapproved_doctor_cannot_be_held(self):
+        """Test that slots of doctors who are not approved cannot be held."""
+        with pytest.raises(BadRequestException):
+            await self._use_case(DoctorStatus.PENDING).hold_slot(1, self.SLOT, user_id=10)
+
+    @pytest.mark.parametrize("date_time", [
+        datetime(2030, 1, 7, 9, 10),
+        datetime(2030, 1, 7, 10, 0),
+        datetime(2030, 1, 8, 9, 30),
+    ])
+    async def test_time_off_schedule_or_grid_is_rejected(self, date_time):
+        """Test that holds must start a slot inside the doctor's working hours."""
+        with pytest.raises(BadRequestException):
+            await self._use_case().hold_slot(1, date_time, user_id=10)
@@ -0,0 +1,69 @@
+import json
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from src.app.llm_stub import create_stub_app
+from src.infrastructure.services.stub_llm_service import StubLLMService
+
+
+def _doctor(doctor_id, name, specialization):
+    return SimpleNamespace(
+        id=doctor_id,
+        full_name=name,
+        specialization_name=specialization,
+        rating=4.5,
+        experience_years=10,
+        bio=None,
+    )
+
+
+class TestStubLLMService:
+    """Tests for the deterministic LLM stub."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.stub = StubLLMService(first_token_latency_ms=0, tokens_per_second=0)
+        self.doctors = [_doctor(7, "Ann Lee", "Cardiology"), _doctor(9, "Bo Kim", "Cardiology")]
+
+    async def test_first_turn_asks_clarifying_question(self):
+        """Test that the first patient message gets a clarifying question without JSON."""
+        reply = await self.stub.chat([{"role": "user", "content": "chest pain"}], doctors=self.doctors)
+
+        assert reply == StubLLMService.CLARIFYING_REPLY
+
+    async def test_later_turn_recommends_roster_doctors(self):
+        """Test that later turns stream a JSON block built from the roster, with usage."""
+        messages = [
+            {"role": "user", "content": "chest pain"},
+            {"role": "assistant", "content": "How long?"},
+            {"role": "user", "content": "two days"},
+        ]
+        usage = {}
+
+        tokens = [t async for t in self.stub.chat_stream(messages, doctors=self.doctors, usage=usage)]
+
+        block = "".join(tokens).split("```json\n")[1].split("\n```")[0]
+        recommendation = json.loads(block)
+        assert recommendation["specialization"] == "Cardiology"
+        assert recommendation["recommended_doctor_ids"] == [7, 9]
+        assert usage["completion_tokens"] == len(tokens)
+        assert usage["prompt_tokens"] > 0
+
+    def test_http_stand_in_streams_openai_chunks(self):
+        """Test that the HTTP stand-in speaks the chat completions streaming format."""
+        client = TestClient(create_stub_app(self.stub))
+
+        response = client.post("/v1/chat/completions", json={
+            "model": "stub-llm",
+            "messages": [{"role": "user", "content": "headache"}],
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        })
+
+        events = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+        assert events[-1] == "[DONE]"
+        chunks = [json.loads(e) for e in events[:-1]]
+        content = "".join(c["choices"][0]["delta"].get("content", "") for c in chunks if c["choices"])
+        assert content == StubLLMService.CLARIFYING_REPLY
+        assert chunks[-1]["usage"]["completion_tokens"] > 0
@@ -0,0 +1,158 @@
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from src.domain.constants import DoctorStatus, TriageStatus, UrgencyLevel
+from src.domain.entities.doctors import DoctorWithDetailsEntity
+from src.domain.entities.triage_candidates import TriageCandidateEntity
+from src.domain.entities.triage_runs import TriageRunEntity
+from src.domain.errors import NotFoundException
+from src.use_cases.triage.dto import CreateTriageRunDTO
+from src.use_cases.triage.recommendation import extract_recommendation
+from src.use_cases.triage.use_case import TriageUseCase
+
+REPLY = """Based on your symptoms I recommend a dentist.
+
+```json
+{
+    "recommendation": true,
+    "specialization": "Dentistry",
+    "confidence": 0.85,
+    "urgency": "emergency",
+    "reasoning": "Tooth pain",
+    "recommended_doctor_ids": [2, 99, 2, 1]
+}
+```"""
+
+
+def _doctor(doctor_id: int) -> DoctorWithDetailsEntity:
+    now = datetime(2030, 1, 1)
+    return DoctorWithDetailsEntity(
+        id=doctor_id, bio="bio", rating=4.8, experience_years=10, license_number="L",
+        status=DoctorStatus.APPROVED, rejection_reason=None, user_id=doctor_id,
+        specialization_id=7, created_at=now, updated_at=now,
+        full_name=f"Dr. {doctor_id}", email="d@example.com", phone=None,
+        specialization_name="Dentistry",
+    )
+
+
+class _FakeUoW:
+    def __init__(self):
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.commits += 1
+
+
+class _FakeTriageRunRepository:
+    async def create_triage_run(self, dto):
+        return TriageRunEntity(id=1, created_at=datetime(2030, 1, 1), **vars(dto))
+
+
+class _FakeCandidateRepository:
+    async def create_candidates_bulk(self, candidates):
+        return [TriageCandidateEntity(id=i, **vars(c)) for i, c in enumerate(candidates, start=1)]
+
+
+class TestExtractRecommendation:
+    """Tests for extract_recommendation."""
+
+    def test_parses_and_normalizes_block(self):
+        """Test that the block is parsed, emergency maps to high and ids are de-duplicated."""
+        recommendation = extract_recommendation(REPLY)
+
+        assert recommendation.specialization == "Dentistry"
+        assert recommendation.urgency == UrgencyLevel.HIGH
+        assert recommendation.confidence == 0.85
+        assert recommendation.doctor_ids == [2, 99, 1]
+
+    def test_ignores_missing_or_invalid_block(self):
+        """Test that plain replies and malformed blocks yield no recommendation."""
+        assert extract_recommendation("Could you describe the pain?") is None
+        assert extract_recommendation("```json\n{not json}\n```") is None
+        assert extract_recommendation('```json\n{"recommendation": false}\n```') is None
+
+
+class TestRecordRecommendation:
+    """Tests for TriageUseCase.record_recommendation."""
+
+    async def test_records_run_and_roster_candidates_in_one_transaction(self):
+        """Test that only roster doctors become candidates, ranked in the model's order."""
+        uow = _FakeUoW()
+        use_case = TriageUseCase(
+            uow, _FakeTriageRunRepository(), _FakeCandidateRepository(), None, None, None
+        )
+
+        run = await use_case.record_recommendation(
+            session_id=3,
+            recommendation=extract_recommendation(REPLY),
+            doctors=[_doctor(1), _doctor(2)],
+            trigger_message_id=5,
+            token_input=100,
+        )
+
+        assert uow.commits == 1
+        assert run.status == TriageStatus.SUCCESS
+        assert run.recommended_specialization_id == 7
+        assert run.specialization_name == "Dentistry"
+        assert run.trigger_message_id == 5
+        assert run.token_input == 100
+        assert [(c.doctor_id, c.rank) for c in run.candidates] == [(2, 1), (1, 2)]
+        assert run.candidates[0].doctor_name == "Dr. 2"
+
+
+class _FakeDoctorRepository:
+    def __init__(self, doctors):
+        self.doctors = {doctor.id: doctor for doctor in doctors}
+        self.calls = 0
+
+    async def get_doctors_by_ids(self, doctor_ids):
+        self.calls += 1
+        return [self.doctors[i] for i in set(doctor_ids) if i in self.doctors]
+
+
+class _FakeRunLookupRepository:
+    async def get_triage_run_by_id(self, triage_run_id):
+        return await _FakeTriageRunRepository().create_triage_run(
+            CreateTriageRunDTO(session_id=3)
+        )
+
+
+class _FakeSessionRepository:
+    async def get_session_by_id(self, session_id):
+        return None
+
+
+class TestAddCandidates:
+    """Tests for TriageUseCase.add_candidates."""
+
+    async def test_batches_doctor_lookup_and_skips_unapproved(self):
+        """Test that doctors are fetched once and only approved ones are inserted."""
+        pending = replace(_doctor(3), status=DoctorStatus.PENDING)
+        doctor_repo = _FakeDoctorRepository([_doctor(1), _doctor(2), pending])
+        use_case = TriageUseCase(
+            _FakeUoW(), _FakeRunLookupRepository(), _FakeCandidateRepository(),
+            _FakeSessionRepository(), doctor_repo, None,
+        )
+
+        result = await use_case.add_candidates(
+            1, [{"doctor_id": 2, "rank": 1}, {"doctor_id": 3}, {"doctor_id": 1, "rank": 3}],
+            is_admin=True,
+        )
+
+        assert doctor_repo.calls == 1
+        assert [(c.doctor_id, c.rank, c.doctor_name) for c in result] == [(2, 1, "Dr. 2"), (1, 3, "Dr. 1")]
+
+    async def test_unknown_doctor_is_not_found(self):
+        """Test that an unknown doctor id is rejected before anything is inserted."""
+        use_case = TriageUseCase(
+            _FakeUoW(), _FakeRunLookupRepository(), _FakeCandidateRepository(),
+            _FakeSessionRepository(), _FakeDoctorRepository([_doctor(1)]), None,
+        )
+
+        with pytest.raises(NotFoundException):
+            await use_case.add_candidates(1, [{"doctor_id": 1}, {"doctor_id": 42}], is_admin=True)